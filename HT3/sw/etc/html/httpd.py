@@ -19,15 +19,60 @@
 #################################################################
 # Ver:0.1.5  / Datum 25.05.2014
 # Ver:0.2    / 2021-02-17  port-number changed to 48086
+# Ver:0.3    / 2026-10-17  rrdtool-graphs 'HT3_<graph>.png' drawn on demand if configured
+#                           (<draw_on_demand>), optional query: '?range=6h|2d|1w|1m|1y'
 #################################################################
 #
 #----------------------------------------------------
 # Dateiname:  httpd.py
 # Kleiner HTTP-Server, der auf den Port: 48086 verbindet.
 # Die Daten muessen in dem Verzeichnis des Servers sein.
+#  optional parameter: configuration-file (default: ./etc/config/HT3_db_cfg.xml
+#                       relative to directory: HT3/sw)
 #----------------------------------------------------
 #
+import sys
+import os
+import functools
+import urllib.parse
 from http.server import HTTPServer, CGIHTTPRequestHandler
+
+serverpath = os.getcwd()
+swpath = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+configfile = sys.argv[1] if len(sys.argv) > 1 else "./etc/config/HT3_db_cfg.xml"
+
+# the draw-script and the configuration are used relative to directory: HT3/sw
+os.chdir(swpath)
+sys.path.append('lib')
+graphs = None
+try:
+    import db_rrdtool
+    graphs = db_rrdtool.cdb_rrdtool_graphs(configfile)
+except:
+    graphs = None
+
+
+class cgraph_request_handler(CGIHTTPRequestHandler):
+    """
+    request-handler drawing 'HT3_<graph>.png' on demand, other files are handled as before.
+    """
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        filename = os.path.basename(url.path)
+        if graphs != None and filename.startswith("HT3_") and filename.endswith(".png"):
+            timerange = urllib.parse.parse_qs(url.query).get('range', [""])[0]
+            image = graphs.graph(filename[len("HT3_"):-len(".png")], timerange)
+            if image != None:
+                self.send_response(200)
+                self.send_header("Content-Type", "image/png")
+                self.send_header("Content-Length", str(len(image)))
+                self.send_header("Cache-Control", "max-age={0}".format(graphs.cache_seconds()))
+                self.end_headers()
+                self.wfile.write(image)
+                return
+        CGIHTTPRequestHandler.do_GET(self)
+
+
 serveradresse =("", 48086)
-server=HTTPServer(serveradresse, CGIHTTPRequestHandler)
+server=HTTPServer(serveradresse, functools.partial(cgraph_request_handler, directory=serverpath))
 server.serve_forever()
@@ -36,6 +36,10 @@
 #               new item 'T-Soll Hydraulische Weiche' added.
 #               solar_draw_second_field() and handling added.
 #               gain_day_draw and gain_sum_draw added.
+# Ver:0.3.2  / Datum 17.10.2026 serve-mode added (parameter 12: '-serve'):
+#               requests are read from STDIN as lines: '<graph> <start> <end> <imagefile>'
+#               and only the requested graph is drawn, answer is 'OK' or 'ERROR <text>'.
+#               graph := Heizgeraet|Warmwasser|Heizkreis1..4|Solar|Solarertrag|Solar_second
 #################################################################
 
 #
@@ -56,6 +60,7 @@ my $hc4_mixed    =$ARGV[7];
 my $hg_Thydraulsw=$ARGV[8];
 my $solar_available =$ARGV[9];
 my $second_collector=$ARGV[10];
+my $serve_mode   =$ARGV[11];
 
 
 ################################################################
@@ -100,6 +105,20 @@ sub solar_draw_second_field($$$);
 ## p3 = controller_type; 1:=Fxyz, 2:= Cxyz
 ################################################################
 
+sub set_timerange($$);
+## p1 = start_time;
+## p2 = end_time;
+################################################################
+
+sub image_filename($$);
+## p1 = targetpath;
+## p2 = default draw-filename;
+################################################################
+
+sub graph_draw($);
+## p1 = graph-name;
+################################################################
+
 
 if (not defined $mytargetpath) {
   $mytargetpath=$mypath;
@@ -140,6 +159,8 @@ if (not defined $second_collector) {
 # Set Starttime
 my $start_time     = time()-2880*60;
 my $end_time       = time()-60;
+# imagefile used in serve-mode, empty for default draw-filenames
+my $image_file     = "";
 
 if (defined $myanzahlheizkreise) {
 	if ($myanzahlheizkreise<1 or $myanzahlheizkreise>4) {
@@ -150,10 +171,8 @@ if (defined $myanzahlheizkreise) {
 }
 
 ### generate timestring for title
-my ($vonsek, $vonmin, $vonhour, $vonday, $vonmon, $vonyear)=localtime($start_time);
-my ($bissek, $bismin, $bishour, $bisday, $bismon, $bisyear)=localtime($end_time);
-my $timeendstring=sprintf(" - %02d:%02d:%02d %02d.%02d.%04d)",$bishour,$bismin,$bissek,$bisday,$bismon+1,$bisyear+1900);
-my $timestring   =sprintf(" (%02d:%02d:%02d %02d.%02d.",$vonhour,$vonmin,$vonsek,$vonday,$vonmon+1).$timeendstring;
+my $timestring   = "";
+set_timerange($start_time, $end_time);
 
 # Anzeige gross/klein
 my $AnzeigeGross	= 1;
@@ -164,6 +183,34 @@ if ($AnzeigeGross == 1) {
 	$myheight	= 310;
 }
 
+if (defined $serve_mode and $serve_mode eq '-serve') {
+	# draw requested graphs until STDIN is closed
+	$| = 1;
+	while (my $request = <STDIN>) {
+		chomp($request);
+		last if ($request eq 'quit');
+		my ($graph, $start, $end, $file) = split(/ /, $request);
+		if (not defined $file) {
+			print "ERROR request: '$request'\n";
+			next;
+		}
+		set_timerange($start, $end);
+		$image_file = $file;
+		my $error = "";
+		eval {
+			$error = graph_draw($graph);
+		};
+		$error = $@ if ($@);
+		$error =~ s/\n/ /g;
+		if (length($error)) {
+			print "ERROR $error\n";
+		} else {
+			print "OK\n";
+		}
+	}
+	exit 0;
+}
+
 # heater-device draw
 heater_device_draw($mypath, $mytargetpath, $controller_type, $hg_Thydraulsw);
 
@@ -199,6 +246,51 @@ if ($solar_available > 0) {
 }
 
 ################################################################
+################################################################
+sub set_timerange($$)
+{
+	my($start, $end) = @_;
+	$start_time = $start;
+	$end_time   = $end;
+	my ($vonsek, $vonmin, $vonhour, $vonday, $vonmon, $vonyear)=localtime($start_time);
+	my ($bissek, $bismin, $bishour, $bisday, $bismon, $bisyear)=localtime($end_time);
+	my $timeendstring=sprintf(" - %02d:%02d:%02d %02d.%02d.%04d)",$bishour,$bismin,$bissek,$bisday,$bismon+1,$bisyear+1900);
+	$timestring   =sprintf(" (%02d:%02d:%02d %02d.%02d.",$vonhour,$vonmin,$vonsek,$vonday,$vonmon+1).$timeendstring;
+} # set_timerange()
+
+################################################################
+sub image_filename($$)
+{
+	my($targetpath, $draw_filename) = @_;
+	if (length($image_file)) {
+		return $image_file;
+	}
+	return File::Spec->catfile($targetpath, $draw_filename);
+} # image_filename()
+
+################################################################
+sub graph_draw($)
+{
+	my($graph) = @_;
+	if ($graph eq 'Heizgeraet') {
+		heater_device_draw($mypath, $mytargetpath, $controller_type, $hg_Thydraulsw);
+	} elsif ($graph eq 'Warmwasser') {
+		domestic_hotwater_draw($mypath, $mytargetpath, $controller_type);
+	} elsif ($graph =~ /^Heizkreis([1-4])$/ and $1 <= $myanzahlheizkreise) {
+		my @hc_mixed = ($hc1_mixed, $hc2_mixed, $hc3_mixed, $hc4_mixed);
+		heater_cricuit_draw($mypath, $mytargetpath, $controller_type, $1, $hc_mixed[$1 - 1]);
+	} elsif ($graph eq 'Solar' and $solar_available > 0) {
+		solar_draw($mypath, $mytargetpath, $controller_type);
+	} elsif ($graph eq 'Solarertrag' and $solar_available > 0) {
+		solar_yield_draw($mypath, $mytargetpath, $controller_type);
+	} elsif ($graph eq 'Solar_second' and $solar_available > 0 and $second_collector > 0) {
+		solar_draw_second_field($mypath, $mytargetpath, $controller_type);
+	} else {
+		return "graph '$graph' not available";
+	}
+	return "";
+} # graph_draw()
+
 ################################################################
 sub heater_device_draw($$$$)
 {
@@ -206,7 +298,7 @@ sub heater_device_draw($$$$)
 	my $rrdtool_filename = "/HT3/sw/var/databases/HT3_db_rrd_heizgeraet.rrd";
 	my $DB               = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $rrdh             = RRDTool::OO->new(file => $DB);
-	my $Image            = File::Spec->catfile($targetpath, "/HT3/sw/etc/html/HT3_Heizgeraet.png");
+	my $Image            = image_filename($targetpath, "/HT3/sw/etc/html/HT3_Heizgeraet.png");
 
 	my $ThydraulicSwitch_str = "";
 	my $hydraulicSwitch_legendstr = "T-Soll (Hydraulische Weiche)";
@@ -446,7 +538,7 @@ sub domestic_hotwater_draw($$$)
 	my $rrdtool_filename = "/HT3/sw/var/databases/HT3_db_rrd_warmwasser.rrd";
 	my $DB               = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $rrdh             = RRDTool::OO->new(file => $DB);
-	my $Image            = File::Spec->catfile($targetpath, "/HT3/sw/etc/html/HT3_Warmwasser.png");
+	my $Image            = image_filename($targetpath, "/HT3/sw/etc/html/HT3_Warmwasser.png");
 
 	$rrdh->option_add("graph", "right_axis");
 	$rrdh->option_add("graph", "right_axis_label");
@@ -567,7 +659,7 @@ sub solar_draw($$$)
 	my $rrdtool_filename = "/HT3/sw/var/databases/HT3_db_rrd_solar.rrd";
 	my $DB               = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $rrdh             = RRDTool::OO->new(file => $DB);
-	my $Image            = File::Spec->catfile($targetpath, "/HT3/sw/etc/html/HT3_Solar.png");
+	my $Image            = image_filename($targetpath, "/HT3/sw/etc/html/HT3_Solar.png");
 
 	$rrdh->option_add("graph", "right_axis");
 	$rrdh->option_add("graph", "right_axis_label");
@@ -697,7 +789,7 @@ sub solar_yield_draw($$$)
 	my $rrdtool_filename = "/HT3/sw/var/databases/HT3_db_rrd_solar.rrd";
 	my $DB               = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $rrdh             = RRDTool::OO->new(file => $DB);
-	my $Image            = File::Spec->catfile($targetpath, "/HT3/sw/etc/html/HT3_Solarertrag.png");
+	my $Image            = image_filename($targetpath, "/HT3/sw/etc/html/HT3_Solarertrag.png");
 
 	$rrdh->option_add("graph", "right_axis");
 	$rrdh->option_add("graph", "right_axis_label");
@@ -807,7 +899,7 @@ sub heater_cricuit_draw($$$$$)
 	my $draw_filename    = "/HT3/sw/etc/html/HT3_Heizkreis".$hc_nr.".png";
 	my $DB_heizkreis     = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $heizkreis_rrdh   = RRDTool::OO->new(file => $DB_heizkreis);
-	my $ImageHK = File::Spec->catfile($targetpath, $draw_filename);
+	my $ImageHK = image_filename($targetpath, $draw_filename);
 
 	my $draw_titel       = "Heizkreis:".$hc_nr." (ohne Mischer)";
     if ($hc_mixed > 0)
@@ -1058,7 +1150,7 @@ sub solar_draw_second_field($$$)
 	my $rrdtool_filename = "/HT3/sw/var/databases/HT3_db_rrd_solar.rrd";
 	my $DB               = File::Spec->catfile($sourcepath, $rrdtool_filename);
 	my $rrdh             = RRDTool::OO->new(file => $DB);
-	my $Image            = File::Spec->catfile($targetpath, "/HT3/sw/etc/html/HT3_Solar_second.png");
+	my $Image            = image_filename($targetpath, "/HT3/sw/etc/html/HT3_Solar_second.png");
 
 	$rrdh->option_add("graph", "right_axis");
 	$rrdh->option_add("graph", "right_axis_label");
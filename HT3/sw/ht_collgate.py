@@ -18,19 +18,24 @@
 #
 #################################################################
 # Ver:0.1    / Datum 11.06.2017 first release
+# Ver:0.2    / Datum 17.10.2026 decoder-statistics dumped on signal SIGUSR1
 #################################################################
 
 import sys
+import signal
 sys.path.append('lib')
 import Ccollgate
 
 __author__  = "junky-zs"
 __status__  = "draft"
-__version__ = "0.1"
-__date__    = "11.06.2017"
+__version__ = "0.2"
+__date__    = "17.10.2026"
 
 
 cfg_pathfilename = './etc/config/collgate_cfg.xml'
 
 collgate = Ccollgate.ccollgate(cfg_pathfilename)
+# dump decoder-statistics with: kill -USR1 <pid>
+if hasattr(signal, 'SIGUSR1'):
+    signal.signal(signal.SIGUSR1, collgate.dump_statistics)
 collgate.start()
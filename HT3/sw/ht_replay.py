@@ -0,0 +1,63 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 Norbert S. <junky-zs@gmx.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / Datum 17.10.2026 first release
+#################################################################
+
+import sys, time
+import argparse
+sys.path.append('lib')
+import ht_binlog_replay
+
+__author__  = "junky-zs"
+__status__  = "draft"
+__version__ = "0.1"
+__date__    = "17.10.2026"
+
+parser = argparse.ArgumentParser(prog='ht_replay.py',
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 description='''----------------------------------------------------------
+Offline replay of binary bus-logfiles written from ht_binlogclient.py
+----------------------------------------------------------
+ example: ht_replay.py -sqlite ./var/databases/history.db ./var/log/ht_binlog.log
+  -> decoded messages are written to sqlite-db: history.db''')
+parser.add_argument('binlogfile', type = str,
+                    help = 'binary bus-logfile')
+parser.add_argument('-cfg', '--config', default = './etc/config/HT3_db_cfg.xml', type = str,
+                    help = 'configuration-file; default = ./etc/config/HT3_db_cfg.xml')
+parser.add_argument('-sqlite', '--sqlite', default = None, type = str,
+                    help = 'write records to sqlite-db (created if not available)')
+parser.add_argument('-csv', '--csv', default = None, type = str,
+                    help = 'write records to csv-files (one per nickname) into this path')
+parser.add_argument('-start', '--starttime', default = None, type = int,
+                    help = 'UTC used until the first bus date/time-message; default = time of that message')
+arguments = vars(parser.parse_args())
+
+replay = ht_binlog_replay.cht_replay(arguments['config'])
+starttime = time.time()
+if arguments['sqlite'] != None:
+    count = replay.replay_2_sqlite(arguments['binlogfile'], arguments['sqlite'], starttime=arguments['starttime'])
+elif arguments['csv'] != None:
+    count = replay.replay_2_csv(arguments['binlogfile'], arguments['csv'], starttime=arguments['starttime'])
+else:
+    count = 0
+    for (timestamp, nickname, values) in replay.records(arguments['binlogfile'], arguments['starttime']):
+        print("{0};{1};{2}".format(timestamp, nickname, values))
+        count += 1
+print("   -- {0} records decoded in {1:.1f} seconds --".format(count, time.time() - starttime))
@@ -22,6 +22,18 @@
 #                               __Autocreate_draw() removed, db_rrdtool.create_draw() replacement
 # Ver:0.3    / Datum 03.12.2019 Issue:'Deprecated property InterCharTimeout #7'
 #                                port.setInterCharTimeout() removed
+# Ver:0.3.1  / Datum 17.10.2026 decoder-statistics: periodic publishing with queue to mqtt
+#                                (<decoder_statistics><publish_interval>) and
+#                                'dump_statistics()' for signal-handling added.
+#                               mqtt-client and SPS-interface are using the change-set of heater-data.
+#                               'cdedup_filter' added, repeated messages without value-changes
+#                                are dropped before the queues (<decoder_dedup><max_silence>).
+#                               'cdedup_filter' compares raw-bytes hash for each (source, msgid, offset).
+#                               cstore2db: sqlite-rows are written batched.
+#                               cstore2db: autoerasing and '__GetOldestEntry()' replaced with thread 'cdb_sqlite_retention'.
+#                               cstore2db: rrdtool-updates of all systemparts with 'step_update()'.
+#                               cstore2db: draw-parameters saved for drawing on demand (<draw_on_demand>).
+#                               cstore2db: rrdtool-steps and draws are done also without new queue-data.
 #################################################################
 
 import sys
@@ -42,8 +54,8 @@ import ht_const
 
 __author__  = "junky-zs"
 __status__  = "draft"
-__version__ = "0.3"
-__date__    = "03.12.2019"
+__version__ = "0.3.1"
+__date__    = "17.10.2026"
 
 """
 #################################################################
@@ -78,6 +90,11 @@ __date__    = "03.12.2019"
 #  After receiving the command / payload is parsed and the      #
 #  result is send as heater-commands to the connected port.     #
 #                                                               #
+# class: cdedup_filter()                                        #
+#  This class is used to drop repeated messages without any     #
+#  value-change, the values are forwarded at least after the    #
+#  'max_silence' - time.                                        #
+#                                                               #
 # class: cht_if_worker()                                        #
 #  This class connects to the configured port (SOCKET or ASYNC) #
 #  and receives heater RAW-data from that port.                 #
@@ -393,6 +410,40 @@ class cht_if_tx_data(threading.Thread):
 #--- class cht_if_tx_data end ---#
 ################################################
 
+class cdedup_filter(object):
+    """class 'cdedup_filter' is used to drop decoded messages with the same
+        raw-bytes as forwarded before for that message-key (source, msgid, offset).
+        The messages are forwarded at least every 'max_silence' seconds.
+    """
+    def __init__(self, max_silence):
+        self.__max_silence = max_silence
+        # {message-key:(raw-bytes hash, forward-time)}
+        self.__forwarded = {}
+        self.__dropped = 0
+
+    def IsRepeat(self, key, digest, now=None):
+        """returns True if the message with raw-bytes hash 'digest' is already
+            forwarded for that message-key and the 'max_silence' - time isn't
+            elapsed, else False.
+            The digest is saved as forwarded on return: False.
+        """
+        if now == None:
+            now = time.time()
+        forwarded = self.__forwarded.get(key)
+        if forwarded != None:
+            (forwarded_digest, forward_time) = forwarded
+            if forwarded_digest == digest and now - forward_time < self.__max_silence:
+                self.__dropped += 1
+                return True
+        self.__forwarded[key] = (digest, now)
+        return False
+
+    def dropped(self):
+        """returns the number of dropped messages."""
+        return self.__dropped
+#--- class cdedup_filter end ---#
+################################################
+
 class cht_if_worker(threading.Thread):
     """class 'cht_if_worker' is used to start the dispathing and decoding of
         ht_rawdata.
@@ -401,7 +452,9 @@ class cht_if_worker(threading.Thread):
     def __init__(self, configurationfilename,
                  putdata_flag=True,
                  logging=None,
-                 loglevel_in=logging.INFO):
+                 loglevel_in=logging.INFO,
+                 statistics_interval=0,
+                 dedup_max_silence=0):
         threading.Thread.__init__(self)
         # setup data-struct
         self._data = data.cdata()
@@ -419,6 +472,12 @@ class cht_if_worker(threading.Thread):
         self.__decoded_data_4_DBs = queue.Queue()
         self.__data_2_send_queue = queue.Queue()
         self.__putdata_flag = putdata_flag
+        # interval in seconds for publishing decoder-statistics, 0 := disabled
+        self.__statistics_interval = int(statistics_interval)
+        # filter for repeated messages, max_silence in seconds, 0 := disabled
+        self.__dedup = None
+        if int(dedup_max_silence) > 0:
+            self.__dedup = cdedup_filter(int(dedup_max_silence))
 
         # create logging-file if not already done
         if self._logging == None:
@@ -570,6 +629,7 @@ class cht_if_worker(threading.Thread):
             self.__port.close()
             raise
 
+        next_statistics_time = time.time() + self.__statistics_interval
         try:
             while self.__thread_run:
                 # blocking call to discoder() returns nickname/value-tuple
@@ -580,12 +640,20 @@ class cht_if_worker(threading.Thread):
                     self._logging.critical(errorstr)
                     break
                 #send data only if waittime is elapsed (valid data) and value is not 'None'
-                if self.WaitTimeElapsed() and value != None:
+                #  repeated messages without value-changes are dropped
+                if self.WaitTimeElapsed() and value != None and \
+                        (self.__dedup == None or not self.__dedup.IsRepeat(*decoded_data.last_message())):
                     # put data to message-queue for Database-saving
                     self.decoded_data_4_DBs().put((nickname, value))
                     # put data to message-queue for further processing in other threads
                     if self.__putdata_flag:
                         self.decoded_data_queue().put((nickname, value))
+                # put decoder-statistics to message-queue after 'statistics_interval'
+                if self.__putdata_flag and self.__statistics_interval > 0:
+                    if time.time() >= next_statistics_time:
+                        next_statistics_time = time.time() + self.__statistics_interval
+                        statistics = decoded_data.statistics()
+                        self.decoded_data_queue().put((statistics.NICKNAME, statistics.summary_values()))
 
         except:
             errorstr="cht_if_worker();Error; 'discoder()' thread terminated"
@@ -594,6 +662,8 @@ class cht_if_worker(threading.Thread):
             self.__port.close()
             raise
 
+        if self.__dedup != None:
+            self._logging.info("cht_if_worker();  dropped repeated messages:{0}".format(self.__dedup.dropped()))
         self._logging.info("cht_if_worker(); End ----------------------")
 
     def stop(self):
@@ -618,6 +688,8 @@ class ccollgate_cfg():
         self._logger = logger
         self.__configfilename = ""
         self.__interfaces_cfg = {}
+        self.__statistics_interval = 0
+        self.__dedup_max_silence = 0
 
     def read_collgate_config(self, xmlcfgpathname="./etc/config/collgate_cfg.xml", logger=None):
         """ Method 'read_collgate_config()' reads the collgate config-parameter from xml-file
@@ -668,6 +740,22 @@ class ccollgate_cfg():
             print(errorstr)
             raise
 
+        # optional parameter for decoder-statistics
+        self.__statistics_interval = 0
+        try:
+            for statistics_part in self.__root.findall('decoder_statistics'):
+                self.__statistics_interval = int(statistics_part.find('publish_interval').text)
+        except:
+            self.__statistics_interval = 0
+
+        # optional parameter for dropping repeated messages
+        self.__dedup_max_silence = 0
+        try:
+            for dedup_part in self.__root.findall('decoder_dedup'):
+                self.__dedup_max_silence = int(dedup_part.find('max_silence').text)
+        except:
+            self.__dedup_max_silence = 0
+
     def get_config(self):
         """This method returns the current configuration for interfaces.
             return-value structure is like:
@@ -685,6 +773,14 @@ class ccollgate_cfg():
         (enable_flag, file) = self.__interfaces_cfg[interface_name]
         return file
 
+    def get_statistics_interval(self):
+        """returns the interval in seconds for publishing decoder-statistics, 0 := disabled."""
+        return self.__statistics_interval
+
+    def get_dedup_max_silence(self):
+        """returns the max. time in seconds for dropping repeated messages, 0 := disabled."""
+        return self.__dedup_max_silence
+
     def logger_handle(self, set_logger_handle=None):
         """returns/sets the logger-handle """
         if set_logger_handle != None:
@@ -704,65 +800,10 @@ class cstore2db(threading.Thread):
         self._cfg_file = cfg_file
         self._logging = logging
         self.__thread_run = True
-        self.__autoerasechecktime = int(time.time()) + 120
 
     def __del__(self):
         """class desctructor """
 
-    def __Autoerasing_sqlitedb(self, h_database):
-        """check sqlite database for the oldest entries and delete them if time_limit is reached."""
-        if int(time.time()) >= int(self.__autoerasechecktime):
-            time_limit = int(time.time()) - int(self._ht_if._data.Sqlite_autoerase_seconds())
-            # get oldest UTC in database
-            firstentry_UTC = self.__GetOldestEntry(h_database)
-            if firstentry_UTC == None:
-                firstentry_UTC = int(time.time())
-
-            if firstentry_UTC < time_limit:
-                debugstr = "Autoerasing_sqlitedb(); UTCs current:{0}; oldest in db:{1}; limit:{2}".format(int(time.time()), firstentry_UTC, time_limit)
-                self._logging.info(debugstr)
-
-                try:
-                    debugstr = "sqlite-db autoerasing started;  time:{0}".format(int(time.time()))
-                    self._logging.info(debugstr)
-                    # erase old datacontend in sqlite-db
-                    for systempartname in self._ht_if._data.syspartnames():
-                        h_database.delete(systempartname, "UTC", str(time_limit), "<")
-                        debugstr = "table-content:<{0}> deleted where UTC is less then:<{1}>".format(systempartname, time_limit)
-                        self._logging.info(debugstr)
-                    # cleanup db
-                    h_database.vacuum()
-                    debugstr = "sqlite-db autoerasing finished; time:{0}".format(int(time.time()))
-                    self._logging.info(debugstr)
-                except (sqlite3.OperationalError, ValueError) as e:
-                    errorstr = "cstore2db.__Autoerasing_sqlitedb();Error; {0}".format(e)
-                    self._logging.critical(errorstr)
-
-            # setup next check-time
-            self.__autoerasechecktime = int(time.time()) + 120
-
-    def __GetOldestEntry(self, h_database):
-        """try to find the first timestamp-entry in column 'UTC' and table
-            'heizgeraet' and return the value. If not found then return 'None'
-             search - excample:
-              SELECT UTC FROM heizgeraet WHERE UTC NOT NULL ORDER UTC ASC
-        """
-        sqlsearchstring = "NOT NULL"
-        sqlorderbystring = "ORDER BY UTC ASC"
-        rtnvalue = None
-        try:
-            selectrtn = h_database.selectwhere('heizgeraet', 'UTC', sqlorderbystring, sqlsearchstring, 'UTC')
-            if not selectrtn == []:
-                for valuetmp in list(selectrtn):
-                    # get first UTC-timestamp
-                    rtnvalue = int(valuetmp[0:1][0])
-                    break
-        except (sqlite3.OperationalError, ValueError) as e:
-            errorstr = "cstore2db.__GetOldestEntry();Error; {0}".format(e)
-            self._logging.critical(errorstr)
-            rtnvalue = None
-        return rtnvalue
-
     def run(self):
         """worker thread for sqlite-db using 'threading.Thread'"""
         import sqlite3
@@ -772,20 +813,25 @@ class cstore2db(threading.Thread):
         rrdtooldb = None
         nextTimeStep = time.time()
         nextTimeautocreate = time.time()
-        sqlite_autoerase = False
+        retention = None
 
         # get db-instance
         database = db_sqlite.cdb_sqlite(self._cfg_file, logger=self._logging)
         database.connect()
 
-        # set flag for erasing sqlite-db if enabled
+        # start thread for erasing sqlite-db if enabled
         if database.is_sql_db_enabled() and self._ht_if.ht_if_data().Sqlite_autoerase_seconds() > 0:
-            sqlite_autoerase = True
+            retention = db_sqlite.cdb_sqlite_retention(self._cfg_file,
+                                                       self._ht_if.ht_if_data().syspartnames(),
+                                                       self._ht_if.ht_if_data().Sqlite_autoerase_seconds(),
+                                                       logger=self._logging)
+            retention.start()
 
         if self._ht_if.ht_if_data().is_db_rrdtool_enabled():
             try:
                 rrdtooldb = db_rrdtool.cdb_rrdtool(self._cfg_file, self._logging)
                 rrdtooldb.createdb_rrdtool()
+                rrdtooldb.step_layout(self._ht_if.ht_if_data())
                 # setup the first 'nextTimeStep' to 3 times stepseconds waiting for valid data
                 nextTimeStep = time.time() + int(self._ht_if.ht_if_data().db_rrdtool_stepseconds()) * 3
             except:
@@ -800,30 +846,31 @@ class cstore2db(threading.Thread):
         while self.__thread_run:
             try:
                 # read values from queue, wait if empty or stop if (None, None)
-                (nickname, value) = self._ht_if.decoded_data_4_DBs().get()
+                #  batched sqlite-rows are written after 'batch_seconds' without new data
+                #  rrdtool-steps and draws are done also without new data (dropped repeats)
+                try:
+                    (nickname, value) = self._ht_if.decoded_data_4_DBs().get(timeout=max(1, database.batch_seconds()))
+                    received = True
+                except queue.Empty:
+                    database.flush()
+                    received = False
                 # terminate thread if both values are None, else process them
-                if (nickname, value) == (None, None):
+                if received and (nickname, value) == (None, None):
                     self.stop()
                     break
 
-                if database.is_sql_db_enabled():
-                    database.insert(str(self._ht_if.ht_if_data().getlongname(nickname)), value)
-                    database.commit()
+                if received and database.is_sql_db_enabled():
+                    database.insert_batched(str(self._ht_if.ht_if_data().getlongname(nickname)), value)
 
                 if self._ht_if.ht_if_data().is_db_rrdtool_enabled() and rrdtooldb != None:
                     # write data to rrdtool-db after 'stepseconds' seconds
                     if time.time() >= nextTimeStep:
                         # setup next timestep
                         nextTimeStep = time.time() + int(self._ht_if.ht_if_data().db_rrdtool_stepseconds())
-                        # update rrdtool database
-                        for syspartshortname in rrdtooldb.syspartnames():
-                            if syspartshortname.upper() == 'DT':
-                                continue
-                            syspartname = rrdtooldb.syspartnames()[syspartshortname]
-                            itemvalue_array = self._ht_if.ht_if_data().getall_sorted_items_with_values(syspartshortname)
-                            error = rrdtooldb.update(syspartname, itemvalue_array, time.time())
-                            if error:
-                                self._logging.critical("rrdtooldb.update();Error;syspartname:{0}".format(syspartname))
+                        # update rrdtool database, all systemparts with one call
+                        error = rrdtooldb.step_update(self._ht_if.ht_if_data(), time.time())
+                        if error:
+                            self._logging.critical("rrdtooldb.step_update();Error")
 
                 if self._ht_if.ht_if_data().is_db_rrdtool_enabled() and self._ht_if.ht_if_data().IsAutocreate_draw() > 0:
                     if time.time() >= nextTimeautocreate:
@@ -832,22 +879,31 @@ class cstore2db(threading.Thread):
                         # create draw calling script
                         (db_path, dbfilename) = self._ht_if.ht_if_data().db_rrdtool_filepathname()
                         (html_path, filename) = self._ht_if.ht_if_data().db_rrdtool_filepathname('.')
-                        rrdtooldb.create_draw(db_path, html_path,
-                                              self._ht_if.ht_if_data().heatercircuits_amount(),
-                                              self._ht_if.ht_if_data().controller_type_nr(),
-                                              self._ht_if.ht_if_data().GetAllMixerFlags())
-
-                if sqlite_autoerase:
-                    self.__Autoerasing_sqlitedb(database)
+                        if rrdtooldb.is_draw_on_demand():
+                            # draws are created from web-server, save only the parameters
+                            rrdtooldb.save_draw_parameters(db_path, html_path,
+                                                           self._ht_if.ht_if_data().heatercircuits_amount(),
+                                                           self._ht_if.ht_if_data().controller_type_nr(),
+                                                           self._ht_if.ht_if_data().GetAllMixerFlags())
+                        else:
+                            rrdtooldb.create_draw(db_path, html_path,
+                                                  self._ht_if.ht_if_data().heatercircuits_amount(),
+                                                  self._ht_if.ht_if_data().controller_type_nr(),
+                                                  self._ht_if.ht_if_data().GetAllMixerFlags())
 
                 # clear last queue-entry with task_done()
-                self._ht_if.decoded_data_4_DBs().task_done()
+                if received:
+                    self._ht_if.decoded_data_4_DBs().task_done()
             except:
                 errorstr = "cstore2db.run();Error; on ht_if.decoded_data_4_DBs().get()"
                 self._logging.critical(errorstr)
                 self.stop()
                 raise
         #close db at the end of thread
+        if retention != None:
+            retention.stop()
+        if rrdtooldb != None:
+            rrdtooldb.close()
         database.close()
         errorstr = "cstore2db.run();Error; thread terminated unexpected"
         self._logging.critical(errorstr)
@@ -936,10 +992,16 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                 self._ht_if = cht_if_worker(ht_cfg_filename,
                                   putdata_flag=data_flag,
                                   logging=self._logger,
-                                  loglevel_in=self.__loglevel_in)
+                                  loglevel_in=self.__loglevel_in,
+                                  statistics_interval=self.get_statistics_interval(),
+                                  dedup_max_silence=self.get_dedup_max_silence())
                 self._ht_if.setDaemon(True)
                 self._ht_if.start()
                 accessnames = self._ht_if.get_accessnames()
+                # decoder-statistics are published with their own topic-names
+                if self.get_statistics_interval() > 0:
+                    accessnames.update({ht_discode.cdecode_statistics.NICKNAME:
+                                        list(ht_discode.cdecode_statistics.SUMMARY_NAMES)})
             except:
                 errorstr = "ccollgate().run();Error;could not start 'ht-interface' with file:'{0}'".format(ht_cfg_filename)
                 self._logger.critical(errorstr)
@@ -966,6 +1028,8 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                     dataqueues = (self._ht_if.decoded_data_queue(), self._ht_if.data_2_send_queue())
                     self._mqtt_pub_client = mqtt_client_if.cmqtt_client(cfg_file, accessnames_in=accessnames)
                     self._mqtt_pub_client.set_dataqueues(dataqueues_rx_tx=dataqueues)
+                    self._mqtt_pub_client.set_changeset_source(self._ht_if.ht_if_data().changes_since,
+                                                               self._ht_if.get_accessnames().keys())
                     self._mqtt_pub_client.setDaemon(True)
                     self._mqtt_pub_client.start()
                 except:
@@ -981,6 +1045,7 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                     import SPS_if
                     cfg_file = self.get_cfg_file(ccollgate_cfg.IF_sps)
                     self._sps_if = SPS_if.cSPS_if(cfg_file, heater_data_obj=self._ht_if.ht_if_data())
+                    self._sps_if.set_changeset_source(self._ht_if.ht_if_data().changes_since)
                     self._sps_if.setDaemon(True)
                     self._sps_if.start()
                 except:
@@ -1021,6 +1086,20 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
             print(errorstr)
             raise SystemExit
 
+    def dump_statistics(self, signum=None, frame=None):
+        """writes the current decoder-statistics to logfile and stdout.
+            can be used as signal-handler (e.g.: SIGUSR1).
+        """
+        statistics = None
+        if self._ht_if != None:
+            statistics = self._ht_if.ht_if_data().decode_statistics()
+        if statistics != None:
+            infostr = "ccollgate().dump_statistics();decoder-statistics:\n" + statistics.dump()
+        else:
+            infostr = "ccollgate().dump_statistics();no decoder running"
+        self._logger.info(infostr)
+        print(infostr)
+
     def stop(self):
         """ """
         self.__thread_run = False
@@ -20,6 +20,11 @@
 # Ver:0.1.8  / Datum 05.10.2015 first release
 # Ver:0.2.x  / Datum xx.yy.2017 renaming modul and test-releases
 # Ver:0.3    / Datum 19.06.2017 fixed errors
+# Ver:0.3.1  / Datum 17.10.2026 special commands for decoder-statistics added:
+#                                S02 := summary, S03 := messageID-counts and
+#                                the summary-names (e.g.: 'decoder_frames').
+# Ver:0.3.2  / Datum 17.10.2026 set_changeset_source() added, requested values
+#                                are read from the applied change-sets.
 #################################################################
 
 import sys
@@ -37,8 +42,8 @@ import xml.etree.ElementTree as ET
 
 __author__  = "junky-zs"
 __status__  = "draft"
-__version__ = "0.3"
-__date__    = "19.06.2017"
+__version__ = "0.3.1"
+__date__    = "17.10.2026"
 
 
 class cSPS_cfg():
@@ -125,6 +130,13 @@ class cSPS_if(threading.Thread, cSPS_cfg):
         cSPS_cfg.__init__(self, cfgtype = configtype)
 
         self.__heater_data = heater_data_obj
+        # change-set source (see: 'data.cdata.changes_since()')
+        self.__changes_since = None
+        self.__changeset_sequence = 0
+        # {(nickname, itemname):value} applied from change-sets
+        self.__changeset_values = {}
+        # {nickname:[itemname, ...]} index-order of 'changes_since()'
+        self.__changeset_itemnames = {}
         # read SPS - configuration
         self.read_SPS_config(cfgfilename)
 
@@ -243,6 +255,25 @@ class cSPS_if(threading.Thread, cSPS_cfg):
         # save to indexed array for dump-purposes
         self.__SPS_accessname_cmd_indexed.append((SPS_cmd, speciname, "os_sys"))
 
+        command_index += 1
+        SPS_cmd = "{0}{1:02}".format(cmd_letter, command_index)
+        # save to map-directory for parsing
+        self.__SPS_accessname_cmd_map.update( {bytes(SPS_cmd, 'utf-8'): (speciname, "decode_stats")} )
+        # save to indexed array for dump-purposes
+        self.__SPS_accessname_cmd_indexed.append((SPS_cmd, speciname, "decode_stats"))
+
+        command_index += 1
+        SPS_cmd = "{0}{1:02}".format(cmd_letter, command_index)
+        # save to map-directory for parsing
+        self.__SPS_accessname_cmd_map.update( {bytes(SPS_cmd, 'utf-8'): (speciname, "decode_stats_msgid")} )
+        # save to indexed array for dump-purposes
+        self.__SPS_accessname_cmd_indexed.append((SPS_cmd, speciname, "decode_stats_msgid"))
+
+        # single summary-values of decoder-statistics are requested by name
+        for summary_name in ht_discode.cdecode_statistics.SUMMARY_NAMES:
+            self.__SPS_accessname_cmd_map.update( {bytes(summary_name, 'utf-8'): (speciname, summary_name)} )
+            self.__SPS_accessname_cmd_indexed.append((summary_name, speciname, summary_name))
+
         command_index = 9   # index fixed to '9' for mapping-dump
         SPS_cmd = "{0}{1:02}".format(cmd_letter, command_index)
         # save to map-directory for parsing
@@ -273,6 +304,44 @@ class cSPS_if(threading.Thread, cSPS_cfg):
         return rtn
             
 
+    def set_changeset_source(self, changes_since_fkt):
+        """ sets the change-set source (see: 'data.cdata.changes_since()').
+            The requested values are read from the applied change-sets
+            instead of the value-snapshots.
+        """
+        self.__changes_since = changes_since_fkt
+
+    def __changeset_value(self, nickname, itemname):
+        """ returns the value of 'nickname' and 'itemname' after applying
+            all values changed since the last call.
+        """
+        (self.__changeset_sequence, changes) = self.__changes_since(self.__changeset_sequence)
+        for (changed_nickname, index, value) in changes:
+            itemnames = self.__changeset_itemnames.get(changed_nickname)
+            if itemnames == None or index >= len(itemnames):
+                itemnames = self.__heater_data.getall_sorted_logitem_names(changed_nickname, rtn_internal_itemname=True)
+                self.__changeset_itemnames[changed_nickname] = itemnames
+            self.__changeset_values[(changed_nickname, itemnames[index])] = value
+        key = (nickname.upper()[0:3], itemname)
+        if key in self.__changeset_values:
+            return self.__changeset_values[key]
+        # value not yet published
+        return self.__heater_data.values(nickname, itemname)
+
+    def __decode_statistics(self, itemname):
+        """ returns the requested decoder-statistics value.
+            'decode_stats'      := all summary-values as: name:value,...
+            'decode_stats_msgid':= messageIDs with counts as: msgid:count,...
+        """
+        statistics = self.__heater_data.decode_statistics()
+        if statistics == None:
+            return None
+        if itemname == 'decode_stats':
+            return ",".join("{0}:{1}".format(name, value) for (name, value) in statistics.summary().items())
+        if itemname == 'decode_stats_msgid':
+            return ",".join("{0}:{1}".format(msgid, count) for (msgid, (count, decodetime, histogram)) in sorted(statistics.msgid_statistics().items()))
+        return statistics.summary().get(itemname)
+
     def run(self):
         """ endless running thread waiting for clients to be connected and command-requests.
         """
@@ -320,7 +389,10 @@ class cSPS_if(threading.Thread, cSPS_cfg):
                         self._logging.info(errorstr)
                             
                     if nickname != 'special' and nickname != None:
-                        itemvalue = self.__heater_data.values(nickname, itemname)
+                        if self.__changes_since != None:
+                            itemvalue = self.__changeset_value(nickname, itemname)
+                        else:
+                            itemvalue = self.__heater_data.values(nickname, itemname)
                     else:
                         if itemname == 'hostname':
                             itemvalue = socket.gethostname()
@@ -329,6 +401,8 @@ class cSPS_if(threading.Thread, cSPS_cfg):
                         if itemname == 'map_dump':
                             self.dump_command_mapping(self.__csvfilepath)
                             itemvalue = self.__csvfilepath
+                        if itemname != None and itemname.startswith('decode'):
+                            itemvalue = self.__decode_statistics(itemname)
 
                     try:
                         if itemname != None:
@@ -40,6 +40,19 @@
 #                               'GetAllMixedFlags()' added
 #                               'IsTempSensor_Hydrlic_Switch()' added.
 #                               'IsSecondCollectorValue_SO()' added.
+# Ver:0.3.2  / Datum 17.10.2026 'IsHexdump_enabled()' added, <decoder><hexdump> in configuration.
+#                               'Decoder_address_whitelist()', 'Decoder_msgid_mapping()' and
+#                               'Decoder_msgid_blacklist()' added, read from <decoder>.
+#                               'decode_statistics()' added.
+#                               value-store: logitems are compiled to slots with 'citem'-records,
+#                                values are stored in one value-array indexed by slot.
+#                               'slot()' and 'update_slot()' added.
+#                               values are read lock-free from immutable snapshots (tuple) of
+#                                each systempart, 'publish()' and 'deferred_publish()' added.
+#                               change-set tracking: 'publish()' marks changed values with a
+#                                sequence-number, 'sequence()' and 'changes_since()' added.
+#                               'publish()' keeps the snapshot-object if no value is changed.
+#                               'sorted_logitems()' added.
 #################################################################
 
 import xml.etree.ElementTree as ET
@@ -51,6 +64,54 @@ import logging
 import ht_const
 
 
+class citem(object):
+    """
+    Class 'citem' holding the context of one logitem. The value of the
+     logitem is stored in the value-array of 'cdata' at index 'slot'.
+    """
+    __slots__ = ("slot", "index", "syspart", "itemname", "logitem", "displayname",
+                 "unit", "maxvalue", "default", "accessname")
+
+    def __init__(self, slot, index, syspart, itemname, logitem):
+        self.slot = slot
+        # index of value in snapshot of systempart
+        self.index = index
+        self.syspart = syspart
+        self.itemname = itemname
+        self.logitem = logitem
+        self.displayname = ""
+        self.unit = ""
+        self.maxvalue = 100.0
+        self.default = 0.0
+        self.accessname = ""
+
+
+class csyspart(object):
+    """
+    Class 'csyspart' holding the logitems of one systempart (nickname).
+     'snapshot' is the last published tuple of values, it is replaced
+     and never modified, so readers can use it without locking.
+     'sequences' holds the sequence-number of the last value-change for
+     each snapshot-value, 'sequence' the highest one of the systempart.
+    """
+    __slots__ = ("nickname", "items", "slots", "updated", "pending", "snapshot",
+                 "sequences", "sequence", "hwtype")
+
+    def __init__(self, nickname):
+        self.nickname = nickname
+        # {itemname:citem}
+        self.items = {}
+        # slots of logitems in configuration-order
+        self.slots = []
+        self.updated = False
+        # values modified and not yet published
+        self.pending = False
+        self.snapshot = ()
+        self.sequences = ()
+        self.sequence = 0
+        self.hwtype = ""
+
+
 class cdata(ht_utils.clog):
     """
     Class 'cdata' for reading xml-configfile and generating dependent datastructur.
@@ -61,103 +122,14 @@ class cdata(ht_utils.clog):
         """
         ht_utils.clog.__init__(self)
         self.__nickname = {}
-        self.__logitemHG = {}
         self.__HKcount = 1
-        self.__logitemHK1 = {}
-        self.__logitemHK2 = {}
-        self.__logitemHK3 = {}
-        self.__logitemHK4 = {}
-        self.__logitemWW = {}
-        self.__logitemSO = {}
-        self.__logitemDT = {}
-        self.__logitemNN = {}
-        self.__valuesHG = []
-        self.__valuesHK1 = []
-        self.__valuesHK2 = []
-        self.__valuesHK3 = []
-        self.__valuesHK4 = []
-        self.__valuesWW = []
-        self.__valuesSO = []
-        self.__valuesDT = []
-        self.__valuesNN = []
-        self.__UpdateHG = False
-        self.__UpdateHK1 = False
-        self.__UpdateHK2 = False
-        self.__UpdateHK3 = False
-        self.__UpdateHK4 = False
-        self.__UpdateWW = False
-        self.__UpdateSO = False
-        self.__UpdateDT = False
-        self.__UpdateNN = False
-        # dir's for hardwaretype to be displayed
-        self.__hwtypeHG = ""
-        self.__hwtypeHK1 = ""
-        self.__hwtypeHK2 = ""
-        self.__hwtypeHK3 = ""
-        self.__hwtypeHK4 = ""
-        self.__hwtypeWW = ""
-        self.__hwtypeSO = ""
-        self.__hwtypeDT = ""
-        self.__hwtypeNN = ""
-        self.__logitemMapHG = {}
-        self.__logitemMapHK1 = {}
-        self.__logitemMapHK2 = {}
-        self.__logitemMapHK3 = {}
-        self.__logitemMapHK4 = {}
-        self.__logitemMapWW = {}
-        self.__logitemMapSO = {}
-        self.__logitemMapDT = {}
-        self.__logitemMapNN = {}
-        # dir's for Logitem Display-Names
-        self.__logitemDisplaynameHG = {}
-        self.__logitemDisplaynameHK1 = {}
-        self.__logitemDisplaynameHK2 = {}
-        self.__logitemDisplaynameHK3 = {}
-        self.__logitemDisplaynameHK4 = {}
-        self.__logitemDisplaynameWW = {}
-        self.__logitemDisplaynameSO = {}
-        self.__logitemDisplaynameDT = {}
-        self.__logitemDisplaynameNN = {}
-        # dir's for Logitem: 'unit' to be displayed
-        self.__logitemUnitHG = {}
-        self.__logitemUnitHK1 = {}
-        self.__logitemUnitHK2 = {}
-        self.__logitemUnitHK3 = {}
-        self.__logitemUnitHK4 = {}
-        self.__logitemUnitWW = {}
-        self.__logitemUnitSO = {}
-        self.__logitemUnitDT = {}
-        self.__logitemUnitNN = {}
-        # dir's for Logitem: 'maxvalue'
-        self.__maxvalueHG = {}
-        self.__maxvalueHK1 = {}
-        self.__maxvalueHK2 = {}
-        self.__maxvalueHK3 = {}
-        self.__maxvalueHK4 = {}
-        self.__maxvalueWW = {}
-        self.__maxvalueSO = {}
-        self.__maxvalueDT = {}
-        self.__maxvalueNN = {}
-        # dir's for Logitem: 'defaultvalue'
-        self.__defaultvalueHG = {}
-        self.__defaultvalueHK1 = {}
-        self.__defaultvalueHK2 = {}
-        self.__defaultvalueHK3 = {}
-        self.__defaultvalueHK4 = {}
-        self.__defaultvalueWW = {}
-        self.__defaultvalueSO = {}
-        self.__defaultvalueDT = {}
-        self.__defaultvalueNN = {}
-        # dir's for Logitem: 'accessname'
-        self.__accessnameHG = {}
-        self.__accessnameHK1 = {}
-        self.__accessnameHK2 = {}
-        self.__accessnameHK3 = {}
-        self.__accessnameHK4 = {}
-        self.__accessnameWW = {}
-        self.__accessnameSO = {}
-        self.__accessnameDT = {}
-        self.__accessnameNN = {}
+        # systempart-context {nickname:csyspart}
+        self.__syspart = {}
+        # value-array and logitem-context (citem) indexed by slot
+        self.__slotvalues = []
+        self.__slotitems = []
+        # slots for already used (nickname, logitem)-parameters of 'update()'
+        self.__slotcache = {}
         # other required values
         self.__accesscontext = {}
         self.__syspartnames = []
@@ -167,9 +139,11 @@ class cdata(ht_utils.clog):
         self.__SecondBufferSO = False
         self.__SecondCollect_ValueSO = False
         self.__TempSensor_HydraulicSwitch = 0
-        self.__data = {}
         self.__thread_lock = _thread.allocate_lock()
         self.__newdata_available = False
+        self.__deferred_publish = False
+        # sequence-number of the last published value-changes
+        self.__sequence = 0
         self.__configfilename = ""
         self.__dbname_sqlite = ""
         self.__sql_enable = False
@@ -188,6 +162,11 @@ class cdata(ht_utils.clog):
         self._IsSolarAvailable = False
         self._sqlite_autoerase_afterSeconds = 0
         self._rrdtool_autocreate_draw_minutes = 0
+        self._hexdump_enabled = True
+        self._decoder_address_whitelist = None
+        self._decoder_msgid_mapping = {}
+        self._decoder_msgid_blacklist = {}
+        self._decode_statistics = None
         # system-infos
         self.__controller_type = ht_const.CONTROLLER_TYPE_STR_Fxyz
         self.__controller_type_nr = ht_const.CONTROLLER_TYPE_NR_Fxyz
@@ -218,13 +197,8 @@ class cdata(ht_utils.clog):
         """
         reading xml-configfile and setup datastructure.
             The 'shortname' from config-file is used as main-key 'nickname'
-            data-structur:
-            {nickname:[{itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-                                                                {itemname:displayname},
-                                                                {itemname:unit},
-                                                                {itemname:maxvalue},
-                                                                {itemname:defaultvalue},
-                                                                hardwaretype]}
+            and each logitem gets its fixed slot in the value-array.
+            data-structur: see 'update()'.
         """
         # init/setup logging-file if not already forced from external call
         if self._logging == None:
@@ -366,6 +340,34 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise
 
+            try:
+                #  find decoder -entries (optional)
+                self._hexdump_enabled = True
+                for decoder_param in self.__root.findall('decoder'):
+                    try:
+                        hexdump_value = decoder_param.find('hexdump').text.upper()
+                        self._hexdump_enabled = False if hexdump_value in ('OFF', '0') else True
+                    except:
+                        self._hexdump_enabled = True
+                    try:
+                        whitelist = decoder_param.find('address_whitelist').text.split()
+                        self._decoder_address_whitelist = [int(address, 16) for address in whitelist]
+                    except:
+                        self._decoder_address_whitelist = None
+                    for msgid_param in decoder_param.findall('msgid_mapping'):
+                        address = int(msgid_param.attrib["address"], 16)
+                        msgids = msgid_param.text.split() if msgid_param.text != None else []
+                        self._decoder_msgid_mapping[address] = [int(msgid) for msgid in msgids]
+                    for msgid_param in decoder_param.findall('msgid_blacklist'):
+                        address = int(msgid_param.attrib["address"], 16)
+                        msgids = msgid_param.text.split() if msgid_param.text != None else []
+                        self._decoder_msgid_blacklist[address] = [int(msgid) for msgid in msgids]
+            except:
+                errorstr = "data.read_db_config();Error on decoder parameter"
+                print(errorstr)
+                self._logging.critical(errorstr)
+                raise
+
             try:
                 #  find amount of heizkreise -entries
                 self.__HKcount = int(self.__root.find('anzahl_heizkreise').text)
@@ -542,8 +544,8 @@ class cdata(ht_utils.clog):
 
     def _setnickname(self, shortname, longname):
         """
-        save nickname attached to longname. Additional the assignment for
-        'Systempart' to the attached value-arrays are done here.
+        save nickname attached to longname. Additional the 'Systempart'-context
+         for the logitems is created here.
          Values are set in configuration-file.
         """
         shortname = shortname.upper()[0:3]
@@ -557,111 +559,8 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             self.__nickname.update({shortname: longname})
-            if "HG" in shortname:
-                self.__data.update({"HG": [self.__logitemHG,
-                                          self.__valuesHG,
-                                          self.__UpdateHG,
-                                          self.__logitemMapHG,
-                                          self.__logitemDisplaynameHG,
-                                          self.__logitemUnitHG,
-                                          self.__maxvalueHG,
-                                          self.__defaultvalueHG,
-                                          self.__accessnameHG,
-                                          self.__hwtypeHG]})
-            elif "HK1" in shortname:
-                self.__data.update({"HK1": [self.__logitemHK1,
-                                          self.__valuesHK1,
-                                          self.__UpdateHK1,
-                                          self.__logitemMapHK1,
-                                          self.__logitemDisplaynameHK1,
-                                          self.__logitemUnitHK1,
-                                          self.__maxvalueHK1,
-                                          self.__defaultvalueHK1,
-                                          self.__accessnameHK1,
-                                          self.__hwtypeHK1]})
-            elif "HK2" in shortname:
-                self.__data.update({"HK2": [self.__logitemHK2,
-                                          self.__valuesHK2,
-                                          self.__UpdateHK2,
-                                          self.__logitemMapHK2,
-                                          self.__logitemDisplaynameHK2,
-                                          self.__logitemUnitHK2,
-                                          self.__maxvalueHK2,
-                                          self.__defaultvalueHK2,
-                                          self.__accessnameHK2,
-                                          self.__hwtypeHK2]})
-
-            elif "HK3" in shortname:
-                self.__data.update({"HK3": [self.__logitemHK3,
-                                          self.__valuesHK3,
-                                          self.__UpdateHK3,
-                                          self.__logitemMapHK3,
-                                          self.__logitemDisplaynameHK3,
-                                          self.__logitemUnitHK3,
-                                          self.__maxvalueHK3,
-                                          self.__defaultvalueHK3,
-                                          self.__accessnameHK3,
-                                          self.__hwtypeHK3]})
-
-            elif "HK4" in shortname:
-                self.__data.update({"HK4": [self.__logitemHK4,
-                                          self.__valuesHK4,
-                                          self.__UpdateHK4,
-                                          self.__logitemMapHK4,
-                                          self.__logitemDisplaynameHK4,
-                                          self.__logitemUnitHK4,
-                                          self.__maxvalueHK4,
-                                          self.__defaultvalueHK4,
-                                          self.__accessnameHK4,
-                                          self.__hwtypeHK4]})
-
-            elif "WW" in shortname:
-                self.__data.update({"WW": [self.__logitemWW,
-                                          self.__valuesWW,
-                                          self.__UpdateWW,
-                                          self.__logitemMapWW,
-                                          self.__logitemDisplaynameWW,
-                                          self.__logitemUnitWW,
-                                          self.__maxvalueWW,
-                                          self.__defaultvalueWW,
-                                          self.__accessnameWW,
-                                          self.__hwtypeWW]})
-
-            elif "SO" in shortname:
-                self.__data.update({"SO": [self.__logitemSO,
-                                          self.__valuesSO,
-                                          self.__UpdateSO,
-                                          self.__logitemMapSO,
-                                          self.__logitemDisplaynameSO,
-                                          self.__logitemUnitSO,
-                                          self.__maxvalueSO,
-                                          self.__defaultvalueSO,
-                                          self.__accessnameSO,
-                                          self.__hwtypeSO]})
-
-            elif "DT" in shortname:
-                self.__data.update({"DT": [self.__logitemDT,
-                                          self.__valuesDT,
-                                          self.__UpdateDT,
-                                          self.__logitemMapDT,
-                                          self.__logitemDisplaynameDT,
-                                          self.__logitemUnitDT,
-                                          self.__maxvalueDT,
-                                          self.__defaultvalueDT,
-                                          self.__accessnameDT,
-                                          self.__hwtypeDT]})
-
-            else:
-                self.__data.update({"NN": [self.__logitemNN,
-                                          self.__valuesNN,
-                                          self.__UpdateNN,
-                                          self.__logitemMapNN,
-                                          self.__logitemDisplaynameNN,
-                                          self.__logitemUnitNN,
-                                          self.__maxvalueNN,
-                                          self.__defaultvalueNN,
-                                          self.__accessnameNN,
-                                          self.__hwtypeNN]})
+            if not shortname in self.__syspart:
+                self.__syspart.update({shortname: csyspart(shortname)})
 
         except (NameError, AttributeError) as e:
             errorstr = "data._setnickname();Error;{0}".format(e.args[0])
@@ -688,19 +587,10 @@ class cdata(ht_utils.clog):
         returns sorted list of logitem-names for the nickname.
         """
         nickname = nickname.upper()[0:3]
-        all_logitem_names = []
-        length = 0
         if nickname in self.__nickname:
-            length = len(self.__data[nickname][0])
-            for x in range(0, length):
-                all_logitem_names.append("")
-
-            for (key, value) in self.__data[nickname][0].items():
-                itemname = key
-                if not rtn_internal_itemname:
-                    itemname = self.__data[nickname][3][key]
-                all_logitem_names[int(value)] = itemname
-            return all_logitem_names
+            if rtn_internal_itemname:
+                return [self.__slotitems[slot].itemname for slot in self.__syspart[nickname].slots]
+            return [self.__slotitems[slot].logitem for slot in self.__syspart[nickname].slots]
         else:
             errorstr = "getall_sorted_logitem_names();Error;nickname'{0}' not found".format(nickname)
             print(errorstr)
@@ -712,32 +602,29 @@ class cdata(ht_utils.clog):
         This function returns the sorted tuple-array of items and attached values.
         """
         nickname = nickname.upper()[0:3]
-        all_logitem_names = self.getall_sorted_logitem_names(nickname)
         rtntuple_array = []
-        for itemname in all_logitem_names:
-            if not itemname == "hexdump":
-                internal_itemname = itemname.replace("_", "").lower()
-                index = int(self.__data[nickname][0][internal_itemname])
-                value = self.__data[nickname][1][index]
-                rtntuple_array.append((itemname, value))
+        snapshot = self.values(nickname)
+        for (index, slot) in enumerate(self.__syspart[nickname].slots[0:len(snapshot)]):
+            logitem = self.__slotitems[slot].logitem
+            if not logitem == "hexdump":
+                rtntuple_array.append((logitem, snapshot[index]))
         return rtntuple_array
 
+    def sorted_logitems(self, nickname):
+        """
+        returns the tuple of logitems for 'nickname' in the order of 'values(nickname)'.
+         The order is fixed after reading the configuration.
+        """
+        nickname = nickname.upper()[0:3]
+        return tuple(self.__slotitems[slot].logitem for slot in self.__syspart[nickname].slots)
+
     def getall_sorted_accessnames(self, nickname):
         """
         returns sorted list of access-names for the nickname.
         """
         nickname = nickname.upper()[0:3]
-        all_sorted_access_names = []
-        length = 0
         if nickname in self.__nickname:
-            length = len(self.__data[nickname][0])
-            for x in range(0, length):
-                all_sorted_access_names.append("")
-
-            for (key, value) in self.__data[nickname][0].items():
-                accessname = self.__data[nickname][8][key]
-                all_sorted_access_names[int(value)] = accessname
-            return all_sorted_access_names
+            return [self.__slotitems[slot].accessname for slot in self.__syspart[nickname].slots]
         else:
             errorstr = "getall_sorted_accessnames();Error;nickname'{0}' not found".format(nickname)
             print(errorstr)
@@ -760,15 +647,20 @@ class cdata(ht_utils.clog):
          will create it, if not yet available.
          parameter 'logitem' is assigned to 'value' (default:=0)
          data-structur:
-          {nickname:[ {itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-                                                                        {itemname:displayname},
-                                                                        {itemname:unit},
-                                                                        {itemname:maxvalue},
-                                                                        {itemname:defaultvalue},
-                                                                        {itemname:accessname},
-                                                                        hardwaretype]}
-        """
-
+          {nickname:csyspart}   csyspart.items := {itemname:citem}
+                                csyspart.slots := [slot,...]
+          value-array[slot] := value
+          citem-array[slot] := citem (logitem, displayname, unit, maxvalue,
+                                      default, accessname)
+        """
+        # fast path for value-updates of already known logitems
+        slot = self.__slotcache.get((nickname, logitem))
+        if slot != None and displayname == "" and unit == "" and hwtype == "" and \
+                maxvalue == 100.0 and default == 0.0 and accessname == "":
+            self.update_slot(slot, value)
+            return
+
+        callparameter = (nickname, logitem)
         nickname = nickname.upper()[0:3]
         itemname = logitem.replace("_", "").lower()
         try:
@@ -781,43 +673,45 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    # update value, get index first from dir{itemname:index}
-                    index = int(self.__data[nickname][0][itemname])
-                    self.__data[nickname][1][index] = value
+                syspart = self.__syspart[nickname]
+                item = syspart.items.get(itemname)
+                if item != None:
+                    # update value
+                    self.__slotvalues[item.slot] = value
                     # set 'IsSyspartUpdate' true
-                    self.__data[nickname][2] = True
+                    syspart.updated = True
+                    syspart.pending = True
                     if len(displayname) > 0:
-                        self.__data[nickname][4][itemname] = displayname
+                        item.displayname = displayname
                     if len(unit) > 0:
-                        self.__data[nickname][5][itemname] = unit
+                        item.unit = unit
                     if maxvalue != 100.0:
-                        self.__data[nickname][6][itemname] = maxvalue
+                        item.maxvalue = maxvalue
                     if default != 0.0:
-                        self.__data[nickname][7][itemname] = default
+                        item.default = default
                     if len(accessname) > 0:
-                        self.__data[nickname][8][itemname] = accessname
+                        item.accessname = accessname
+                    self.__slotcache[callparameter] = item.slot
                 else:
-                    # add new item and value, index is the current array-length
-                    # and is set to dir{itemname:index}
-                    index = len(self.__data[nickname][1])
-                    self.__data[nickname][0].update({itemname: index})
-                    self.__data[nickname][1].append(value)
-                    # set internal itemname to external logitem
-                    self.__data[nickname][3].update({itemname: logitem})
+                    # add new item and value, the slot is the current value-array length
+                    #  and index is the current amount of syspart-items
+                    slot = len(self.__slotvalues)
+                    index = len(syspart.slots)
+                    item = citem(slot, index, syspart, itemname, logitem)
+                    self.__slotvalues.append(value)
+                    self.__slotitems.append(item)
+                    syspart.items.update({itemname: item})
+                    syspart.slots.append(slot)
+                    syspart.pending = True
 
                     if not displayname == None and len(displayname) > 0:
-                        self.__data[nickname][4].update({itemname: displayname})
-                    else:
-                        self.__data[nickname][4].update({itemname: ""})
+                        item.displayname = displayname
 
                     if not unit == None and len(unit) > 0:
-                        self.__data[nickname][5].update({itemname: unit})
-                    else:
-                        self.__data[nickname][5].update({itemname: ""})
+                        item.unit = unit
 
-                    self.__data[nickname][6].update({itemname: maxvalue})
-                    self.__data[nickname][7].update({itemname: default})
+                    item.maxvalue = maxvalue
+                    item.default = default
 
                     if len(set_parameter) > 0:
                         cmd_parameter = set_parameter
@@ -833,52 +727,152 @@ class cdata(ht_utils.clog):
                         accessname = str(nickname).lower() + "_unused_" + str(index)
                         self.__accesscontext.update({accessname: (nickname, logitem, itemname, cmd_parameter)})
 
-                    self.__data[nickname][8].update({itemname: accessname})
-
+                    item.accessname = accessname
 
                 if not hwtype == None and len(hwtype) > 0:
-                    self.__data[nickname][9] = hwtype
+                    syspart.hwtype = hwtype
             else:
                 errorstr = "data.update();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
 
-            self.__thread_lock.acquire()
             self.__newdata_available = True
-            self.__thread_lock.release()
 
         except (KeyError, NameError, AttributeError) as e:
             errorstr = "data.update();Error;{0}".format(e.args[0])
             print(errorstr)
             self._logging.critical(errorstr)
-            self.__thread_lock.acquire()
             self.__newdata_available = False
-            self.__thread_lock.release()
+
+    def slot(self, nickname, logitem):
+        """
+        returns the slot (index in value-array) of the logitem or None if not available.
+         The slot is fixed after reading the configuration and can be used with 'update_slot()'.
+        """
+        nickname = nickname.upper()[0:3]
+        itemname = logitem.replace("_", "").lower()
+        syspart = self.__syspart.get(nickname)
+        if syspart == None or not itemname in syspart.items:
+            return None
+        return syspart.items[itemname].slot
+
+    def update_slot(self, slot, value):
+        """
+        updates the value of the logitem stored at 'slot' (see: 'slot()').
+        """
+        self.__slotvalues[slot] = value
+        syspart = self.__slotitems[slot].syspart
+        syspart.updated = True
+        syspart.pending = True
+        self.__newdata_available = True
+
+    def deferred_publish(self, enable=True):
+        """
+        enables/disables the deferred publishing of snapshots.
+         enabled : snapshots are published only with 'publish()', this is done by the
+                   decoder after each message, so readers get complete messages only.
+         disabled: modified snapshots are published with the next call of 'values()'.
+        """
+        self.__deferred_publish = enable
+
+    def publish(self, nickname=""):
+        """
+        publishes the current values of systempart 'nickname' (default: all systemparts)
+         as new snapshot, if values are modified. Without value-changes the snapshot
+         is kept, so unchanged values of 'values(nickname)' are the same object.
+         Changed values are marked with the next sequence-number (see: 'changes_since()').
+         Must be called from the thread updating the values.
+        """
+        if len(nickname):
+            sysparts = (self.__syspart[nickname.upper()[0:3]],)
+        else:
+            sysparts = self.__syspart.values()
+        slotvalues = self.__slotvalues
+        sequence = self.__sequence + 1
+        changed = False
+        for syspart in sysparts:
+            if syspart.pending:
+                syspart.pending = False
+                snapshot = tuple([slotvalues[slot] for slot in syspart.slots])
+                old_snapshot = syspart.snapshot
+                sequences = list(syspart.sequences)
+                sequences.extend([0] * (len(snapshot) - len(sequences)))
+                syspart_changed = False
+                for index in range(len(snapshot)):
+                    if index >= len(old_snapshot) or snapshot[index] != old_snapshot[index]:
+                        sequences[index] = sequence
+                        syspart_changed = True
+                # order is required for 'changes_since()': snapshot, sequences, sequence
+                if syspart_changed:
+                    syspart.snapshot = snapshot
+                    syspart.sequences = tuple(sequences)
+                    syspart.sequence = sequence
+                    changed = True
+        if changed:
+            self.__sequence = sequence
+
+    def sequence(self):
+        """
+        returns the sequence-number of the last published value-changes.
+        """
+        return self.__sequence
+
+    def changes_since(self, sequence, nickname=""):
+        """
+        returns the values changed after 'sequence' as tuple:
+          (current sequence, [(nickname, index, value), ...])
+         'index' is the position of the value in 'values(nickname)' and in
+         'getall_sorted_accessnames(nickname)'.
+         Use the returned sequence for the next call. Works without locking.
+        """
+        current = self.__sequence
+        changes = []
+        if len(nickname):
+            sysparts = (self.__syspart[nickname.upper()[0:3]],)
+        else:
+            sysparts = self.__syspart.values()
+        for syspart in sysparts:
+            if syspart.sequence <= sequence:
+                continue
+            # reading sequences before snapshot, values can be newer but never older
+            sequences = syspart.sequences
+            snapshot = syspart.snapshot
+            for index in range(len(sequences)):
+                if sequence < sequences[index] <= current:
+                    changes.append((syspart.nickname, index, snapshot[index]))
+        return (current, changes)
 
     def values(self, nickname, logitem=""):
         """
-        returns all values (array) for 'nickname or value (single one) for
+        returns all values (tuple) for 'nickname or value (single one) for
          'nickname' and 'logitem'.
+         The values are read from the last published snapshot without locking.
         """
         nickname = nickname.upper()[0:3]
         itemname = logitem.replace("_", "").lower()
         try:
-            self.__thread_lock.acquire()
             if not len(nickname):
                 errorstr = "data.values();Error;nickname: '{0}' undefined".format(nickname)
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
+                syspart = self.__syspart[nickname]
+                if syspart.pending and not self.__deferred_publish:
+                    self.publish(nickname)
+                snapshot = syspart.snapshot
                 if len(itemname):
-                    if itemname in self.__data[nickname][0]:
-                        index = int(self.__data[nickname][0][itemname])
-                        return self.__data[nickname][1][index]
+                    if itemname in syspart.items:
+                        item = syspart.items[itemname]
+                        if item.index < len(snapshot):
+                            return snapshot[item.index]
+                        # logitem added after last publishing
+                        return self.__slotvalues[item.slot]
                     else:
                         errorstr = "data.values();Error;itemname:'{0}' not found".format(logitem)
                         self._logging.critical(errorstr)
                         raise NameError(errorstr)
                 else:
-                    return self.__data[nickname][1]
+                    return snapshot
             else:
                 errorstr = "data.values();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
@@ -887,9 +881,6 @@ class cdata(ht_utils.clog):
             errorstr = "data.values();Error;{0}".format(e.args[0])
             self._logging.critical(errorstr)
 
-        finally:
-            self.__thread_lock.release()
-
     def displayname(self, nickname, logitem):
         """
         returns the 'name' to be displayed for the logitem.
@@ -908,8 +899,8 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return str(self.__data[nickname][4][itemname])
+                if itemname in self.__syspart[nickname].items:
+                    return str(self.__syspart[nickname].items[itemname].displayname)
                 else:
                     errorstr = "data.displayname();Error;itemname:'{0}' not found in nicknames:'{1}'".format(logitem, nickname)
                     self._logging.critical(errorstr)
@@ -941,8 +932,8 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return self.__data[nickname][5][itemname]
+                if itemname in self.__syspart[nickname].items:
+                    return self.__syspart[nickname].items[itemname].unit
                 else:
                     errorstr = "data.displayunit();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -974,12 +965,13 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
+                if itemname in self.__syspart[nickname].items:
+                    maxvalue = self.__syspart[nickname].items[itemname].maxvalue
                     #check for float- or int-value and return the correct type
-                    if "." in (str(self.__data[nickname][6][itemname])):
-                        return float(self.__data[nickname][6][itemname])
+                    if "." in (str(maxvalue)):
+                        return float(maxvalue)
                     else:
-                        return int(self.__data[nickname][6][itemname])
+                        return int(maxvalue)
                 else:
                     errorstr = "data.maxvalue();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1011,12 +1003,13 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
+                if itemname in self.__syspart[nickname].items:
+                    default = self.__syspart[nickname].items[itemname].default
                     #check for float- or int-value and return the correct type
-                    if "." in (str(self.__data[nickname][7][itemname])):
-                        return float(self.__data[nickname][7][itemname])
+                    if "." in (str(default)):
+                        return float(default)
                     else:
-                        return int(self.__data[nickname][7][itemname])
+                        return int(default)
                 else:
                     errorstr = "data.defaultvalue();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1048,8 +1041,8 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return self.__data[nickname][8][itemname]
+                if itemname in self.__syspart[nickname].items:
+                    return self.__syspart[nickname].items[itemname].accessname
                 else:
                     errorstr = "data.accessname();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1074,7 +1067,7 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                return str(self.__data[nickname][9])
+                return str(self.__syspart[nickname].hwtype)
             else:
                 errorstr = "data.hardwaretype();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
@@ -1273,8 +1266,8 @@ class cdata(ht_utils.clog):
         """
         nickname = nickname.upper()[0:3]
         self.__thread_lock.acquire()
-        Rtn = self.__data[nickname][2]
-        self.__data[nickname][2] = False
+        Rtn = self.__syspart[nickname].updated
+        self.__syspart[nickname].updated = False
         self.__thread_lock.release()
         return Rtn
 
@@ -1374,6 +1367,45 @@ class cdata(ht_utils.clog):
     def IsAutocreate_draw(self):
         return int(self._rrdtool_autocreate_draw_minutes)
 
+    def IsHexdump_enabled(self, enabled=None):
+        """
+        returns and setup the flag for storing the message-hexdump
+         to logitem 'hexdump'.
+        """
+        if not enabled == None:
+            self._hexdump_enabled = bool(enabled)
+        return self._hexdump_enabled
+
+    def Decoder_address_whitelist(self):
+        """
+        returns the list of valid device-addresses for the decoder
+         or None if not configured (decoder-defaults are used then).
+        """
+        return self._decoder_address_whitelist
+
+    def Decoder_msgid_mapping(self):
+        """
+        returns the configured device-addresses mapped to their valid messageIDs
+         as dict: {address:[msgid,...]}, the entries replace the decoder-defaults.
+        """
+        return self._decoder_msgid_mapping
+
+    def Decoder_msgid_blacklist(self):
+        """
+        returns the configured device-addresses mapped to their not valid messageIDs
+         as dict: {address:[msgid,...]}, the entries replace the decoder-defaults.
+        """
+        return self._decoder_msgid_blacklist
+
+    def decode_statistics(self, statistics=None):
+        """
+        returns and setup the statistics-object of the running decoder
+         (ht_discode.cdecode_statistics) or None if no decoder is running.
+        """
+        if statistics != None:
+            self._decode_statistics = statistics
+        return self._decode_statistics
+
 #--- class cdata end ---#
 
 if __name__ == "__main__":
@@ -1382,13 +1414,7 @@ if __name__ == "__main__":
     # testtype:= 0 -> basic 'cdata'-classtest
     # testtype:= 1 -> test including xml-configfile-data extract
     #
-    # data-structur:
-    #   {nickname:[ {itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-    #                                                                     {itemname:displayname},
-    #                                                                     {itemname:unit},
-    #                                                                     {itemname:maxvalue},
-    #                                                                     {itemname:default},
-    #                                                                     hardwaretype]}
+    # data-structur: see 'cdata.update()'
     #
     testtype = 1
 
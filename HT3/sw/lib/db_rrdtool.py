@@ -23,16 +23,50 @@
 # Ver:0.1.10 / Datum 28.08.2016 code-adjustment after pylint
 # Ver:0.2    / Datum 29.08.2016 added info-text
 # Ver:0.3    / Datum 18.01.2019 create_draw() added
+# Ver:0.4    / Datum 17.10.2026 update_batch() added, updates are written with python rrdtool-binding
+#                                or a long-living 'rrdtool -' pipe-process, the perl-script is
+#                                only used as fallback (<update_interface>).
+#                               optional update-cache with journal, collected updates are written
+#                                with 'flush()' (<update_cache_seconds>, <update_journal>).
+#                               optional rrdcached-daemon (<rrdcached>).
+#                               'step_update()' added, writes all systemparts from cdata-snapshots
+#                                with a precomputed layout.
+#                               draws on demand: 'save_draw_parameters()' and class 'cdb_rrdtool_graphs'
+#                                drawing only requested graphs, cached for <draw_cache_seconds>.
+#                               journal is restored with the first 'update_batch()', not in constructor.
+#                               'cdb_rrdtool_graphs' reads the configuration without 'cdb_rrdtool'.
 #################################################################
 #
 
 import os
+import json
+import shutil
+import subprocess
 import tempfile
+import threading
 import xml.etree.ElementTree as ET
 import time
 import ht_utils
 import logging
 import ht_const
+try:
+    import rrdtool
+except ImportError:
+    rrdtool = None
+
+# interfaces used for rrdtool-updates, 'auto' takes the first available one
+_UPDATE_INTERFACES = ('python', 'pipe', 'perl')
+
+
+def _read_draw_parameters(parameterfilename):
+    """
+    returns the saved list of draw-script and parameters or None if not available.
+    """
+    try:
+        with open(parameterfilename, "r") as parameterfile:
+            return json.load(parameterfile)
+    except (EnvironmentError, ValueError):
+        return None
 
 
 class cdb_rrdtool(ht_utils.clog):
@@ -61,6 +95,22 @@ class cdb_rrdtool(ht_utils.clog):
         self.__rrdtool_enable = False
         self.__rrdtool_stepseconds = 60
         self.__rrdtool_starttime_utc = 0
+        self.__update_interface = "perl"
+        self.__rrdtool_executable = None
+        self.__rrdpipe = None
+        self.__available = False
+        # collected updates [(syspartname, values, timestamp),...] and journal-file
+        self.__cache = []
+        self.__cache_starttime = 0
+        self.__cache_seconds = 0
+        self.__journal = ""
+        # journal is read with the first update, so only the writing process uses it
+        self.__journal_restored = False
+        self.__rrdcached = ""
+        # layout for 'step_update()' [(syspartname, nickname, ((index, logitem),...)),...]
+        self.__step_layout = None
+        self.__draw_on_demand = False
+        self.__draw_cache_seconds = 60
 
         # flag used to activate perl rrdtool-handling,
         #  it is not yet available for Python3 and debian
@@ -89,6 +139,7 @@ class cdb_rrdtool(ht_utils.clog):
                 self.__fullpathname = self.__dbname
 
             self.__Perl_dbcreateFile = os.path.normcase("/tmp/rrdtool_dbcreate.pl")
+            self.__draw_parameterfile = self.__fullpathname + "_draw.json"
             self.__fillup_mapping()
 
             for rrdtool_part in self.__root.findall('rrdtool-db'):
@@ -106,6 +157,39 @@ class cdb_rrdtool(ht_utils.clog):
                 if self.__rrdtool_starttime_utc < 1344000000 or self.__rrdtool_starttime_utc > 1999999999:
                     self.__rrdtool_starttime_utc = 1344000000
 
+                try:
+                    update_interface = rrdtool_part.find('update_interface').text.lower()
+                except:
+                    update_interface = "auto"
+                self.__update_interface = self.__select_update_interface(update_interface)
+
+                try:
+                    self.__cache_seconds = max(0, int(rrdtool_part.find('update_cache_seconds').text))
+                except:
+                    self.__cache_seconds = 0
+                try:
+                    self.__journal = rrdtool_part.find('update_journal').text.strip()
+                except:
+                    self.__journal = ""
+                try:
+                    self.__rrdcached = rrdtool_part.find('rrdcached').text.strip()
+                except:
+                    self.__rrdcached = ""
+                try:
+                    draw_on_demand = rrdtool_part.find('draw_on_demand').text.upper()
+                    self.__draw_on_demand = (draw_on_demand == 'ON' or draw_on_demand == '1')
+                except:
+                    self.__draw_on_demand = False
+                try:
+                    self.__draw_cache_seconds = max(0, int(rrdtool_part.find('draw_cache_seconds').text))
+                except:
+                    self.__draw_cache_seconds = 60
+
+            if len(self.__rrdcached):
+                # used from librrd (python-binding, 'rrdtool'-process, perl and rrdtool_draw.pl)
+                #  for all updates and flushing before graphs are drawn
+                os.environ["RRDCACHED_ADDRESS"] = self.__rrdcached
+
         except (OSError, EnvironmentError, TypeError, NameError) as e:
             errorstr = """cdb_rrdtool();Error;<{0}>""".format(str(e.args))
             print(errorstr)
@@ -115,7 +199,49 @@ class cdb_rrdtool(ht_utils.clog):
     def __del__(self):
         """
         """
-        pass
+        self.close()
+
+    def close(self):
+        """
+        writes the collected updates and terminates the 'rrdtool -' pipe-process if running.
+         mandatory: none
+        """
+        self.flush()
+        self.__close_pipe()
+
+    def __close_pipe(self):
+        """
+        terminates the 'rrdtool -' pipe-process if running.
+        """
+        rrdpipe = self.__rrdpipe
+        self.__rrdpipe = None
+        if rrdpipe != None:
+            try:
+                rrdpipe.stdin.write("quit\n")
+                rrdpipe.stdin.close()
+                rrdpipe.wait(5)
+            except:
+                rrdpipe.kill()
+
+    def __select_update_interface(self, update_interface):
+        """
+        returns the available interface for updates: 'python', 'pipe' or 'perl'.
+         'auto' takes the first available one, 'perl' is always possible.
+        """
+        self.__rrdtool_executable = shutil.which("rrdtool")
+        if update_interface in ("auto", "python") and rrdtool != None:
+            return "python"
+        if update_interface in ("auto", "python", "pipe") and self.__rrdtool_executable != None:
+            return "pipe"
+        if update_interface != "auto" and update_interface != "perl":
+            self._logging.warning("cdb_rrdtool();interface:'{0}' not available, using perl".format(update_interface))
+        return "perl"
+
+    def update_interface(self):
+        """
+        returns the used interface for updates: 'python', 'pipe' or 'perl'.
+        """
+        return self.__update_interface
 
     def __fillup_mapping(self):
         """
@@ -157,6 +283,7 @@ class cdb_rrdtool(ht_utils.clog):
         """
         #find database-files in directory
         dircontent = os.listdir(self.__path)
+        self.__databasefiles = []
         filefound = 0
         for content in dircontent:
             if self.__basename in content:
@@ -171,22 +298,260 @@ class cdb_rrdtool(ht_utils.clog):
          values      <- array of tuples [(n1,v1),(n2,v2),...]
          optional : timestamp        (default is current UTC-time)
         """
-        try:
-            if not self.isavailable():
-                errorstr = "db_rrdtool.update();Error;database not yet created"
-                self._logging.critical(errorstr)
-                raise EnvironmentError(errorstr)
+        return self.update_batch([(syspartname, values)], timestamp)
+
+    def step_layout(self, gdata):
+        """
+        precomputes the layout for 'step_update()' from cdata-object 'gdata': for each
+         systempart (without 'DT') the position and logitem of the values written
+         to rrdtool-database (without 'hexdump').
+         mandatory: gdata <- cdata-object with read configuration
+        """
+        layout = []
+        for (shortname, syspartname) in self.syspartnames().items():
+            if shortname.upper() == 'DT':
+                continue
+            items = tuple((index, logitem) for (index, logitem) in enumerate(gdata.sorted_logitems(shortname))
+                          if not logitem == "hexdump")
+            layout.append((syspartname, shortname, items))
+        self.__step_layout = layout
+        return layout
 
+    def step_update(self, gdata, timestamp=None):
+        """
+        updates the rrdtool-databases of all systemparts with the current values
+         from cdata-object 'gdata' in one batched operation.
+         The layout is computed with the first call (see: 'step_layout()').
+         mandatory: gdata <- cdata-object
+         optional : timestamp        (default is current UTC-time)
+         returns True on error.
+        """
+        if self.__step_layout == None:
+            self.step_layout(gdata)
+        updates = []
+        for (syspartname, shortname, items) in self.__step_layout:
+            snapshot = gdata.values(shortname)
+            values = [(logitem, snapshot[index]) for (index, logitem) in items if index < len(snapshot)]
+            if len(values):
+                updates.append((syspartname, values))
+        return self.update_batch(updates, timestamp)
+
+    def update_batch(self, updates, timestamp=None):
+        """
+        updates the rrdtool-database entries of all systemparts in 'updates' with one call,
+         using the python rrdtool-binding, the 'rrdtool -' pipe-process or one perl-script.
+         With <update_cache_seconds> the updates are collected (and written to the journal)
+         and written with 'flush()' after that time. Not written updates from the journal
+         are restored with the first call.
+         mandatory: updates <- array of tuples [(syspartname, values),...]
+                     syspartname <- syspart-longname (not nickname!)
+                     values      <- array of tuples [(n1,v1),(n2,v2),...]
+         optional : timestamp        (default is current UTC-time)
+         returns True on error.
+        """
+        try:
             if timestamp == None:
                 itimestamp = int(time.time())
             else:
                 itimestamp = int(timestamp)
+
+            for (syspartname, values) in updates:
+                self.__check_update_values(values)
+            rows = [(syspartname, values, itimestamp) for (syspartname, values) in updates]
+
+            if self.__cache_seconds > 0:
+                if not self.__journal_restored:
+                    self.__journal_restored = True
+                    self.__journal_read()
+                if not len(self.__cache):
+                    self.__cache_starttime = time.time()
+                self.__cache.extend(rows)
+                self.__journal_write(rows)
+                if time.time() - self.__cache_starttime >= self.__cache_seconds:
+                    return self.flush()
+                return False
+            return self.__update_rows(rows)
+
+        except (ValueError, EnvironmentError, NameError, TypeError) as e:
+            errorstr = 'cdb_rrdtool.update_batch();Error;<{0}>'.format(e.args[0])
+            self._logging.critical(errorstr)
+            print(errorstr)
+            return True
+
+    def flush(self):
+        """
+        writes the collected updates to the rrdtool-database and clears the journal,
+         updates of each systempart are written with one command.
+         returns True on error.
+        """
+        if not len(self.__cache):
+            return False
+        rows = self.__cache
+        self.__cache = []
+        try:
+            error = self.__update_rows(rows)
+        except (ValueError, EnvironmentError, NameError, TypeError) as e:
+            errorstr = 'cdb_rrdtool.flush();Error;<{0}>'.format(e.args[0])
+            self._logging.critical(errorstr)
+            print(errorstr)
+            error = True
+        self.__journal_clear()
+        return error
+
+    def __update_rows(self, rows):
+        """
+        writes the rows [(syspartname, values, timestamp),...] with the used interface.
+         returns True on error.
+        """
+        if not self.__available:
+            self.__available = self.isavailable()
+        if not self.__available:
+            errorstr = "db_rrdtool.update();Error;database not yet created"
+            self._logging.critical(errorstr)
+            raise EnvironmentError(errorstr)
+
+        if self.__update_interface == "python":
+            return self.__update_python(rows)
+        elif self.__update_interface == "pipe":
+            try:
+                return self.__update_pipe(rows)
+            except (EnvironmentError, ValueError) as e:
+                # pipe-process not working, perl-script is used as fallback
+                self.__close_pipe()
+                self._logging.warning("cdb_rrdtool.update_batch();pipe failed:<{0}>, using perl".format(e))
+        return self.__update_perl(rows)
+
+    def __journal_write(self, rows):
+        """
+        appends the rows to the journal-file, used to restore not written updates.
+        """
+        if len(self.__journal):
+            try:
+                with open(self.__journal, "a") as journal:
+                    for (syspartname, values, timestamp) in rows:
+                        journal.write(json.dumps([syspartname, timestamp, values]) + "\n")
+            except (EnvironmentError) as e:
+                self._logging.critical("cdb_rrdtool.__journal_write();Error;<{0}>".format(e))
+
+    def __journal_clear(self):
+        """
+        clears the journal-file after writing the updates.
+        """
+        if len(self.__journal) and os.path.exists(self.__journal):
+            try:
+                open(self.__journal, "w").close()
+            except (EnvironmentError) as e:
+                self._logging.critical("cdb_rrdtool.__journal_clear();Error;<{0}>".format(e))
+
+    def __journal_read(self):
+        """
+        reads the not written updates from journal-file into the cache.
+        """
+        if len(self.__journal) and os.path.exists(self.__journal):
+            try:
+                with open(self.__journal, "r") as journal:
+                    for line in journal:
+                        try:
+                            (syspartname, timestamp, values) = json.loads(line)
+                            self.__cache.append((syspartname, [tuple(value) for value in values], int(timestamp)))
+                        except ValueError:
+                            # last line not complete written
+                            continue
+                if len(self.__cache):
+                    self.__cache_starttime = time.time()
+                    self._logging.info("cdb_rrdtool();updates from journal:{0}".format(len(self.__cache)))
+            except (EnvironmentError) as e:
+                self._logging.critical("cdb_rrdtool.__journal_read();Error;<{0}>".format(e))
+
+    def __check_update_values(self, values):
+        """
+        checks the values for updates, raises TypeError if not valid.
+        """
+        if not (isinstance(values, list) and len(values) and isinstance(values[0], tuple)):
+            errorstr = "cdb_rrdtool.__check_update_values;TypeError;only a list of tuples allowed for 'values'"
+            self._logging.critical(errorstr)
+            raise TypeError(errorstr)
+        for (logitem, value) in values:
+            if len(str(logitem)) > 18:
+                errorstr = "cdb_rrdtool.__check_update_values;Error;logitem-length must be less then 19 chars"
+                self._logging.critical(errorstr)
+                raise TypeError(errorstr)
+
+    def __update_arguments(self, rows):
+        """
+        returns the arguments [(syspartname, [filename, '--template', template, data,...]),...]
+         for 'rrdtool update', rows of same systempart and template are written with one command.
+         unknown values (None) are written as 'U'.
+        """
+        commands = []
+        for (syspartname, values, timestamp) in rows:
+            template = ":".join([str(logitem) for (logitem, value) in values])
+            data = str(timestamp) + ":" + ":".join(["U" if value == None else str(value) for (logitem, value) in values])
+            for (name, arguments) in commands:
+                if name == syspartname and arguments[2] == template:
+                    arguments.append(data)
+                    break
+            else:
+                Filename = self.__fullpathname + "_" + str(syspartname) + ".rrd"
+                commands.append((syspartname, [Filename, "--template", template, data]))
+        return commands
+
+    def __update_python(self, rows):
+        """
+        updates the rrdtool-databases with the python rrdtool-binding, returns True on error.
+        """
+        error = False
+        for (syspartname, arguments) in self.__update_arguments(rows):
+            try:
+                rrdtool.update(*arguments)
+            except Exception as e:
+                error = True
+                errorstr = "db_rrdtool.update();Error;<{0}>, syspart:{1}, timestamp:{2}".format(e, syspartname, arguments[3])
+                self._logging.critical(errorstr)
+        return error
+
+    def __update_pipe(self, rows):
+        """
+        updates the rrdtool-databases with the long-living 'rrdtool -' pipe-process,
+         all commands are written at once and then the answers are read.
+         returns True on error, raises EnvironmentError if the pipe-process is not working.
+        """
+        if self.__rrdpipe == None or self.__rrdpipe.poll() != None:
+            self.__rrdpipe = subprocess.Popen([self.__rrdtool_executable, "-"],
+                                              stdin=subprocess.PIPE,
+                                              stdout=subprocess.PIPE,
+                                              universal_newlines=True)
+        commands = self.__update_arguments(rows)
+        self.__rrdpipe.stdin.write("".join(["update " + " ".join(arguments) + "\n" for (syspartname, arguments) in commands]))
+        self.__rrdpipe.stdin.flush()
+        error = False
+        for (syspartname, arguments) in commands:
+            answer = self.__rrdpipe.stdout.readline()
+            if not len(answer):
+                raise EnvironmentError("rrdtool pipe-process closed")
+            if not answer.startswith("OK"):
+                error = True
+                errorstr = "db_rrdtool.update();Error;<{0}>, syspart:{1}, timestamp:{2}".format(answer.strip(), syspartname, arguments[3])
+                self._logging.critical(errorstr)
+        return error
+
+    def __update_perl(self, rows):
+        """
+        updates the rrdtool-databases with one perl-script for all rows,
+         returns True on error.
+        """
+        try:
+            syspartname = ",".join(sorted(set([str(name) for (name, values, timestamp) in rows])))
+            itimestamp = rows[0][2]
             rrdfile = tempfile.NamedTemporaryFile()
-            filename = rrdfile.name + "_"+syspartname + ".pl"
+            filename = rrdfile.name + "_update.pl"
             self.__rrdfileh = open("{0}".format(filename), "w")
             self.__define_rrd_update_fileheader()
-            self.__define_rrd_update_filehandle(syspartname, itimestamp)
-            self.__define_rrd_update_details(syspartname, values)
+            handles = set()
+            for (name, values, timestamp) in rows:
+                self.__define_rrd_update_filehandle(name, timestamp, not name in handles)
+                self.__define_rrd_update_details(name, values)
+                handles.add(name)
             self.__rrdfileh.close()
 
             #setup executemode for file to: 'rwxr-xr-x'
@@ -214,7 +579,7 @@ class cdb_rrdtool(ht_utils.clog):
         except (ValueError, EnvironmentError, NameError, TypeError) as e:
             if not self.__rrdfileh == None:
                 self.__rrdfileh.close()
-            errorstr = 'cdb_rrdtool.update();Error;<{0}>'.format(e.args[0])
+            errorstr = 'cdb_rrdtool.__update_perl();Error;<{0}>'.format(e.args[0])
             self._logging.critical(errorstr)
             print(errorstr)
             return True
@@ -231,13 +596,14 @@ class cdb_rrdtool(ht_utils.clog):
             print(errorstr)
             raise e
 
-    def __define_rrd_update_filehandle(self, syspartname, timestamp):
+    def __define_rrd_update_filehandle(self, syspartname, timestamp, declaration=True):
         """
         """
         try:
-            Filename = self.__fullpathname + "_" + str(syspartname) + ".rrd"
-            self.__rrdfileh.write('my $DB_{0}  = "{1}";\n'.format(syspartname, Filename))
-            self.__rrdfileh.write('my ${0}_rrdh = RRDTool::OO->new(file => $DB_{0});\n'.format(syspartname))
+            if declaration:
+                Filename = self.__fullpathname + "_" + str(syspartname) + ".rrd"
+                self.__rrdfileh.write('my $DB_{0}  = "{1}";\n'.format(syspartname, Filename))
+                self.__rrdfileh.write('my ${0}_rrdh = RRDTool::OO->new(file => $DB_{0});\n'.format(syspartname))
             self.__rrdfileh.write('#\n')
             self.__rrdfileh.write('${0}_rrdh->update (\n'.format(syspartname))
             self.__rrdfileh.write('  time   => {0},\n'.format(timestamp))
@@ -366,7 +732,6 @@ class cdb_rrdtool(ht_utils.clog):
                     second_source_flag=0
                     ):
         """calling the rrdtool-draw script to create rrdtool-drawings"""
-        [hc1_mixer, hc2_mixer, hc3_mixer, hc4_mixer] = mixer_flags
         debugstr = """cdb_rrdtool.create_draw();\n
                     path2db  :{0};\n
                     path2draw:{1};\n
@@ -377,14 +742,8 @@ class cdb_rrdtool(ht_utils.clog):
                     solar_flag:{6};\n
                     second_source:{7}\n""".format(path_2_db, path_2_draw, hc_count, controller_type_nr, mixer_flags, hydsw, solar_flag, second_source_flag)
         self._logging.debug(debugstr)
-        AbsPathandFilename = os.path.abspath(os.path.normcase('./etc/rrdtool_draw.pl'))
-        Abspath2_db = ht_utils.cht_utils.Extract_HT3_path_from_AbsPath(self, path_2_db)
-        Abspath_2_draw = ht_utils.cht_utils.Extract_HT3_path_from_AbsPath(self, path_2_draw)
-
-
-        strsystemcmd1 = AbsPathandFilename+' '+Abspath2_db+' '+Abspath_2_draw+' '+str(hc_count)+' '
-        strsystemcmd2 = str(controller_type_nr)+' '+str(hc1_mixer)+' '+str(hc2_mixer)+' '+str(hc3_mixer)+' '+str(hc4_mixer)
-        strsystemcmd = strsystemcmd1 + strsystemcmd2 +' '+str(hydsw) +' '+str(solar_flag)+' '+str(second_source_flag)
+        strsystemcmd = " ".join(self.__draw_arguments(path_2_db, path_2_draw, hc_count, controller_type_nr,
+                                                      mixer_flags, hydsw, solar_flag, second_source_flag))
         self._logging.debug(strsystemcmd)
         try:
             #execute perl-script for drawing 'rrdtool' dbinfos
@@ -396,6 +755,60 @@ class cdb_rrdtool(ht_utils.clog):
             errorstr = "cdb_rrdtool.create_draw();Error; os.system-call"
             self._logging.critical(errorstr)
 
+    def __draw_arguments(self, path_2_db, path_2_draw, hc_count, controller_type_nr,
+                         mixer_flags, hydsw, solar_flag, second_source_flag):
+        """
+        returns the list of draw-script and its parameters.
+        """
+        [hc1_mixer, hc2_mixer, hc3_mixer, hc4_mixer] = mixer_flags
+        AbsPathandFilename = os.path.abspath(os.path.normcase('./etc/rrdtool_draw.pl'))
+        Abspath2_db = ht_utils.cht_utils.Extract_HT3_path_from_AbsPath(self, path_2_db)
+        Abspath_2_draw = ht_utils.cht_utils.Extract_HT3_path_from_AbsPath(self, path_2_draw)
+        return [AbsPathandFilename, Abspath2_db, Abspath_2_draw, str(hc_count), str(controller_type_nr),
+                str(hc1_mixer), str(hc2_mixer), str(hc3_mixer), str(hc4_mixer),
+                str(hydsw), str(solar_flag), str(second_source_flag)]
+
+    def save_draw_parameters(self, path_2_db, path_2_draw,
+                             hc_count=1,
+                             controller_type_nr=ht_const.CONTROLLER_TYPE_NR_Fxyz,
+                             mixer_flags=[0, 0, 0, 0],
+                             hydsw=0,
+                             solar_flag=1,
+                             second_source_flag=0
+                             ):
+        """
+        saves the parameters of 'create_draw()' for drawing on demand with 'cdb_rrdtool_graphs',
+         the file '<dbname_rrd>_draw.json' is only written if parameters are changed.
+        """
+        arguments = self.__draw_arguments(path_2_db, path_2_draw, hc_count, controller_type_nr,
+                                          mixer_flags, hydsw, solar_flag, second_source_flag)
+        if arguments == self.draw_parameters():
+            return
+        try:
+            with open(self.__draw_parameterfile, "w") as parameterfile:
+                json.dump(arguments, parameterfile)
+        except (EnvironmentError) as e:
+            errorstr = "cdb_rrdtool.save_draw_parameters();Error;<{0}>".format(e)
+            self._logging.critical(errorstr)
+
+    def draw_parameters(self):
+        """
+        returns the saved list of draw-script and parameters or None if not available.
+        """
+        return _read_draw_parameters(self.__draw_parameterfile)
+
+    def is_draw_on_demand(self):
+        """
+        returns True if draws are created on demand (configuration: <draw_on_demand>).
+        """
+        return self.__draw_on_demand
+
+    def draw_cache_seconds(self):
+        """
+        returns the time in seconds draws created on demand are reused (configuration: <draw_cache_seconds>).
+        """
+        return self.__draw_cache_seconds
+
     def __define_rrd_fileheader(self):
         """
         """
@@ -562,6 +975,204 @@ class cdb_rrdtool(ht_utils.clog):
 
 #--- class cdb_rrdtool end ---#
 
+
+class cdb_rrdtool_graphs(ht_utils.clog):
+    """
+    Class 'cdb_rrdtool_graphs' draws rrdtool-graphs on demand, used from the web-server.
+     The graphs are drawn with one long-living draw-script process ('rrdtool_draw.pl -serve')
+     using the parameters saved with 'cdb_rrdtool.save_draw_parameters()'.
+     Drawn graphs are cached for 'draw_cache_seconds' for each graph and time-range.
+     The database isn't written, only <dbname_rrd> and the draw-tags of <rrdtool-db>
+     are read from configuration.
+    """
+    # max. amount of cached graphs
+    _MAX_CACHED_GRAPHS = 64
+    # time-range units for 'graph()'
+    _RANGE_UNITS = {'h': 3600, 'd': 86400, 'w': 604800, 'm': 2592000, 'y': 31536000}
+    # default time-range is 48 hours, the same as for 'create_draw()'
+    _DEFAULT_RANGE = 2880 * 60
+
+    def __init__(self, configurationfilename, logger=None):
+        """
+        constructor of class 'cdb_rrdtool_graphs'
+         mandatory: parameter 'configurationfilename' (Path and name)
+        """
+        # init/setup logging-file
+        if logger == None:
+            ht_utils.clog.__init__(self)
+            self._logging = ht_utils.clog.create_logfile(self, logfilepath="./cdb_rrdtool.log", loggertag="cdb_rrdtool_graphs")
+        else:
+            self._logging = logger
+
+        self.__draw_on_demand = False
+        self.__draw_cache_seconds = 60
+        self.__rrdcached = ""
+        try:
+            if not isinstance(configurationfilename, str):
+                errorstr = "cdb_rrdtool_graphs();TypeError;Parameter: configurationfilename"
+                self._logging.critical(errorstr)
+                raise TypeError(errorstr)
+
+            root = ET.parse(configurationfilename).getroot()
+            dbname = root.find('dbname_rrd').text
+            if not len(dbname):
+                errorstr = "cdb_rrdtool_graphs();NameError;'dbname_rrd' not found in configuration"
+                self._logging.critical(errorstr)
+                raise NameError(errorstr)
+            # same filename as used by 'cdb_rrdtool.save_draw_parameters()'
+            if not os.path.isabs(dbname):
+                fullpathname = os.path.join(os.path.abspath("."), os.path.abspath(dbname))
+            else:
+                fullpathname = dbname
+            self.__draw_parameterfile = fullpathname + "_draw.json"
+
+            for rrdtool_part in root.findall('rrdtool-db'):
+                try:
+                    draw_on_demand = rrdtool_part.find('draw_on_demand').text.upper()
+                    self.__draw_on_demand = (draw_on_demand == 'ON' or draw_on_demand == '1')
+                except:
+                    self.__draw_on_demand = False
+                try:
+                    self.__draw_cache_seconds = max(0, int(rrdtool_part.find('draw_cache_seconds').text))
+                except:
+                    self.__draw_cache_seconds = 60
+                try:
+                    self.__rrdcached = rrdtool_part.find('rrdcached').text.strip()
+                except:
+                    self.__rrdcached = ""
+
+        except (OSError, EnvironmentError, TypeError, NameError) as e:
+            errorstr = """cdb_rrdtool_graphs();Error;<{0}>""".format(str(e.args))
+            print(errorstr)
+            self._logging.critical(errorstr)
+            raise e
+
+        self.__lock = threading.Lock()
+        self.__process = None
+        self.__parameters = None
+        # cached graphs {(graph, range_seconds):(drawtime, filename)}
+        self.__cache = {}
+        self.__cachepath = tempfile.mkdtemp(prefix="ht3_graphs_")
+
+    def __del__(self):
+        """
+        """
+        self.close()
+
+    def close(self):
+        """
+        terminates the draw-script process if running.
+        """
+        process = self.__process
+        self.__process = None
+        if process != None:
+            try:
+                process.stdin.write("quit\n")
+                process.stdin.close()
+                process.wait(5)
+            except:
+                process.kill()
+
+    def is_enabled(self):
+        """
+        returns True if draws on demand are enabled and draw-parameters are available.
+        """
+        return self.__draw_on_demand and _read_draw_parameters(self.__draw_parameterfile) != None
+
+    def cache_seconds(self):
+        """
+        returns the time in seconds a drawn graph is reused.
+        """
+        return self.__draw_cache_seconds
+
+    def range_seconds(self, timerange=""):
+        """
+        returns the time-range in seconds for strings like: '6h', '2d', '1w', '1m', '1y'
+         (default is 48 hours).
+        """
+        try:
+            timerange = str(timerange).strip().lower()
+            if timerange[-1] in cdb_rrdtool_graphs._RANGE_UNITS:
+                seconds = int(timerange[:-1]) * cdb_rrdtool_graphs._RANGE_UNITS[timerange[-1]]
+            else:
+                seconds = int(timerange)
+            return min(max(seconds, 3600), 10 * cdb_rrdtool_graphs._RANGE_UNITS['y'])
+        except (ValueError, IndexError):
+            return cdb_rrdtool_graphs._DEFAULT_RANGE
+
+    def graph(self, graphname, timerange=""):
+        """
+        returns the png-image (bytes) of graph for time-range or None if not available.
+         The image is drawn only if not cached or older then 'draw_cache_seconds'.
+         mandatory: graphname <- 'Heizgeraet', 'Warmwasser', 'Heizkreis1'...'Heizkreis4',
+                                 'Solar', 'Solarertrag' or 'Solar_second'
+         optional : timerange (default is 48 hours)
+        """
+        if not self.is_enabled():
+            return None
+        range_seconds = self.range_seconds(timerange)
+        key = (str(graphname), range_seconds)
+        with self.__lock:
+            (drawtime, filename) = self.__cache.get(key, (0, None))
+            if filename == None or time.time() - drawtime >= self.cache_seconds():
+                filename = self.__draw(graphname, range_seconds)
+                if filename == None:
+                    return None
+                self.__cache[key] = (time.time(), filename)
+                if len(self.__cache) > cdb_rrdtool_graphs._MAX_CACHED_GRAPHS:
+                    # remove the oldest graph
+                    oldest = min(self.__cache, key=lambda cachekey: self.__cache[cachekey][0])
+                    (drawtime, oldfilename) = self.__cache.pop(oldest)
+                    if oldfilename != filename and os.path.exists(oldfilename):
+                        os.remove(oldfilename)
+            try:
+                with open(filename, "rb") as image:
+                    return image.read()
+            except (EnvironmentError) as e:
+                self.__cache.pop(key, None)
+                self._logging.critical("cdb_rrdtool_graphs.graph();Error;<{0}>".format(e))
+                return None
+
+    def __draw(self, graphname, range_seconds):
+        """
+        draws the graph with the draw-script process, returns the filename or None on error.
+        """
+        parameters = _read_draw_parameters(self.__draw_parameterfile)
+        if parameters != self.__parameters:
+            # new draw-parameters, restart the process
+            self.close()
+            self.__parameters = parameters
+        if not str(graphname).replace("_", "").isalnum():
+            return None
+        filename = os.path.join(self.__cachepath, "{0}_{1}.png".format(graphname, range_seconds))
+        end_time = int(time.time()) - 60
+        try:
+            if self.__process == None or self.__process.poll() != None:
+                # rrdcached is only set for the draw-script, it flushes the cached updates
+                environment = None
+                if len(self.__rrdcached):
+                    environment = dict(os.environ, RRDCACHED_ADDRESS=self.__rrdcached)
+                self.__process = subprocess.Popen(self.__parameters + ["-serve"],
+                                                  env=environment,
+                                                  stdin=subprocess.PIPE,
+                                                  stdout=subprocess.PIPE,
+                                                  universal_newlines=True)
+            self.__process.stdin.write("{0} {1} {2} {3}\n".format(graphname, end_time - range_seconds, end_time, filename))
+            self.__process.stdin.flush()
+            answer = self.__process.stdout.readline()
+            if not answer.startswith("OK"):
+                if not len(answer):
+                    self.close()
+                self._logging.warning("cdb_rrdtool_graphs();graph:{0};{1}".format(graphname, answer.strip()))
+                return None
+            return filename
+        except (EnvironmentError, ValueError) as e:
+            self.close()
+            self._logging.critical("cdb_rrdtool_graphs.__draw();Error;<{0}>".format(e))
+            return None
+
+#--- class cdb_rrdtool_graphs end ---#
+
 ### Runs only for test ###########
 if __name__ == "__main__":
     configurationfilename = './../etc/config/4test/create_db_test.xml'
@@ -22,12 +22,32 @@
 # Ver:0.1.8  / Datum 21.09.2015 is_sql_db_enabled() now with flag-input
 # Ver:0.1.10 / Datum 25.08.2016 minor formatting changes
 # Ver:0.2    / Datum 29.08.2016 Fkt.doc added.
+# Ver:0.3    / Datum 17.10.2026 batched writing: 'insert_batched()' and 'flush()' added,
+#                                rows are written with parameterised 'executemany()'
+#                                in one transaction.
+#                               journal_mode and synchronous set on 'connect()',
+#                                configurable with: <sql-db> (default: WAL / NORMAL).
+#                               parameterised statements for 'insert()', 'delete()' and
+#                                'selectwhere()', values are stored typed (INTEGER / REAL).
+#                               'selectoldest()' added.
+#                               retention: 'cdb_sqlite_retention' deletes old rows in chunks
+#                                ('delete_chunk()') using index on UTC and incremental auto_vacuum.
+#                               optional monthly partitions: one table '<tablename>_YYYYMM' for each
+#                                month and a view '<tablename>' over all partitions (<partitioning>).
+#                               rollup-tables '<tablename>_rollup_1m|15m|1h' with min/max/avg of
+#                                numeric logitems, updated incremental with the written rows.
+#                               retention: existing databases are migrated once to incremental
+#                                auto_vacuum, UTC-index created only if missing, both after startup.
+#                               'flush()' keeps the rows on errors for the next flush,
+#                                busy-timeout for locks configurable with: <busy_timeout>.
 #################################################################
 #
 
 import sqlite3
 import time
+import calendar
 import os
+import threading
 import xml.etree.ElementTree as ET
 import ht_utils
 import logging
@@ -35,6 +55,18 @@ import logging
 
 dbNotConnectedError = ValueError('Attempting to use "db_sqlite" that is not connected')
 
+# allowed expressions for parameterised where-clauses
+_SQL_EXPRESSIONS = ('=', '==', '<', '<=', '>', '>=', '!=', '<>', 'LIKE')
+# size of sqlite3 statement-cache
+_SQL_CACHED_STATEMENTS = 256
+# sqlite result-codes (without extended part) of errors, that are retried with the next flush
+_SQL_TEMPORARY_ERRORS = ("BUSY", "LOCKED", "FULL", "IOERR", "READONLY", "CANTOPEN")
+# partition-suffix of tables, existing not partitioned tables are renamed to suffix '_000000'
+_PARTITION_FORMAT = "{0}_{1:04d}{2:02d}"
+_PARTITION_LEGACY = "000000"
+# logitem-datatypes used for rollup-tables
+_ROLLUP_DATATYPES = ('INT', 'INTEGER', 'REAL')
+
 
 class cdb_sqlite(ht_utils.clog):
     """
@@ -79,6 +111,30 @@ class cdb_sqlite(ht_utils.clog):
             self.__sql_enable = False
             self.__connection = None
             self.__cursor = None
+            # defaults for optional <sql-db> parameters
+            self.__journal_mode = "WAL"
+            self.__synchronous = "NORMAL"
+            self.__busy_timeout = 10
+            self.__batch_rows = 50
+            self.__batch_seconds = 10
+            self.__autoerase_chunk_rows = 500
+            self.__partitioned = False
+            # checked tablenames and partitions with partitioning
+            self.__partitioned_tables = set()
+            self.__partition_tables = set()
+            # rollup: resolutions in seconds, numeric columns {tablename:[(index, name),...]},
+            #  checked tables, upsert-statements and not yet written buckets
+            #  {(tablename, seconds, bucket):[samples, {index:[min, max, sum, count]}]}
+            self.__rollup_seconds = []
+            self.__rollup_columns = {}
+            self.__rollup_tables = set()
+            self.__rollup_statements = {}
+            self.__rollup_buckets = {}
+            # batched rows {tablename:[row,...]} and insert-statements {(tablename, columns):statement}
+            self.__batch = {}
+            self.__batch_count = 0
+            self.__batch_starttime = 0
+            self.__insert_statements = {}
 
             for sql_part in self.__root.findall('sql-db'):
                 self.__sql_enable = sql_part.find('enable').text.upper()
@@ -86,6 +142,40 @@ class cdb_sqlite(ht_utils.clog):
                     self.__sql_enable = True
                 else:
                     self.__sql_enable = False
+                try:
+                    self.__journal_mode = sql_part.find('journal_mode').text.upper()
+                except:
+                    self.__journal_mode = "WAL"
+                try:
+                    self.__synchronous = sql_part.find('synchronous').text.upper()
+                except:
+                    self.__synchronous = "NORMAL"
+                try:
+                    self.__busy_timeout = max(0, int(sql_part.find('busy_timeout').text))
+                except:
+                    self.__busy_timeout = 10
+                try:
+                    self.__batch_rows = max(1, int(sql_part.find('batch_rows').text))
+                except:
+                    self.__batch_rows = 50
+                try:
+                    self.__batch_seconds = max(0, int(sql_part.find('batch_seconds').text))
+                except:
+                    self.__batch_seconds = 10
+                try:
+                    self.__autoerase_chunk_rows = max(1, int(sql_part.find('autoerase_chunk_rows').text))
+                except:
+                    self.__autoerase_chunk_rows = 500
+                try:
+                    self.__partitioned = (sql_part.find('partitioning').text.upper() == 'MONTH')
+                except:
+                    self.__partitioned = False
+                try:
+                    self.__rollup_seconds = sorted(set(int(seconds) for seconds in
+                                                       sql_part.find('rollup_seconds').text.split(',')
+                                                       if int(seconds) > 0))
+                except:
+                    self.__rollup_seconds = []
 
         except (OSError, EnvironmentError, TypeError, NameError) as e:
             errorstr = """cdb_sqlite();Error;<{0}>""".format(str(e.args))
@@ -139,6 +229,9 @@ class cdb_sqlite(ht_utils.clog):
              mandatory: none
         """
         if self.__sql_enable == True:
+            # write batched rows before closing
+            if not self.__connection == None:
+                self.flush()
             try:
                 if not self.__connection == None:
                     self.__cursor.close()
@@ -158,8 +251,14 @@ class cdb_sqlite(ht_utils.clog):
         if self.__sql_enable == True:
             try:
                 if self.__connection == None:
-                    self.__connection = sqlite3.connect(self.__dbname)
+                    # waiting max. 'busy_timeout' seconds for locks of other connections (retention, httpd)
+                    self.__connection = sqlite3.connect(self.__dbname, timeout=self.__busy_timeout,
+                                                        cached_statements=_SQL_CACHED_STATEMENTS)
                     self.__cursor = self.__connection.cursor()
+                    # auto_vacuum is used only for new databases, it must be set before journal_mode
+                    self.setpragma("auto_vacuum", "= incremental")
+                    self.setpragma("journal_mode", "= " + self.__journal_mode)
+                    self.setpragma("synchronous", "= " + self.__synchronous)
             except:
                 errorstr = "cdb_sqlite.connect();Error;couldn't connect to sql-database"
                 self._logging.critical(errorstr)
@@ -177,6 +276,7 @@ class cdb_sqlite(ht_utils.clog):
             else:
                 try:
                     if not self.__connection == None:
+                        self.__rollup_write()
                         self.__connection.commit()
                 except (sqlite3.OperationalError) as e:
                     errorstr = 'cdb_sqlite.commit();Error;<{0}>'.format(e.args[0])
@@ -234,13 +334,170 @@ class cdb_sqlite(ht_utils.clog):
                 raise dbNotConnectedError
             else:
                 try:
-                    strcmd = "DELETE FROM " + tablename + " WHERE " + columnname + exp + contentvalue
-                    self.__cursor.execute(strcmd)
-                except (sqlite3.OperationalError) as e:
+                    for table in self.__tables(tablename):
+                        strcmd = "DELETE FROM " + self.__identifier(table) + " WHERE " + \
+                                 self.__identifier(columnname) + " " + self.__expression(exp) + " ?;"
+                        self.__cursor.execute(strcmd, (self.__typed(contentvalue),))
+                except (sqlite3.OperationalError, ValueError) as e:
                     errorstr = 'cdb_sqlite.delete();Error;<{0}>'.format(e.args[0])
                     self._logging.critical(errorstr)
                     print(errorstr)
 
+    def __identifier(self, name):
+        """
+            returns the quoted identifier (table- or columnname) for sql-commands.
+        """
+        return '"' + str(name).replace('"', '""') + '"'
+
+    def __expression(self, exp):
+        """
+            returns the checked expression for where-clauses, raises ValueError if not allowed.
+        """
+        expression = str(exp).strip().upper()
+        if not expression in _SQL_EXPRESSIONS:
+            raise ValueError("expression:'{0}' not allowed".format(exp))
+        return expression
+
+    def __typed(self, value):
+        """
+            returns the value typed for sql-parameters: int and float unchanged,
+             all others as string (converted with the column-affinity of sqlite).
+        """
+        if isinstance(value, (int, float)):
+            return value
+        return str(value)
+
+    def __localtime_str(self, itimestamp):
+        """
+            returns the local date/time-string for first column 'Local_date_time'.
+        """
+        localtime = time.localtime(itimestamp)
+        return """{:4d}.{:02d}.{:02d} {:02d}:{:02d}:{:02d}""".format(localtime.tm_year,
+                                                                 localtime.tm_mon,
+                                                                 localtime.tm_mday,
+                                                                 localtime.tm_hour,
+                                                                 localtime.tm_min,
+                                                                 localtime.tm_sec)
+
+    def insert_batched(self, tablename, values, timestamp=None):
+        """
+            adds values as row for table to the batch, the batch is written with 'flush()'
+             if 'batch_rows' or 'batch_seconds' from configuration are reached.
+             mandatory: tablename, values [bunch of values]
+                        to be connected to database
+            optional : timestamp (default is current Localtime and UTC are used)
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.insert_batched();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                if timestamp == None:
+                    itimestamp = int(time.time())
+                else:
+                    itimestamp = int(timestamp)
+                row = [self.__localtime_str(itimestamp), itimestamp]
+                row.extend([self.__typed(val) for val in values])
+                if self.__batch_count == 0:
+                    self.__batch_starttime = time.time()
+                self.__batch.setdefault(self.__partition_table(tablename, itimestamp), []).append(row)
+                self.__rollup_add(tablename, itimestamp, values)
+                self.__batch_count += 1
+                if self.IsFlushRequired():
+                    self.flush()
+
+    def IsFlushRequired(self):
+        """
+            returns True if batched rows are available and 'batch_rows' or 'batch_seconds' are reached.
+        """
+        if self.__batch_count == 0:
+            return False
+        return (self.__batch_count >= self.__batch_rows or
+                time.time() - self.__batch_starttime >= self.__batch_seconds)
+
+    def batch_seconds(self):
+        """
+            returns the max. time in seconds for batched rows (configuration: <batch_seconds>).
+        """
+        return self.__batch_seconds
+
+    def flush(self):
+        """
+            writes all batched rows with 'executemany()' in one transaction and commits it.
+             If the database is locked or not writable, the transaction is rolled back and
+             the rows are kept in the batch for the next flush.
+             mandatory: to be connected to database
+        """
+        if self.__sql_enable == True and self.__batch_count > 0:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.flush();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                batch = self.__batch
+                batch_count = self.__batch_count
+                rollup_buckets = self.__rollup_buckets
+                self.__batch = {}
+                self.__batch_count = 0
+                try:
+                    for (tablename, rows) in batch.items():
+                        columns = len(rows[0])
+                        for row in rows:
+                            if len(row) != columns:
+                                columns = 0
+                                break
+                        if columns:
+                            self.__cursor.executemany(self.__insert_statement(tablename, columns), rows)
+                        else:
+                            # different amount of values, write them row by row
+                            for row in rows:
+                                self.__cursor.execute(self.__insert_statement(tablename, len(row)), row)
+                    self.__rollup_write()
+                    self.__connection.commit()
+                except (sqlite3.OperationalError) as e:
+                    self.__connection.rollback()
+                    if not self.__IsTemporaryError(e):
+                        # rows would fail again, they are discarded
+                        errorstr = 'cdb_sqlite.flush();Error;<{0}>;rows discarded:{1}'.format(e.args[0], batch_count)
+                        self._logging.critical(errorstr)
+                        print(errorstr)
+                        return
+                    # keep rows and rollup-values for next flush, batch is empty after reset
+                    self.__batch = batch
+                    self.__batch_count = batch_count
+                    self.__batch_starttime = time.time()
+                    self.__rollup_buckets = rollup_buckets
+                    errorstr = 'cdb_sqlite.flush();Error;<{0}>;rows kept for retry:{1}'.format(e.args[0], batch_count)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+                except (sqlite3.IntegrityError) as e:
+                    # rows would fail again, they are discarded
+                    self.__connection.rollback()
+                    errorstr = 'cdb_sqlite.flush();Error;<{0}>;rows discarded:{1}'.format(e.args[0], batch_count)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def __IsTemporaryError(self, error):
+        """
+            returns True if the sqlite-error is temporary (locked, busy, disk full or I/O),
+             so the statement can be repeated later, else False.
+        """
+        errorname = getattr(error, "sqlite_errorname", None)
+        if errorname != None:
+            return errorname.split('_')[1] in _SQL_TEMPORARY_ERRORS
+        message = str(error.args[0]).lower()
+        return any(text in message for text in ("locked", "busy", "disk", "i/o"))
+
+    def __insert_statement(self, tablename, columns):
+        """
+            returns the parameterised insert-statement for table with amount of columns.
+        """
+        key = (tablename, columns)
+        statement = self.__insert_statements.get(key)
+        if statement == None:
+            statement = """INSERT INTO {0} VALUES({1});""".format(self.__identifier(tablename), ",".join(["?"] * columns))
+            self.__insert_statements[key] = statement
+        return statement
+
     def insert(self, tablename, values, timestamp=None):
         """
             insert values in table using sql-commands
@@ -257,22 +514,12 @@ class cdb_sqlite(ht_utils.clog):
                     itimestamp = int(time.time())
                 else:
                     itimestamp = int(timestamp)
-                localtime = time.localtime(itimestamp)
                 # first column:='Local_date_time' default set to Local-time
-                __strdatetime="""{:4d}.{:02d}.{:02d} {:02d}:{:02d}:{:02d}""".format(localtime.tm_year, \
-                                                                                    localtime.tm_mon, \
-                                                                                    localtime.tm_mday, \
-                                                                                    localtime.tm_hour, \
-                                                                                    localtime.tm_min, \
-                                                                                    localtime.tm_sec)
-
-                strcmd = """INSERT INTO '{0}' VALUES('{1}','{2}',{3});""".format(
-                    tablename,
-                    __strdatetime,
-                    itimestamp,
-                    ",".join("""'{0}'""".format(str(val).replace('"', '""')) for val in values))
+                row = [self.__localtime_str(itimestamp), itimestamp]
+                row.extend([self.__typed(val) for val in values])
                 try:
-                    self.__cursor.execute(strcmd)
+                    self.__cursor.execute(self.__insert_statement(self.__partition_table(tablename, itimestamp), len(row)), row)
+                    self.__rollup_add(tablename, itimestamp, values)
                 except (sqlite3.OperationalError) as e:
                     errorstr = 'cdb_sqlite.insert();Error;<{0}>'.format(e.args[0])
                     self._logging.critical(errorstr)
@@ -303,15 +550,61 @@ class cdb_sqlite(ht_utils.clog):
             else:
                 # function returns the a list of values or empty list on none match
                 try:
-                    strcmd = "SELECT " + what + " FROM " + tablename + " WHERE " + columnname + " " + exp + " " + searchvalue + ";"
-                    return list(self.__cursor.execute(strcmd))
-                except (sqlite3.OperationalError) as e:
+                    strcmd = "SELECT " + what + " FROM " + self.__identifier(tablename) + " WHERE " + \
+                             self.__identifier(columnname) + " " + self.__expression(exp) + " ?;"
+                    return list(self.__cursor.execute(strcmd, (self.__typed(searchvalue),)))
+                except (sqlite3.OperationalError, ValueError) as e:
                     errorstr = 'cdb_sqlite.selectwhere();Error;<{0}>'.format(e.args[0])
                     self._logging.critical(errorstr)
                     print(errorstr)
         else:
             return list()
 
+    def hasindex(self, indexname):
+        """
+            returns True if index is available in database, else False.
+             mandatory: indexname
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.hasindex();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    strcmd = "SELECT name FROM sqlite_master WHERE type='index' AND name=?;"
+                    return self.__cursor.execute(strcmd, (indexname,)).fetchone() != None
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.hasindex();Error;<{0}>;Index<{1}>'.format(e.args[0], indexname)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return False
+
+    def selectoldest(self, tablename, columnname="UTC"):
+        """
+            returns the lowest value of column in table or None if table is empty
+             mandatory: tablename
+                        to be connected to database
+            optional : columnname (default is 'UTC')
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.selectoldest();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    # partitions are sorted by time, the first not empty one has the lowest value
+                    for table in self.__tables(tablename):
+                        strcmd = "SELECT MIN(" + self.__identifier(columnname) + ") FROM " + self.__identifier(table) + ";"
+                        oldest = self.__cursor.execute(strcmd).fetchone()[0]
+                        if oldest != None:
+                            return oldest
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.selectoldest();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return None
+
     def setpragma(self, pragmaname, pragmavalue):
         """
             Set pragma for the database using sql-commands
@@ -369,6 +662,464 @@ class cdb_sqlite(ht_utils.clog):
                     self._logging.critical(errorstr)
                     print(errorstr)
 
+    def delete_chunk(self, tablename, columnname, contentvalue, chunk_rows):
+        """
+            delete max. 'chunk_rows' rows with the lowest values in column, if less then contentvalue.
+             returns the amount of deleted rows.
+             mandatory: tablename, columnname, contentvalue, chunk_rows
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.delete_chunk();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    deleted = 0
+                    for table in self.__tables(tablename):
+                        strcmd = "DELETE FROM " + self.__identifier(table) + " WHERE rowid IN (SELECT rowid FROM " + \
+                                 self.__identifier(table) + " WHERE " + self.__identifier(columnname) + \
+                                 " < ? ORDER BY " + self.__identifier(columnname) + " LIMIT ?);"
+                        deleted += self.__cursor.execute(strcmd, (self.__typed(contentvalue), int(chunk_rows) - deleted)).rowcount
+                        if deleted >= int(chunk_rows):
+                            break
+                    return deleted
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.delete_chunk();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return 0
+
+    def auto_vacuum(self):
+        """
+            returns the auto_vacuum mode of database (0:none, 1:full, 2:incremental)
+             or None if not available.
+             mandatory: to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.auto_vacuum();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    return int(self.__cursor.execute("PRAGMA auto_vacuum;").fetchone()[0])
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.auto_vacuum();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return None
+
+    def enable_incremental_vacuum(self):
+        """
+            sets auto_vacuum:=incremental for an existing database. The mode is changed
+             only with a complete 'VACUUM', the database is locked while running it.
+             mandatory: to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.enable_incremental_vacuum();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    # 'VACUUM' isn't possible within a transaction
+                    self.__connection.commit()
+                    self.__cursor.execute("PRAGMA auto_vacuum = incremental;")
+                    self.__cursor.execute("VACUUM")
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.enable_incremental_vacuum();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def incremental_vacuum(self, pages=0):
+        """
+            releases free pages of database (all if pages is 0), requires auto_vacuum:=incremental.
+             mandatory: to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.incremental_vacuum();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    # executescript() runs the pragma to the end, each step releases one page
+                    self.__cursor.executescript("PRAGMA incremental_vacuum({0});".format(int(pages)))
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.incremental_vacuum();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def autoerase_chunk_rows(self):
+        """
+            returns the max. amount of rows deleted in one transaction by retention.
+        """
+        return self.__autoerase_chunk_rows
+
+    def is_partitioned(self):
+        """
+            returns True if tables are partitioned by month (configuration: <partitioning>).
+        """
+        return self.__partitioned
+
+    def partitionname(self, tablename, timestamp):
+        """
+            returns the name of the monthly partition for table and UTC-timestamp.
+        """
+        utctime = time.gmtime(int(timestamp))
+        return _PARTITION_FORMAT.format(tablename, utctime.tm_year, utctime.tm_mon)
+
+    def partitions(self, tablename, utc_from=None, utc_to=None):
+        """
+            returns the sorted names of partitions for table, optional only the partitions
+             with rows in timerange 'utc_from' ... 'utc_to'.
+             mandatory: tablename
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.partitions();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    strcmd = "SELECT name FROM sqlite_master WHERE type='table' AND name GLOB ? ORDER BY name;"
+                    pattern = str(tablename).replace('[', '[[]').replace('*', '[*]').replace('?', '[?]') + "_" + "[0-9]" * 6
+                    partitions = []
+                    for (name,) in self.__cursor.execute(strcmd, (pattern,)).fetchall():
+                        (start, end) = self.__partition_range(name)
+                        if utc_from != None and end != None and end <= int(utc_from):
+                            continue
+                        if utc_to != None and start > int(utc_to):
+                            continue
+                        partitions.append(name)
+                    return partitions
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.partitions();Error;<{0}>'.format(e.args[0])
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return list()
+
+    def __partition_range(self, partitionname):
+        """
+            returns the UTC-range (start, end) of a partition, end is None for the
+             renamed not partitioned table.
+        """
+        suffix = partitionname[-6:]
+        if suffix == _PARTITION_LEGACY:
+            return (0, None)
+        (year, month) = (int(suffix[:4]), int(suffix[4:]))
+        start = calendar.timegm((year, month, 1, 0, 0, 0))
+        if month == 12:
+            (year, month) = (year + 1, 1)
+        else:
+            month += 1
+        return (start, calendar.timegm((year, month, 1, 0, 0, 0)))
+
+    def __tables(self, tablename):
+        """
+            returns the tables with rows of 'tablename': the partitions or the table itself.
+        """
+        if self.__partitioned:
+            self.__partition_setup(tablename)
+            return self.partitions(tablename)
+        return [tablename]
+
+    def __partition_table(self, tablename, itimestamp):
+        """
+            returns the table for writing a row with timestamp, the partition
+             is created if not yet available.
+        """
+        if not self.__partitioned:
+            return tablename
+        partitionname = self.partitionname(tablename, itimestamp)
+        if not partitionname in self.__partition_tables:
+            self.__partition_setup(tablename)
+            self.createpartition(tablename, partitionname)
+            self.__partition_tables.add(partitionname)
+        return partitionname
+
+    def __partition_setup(self, tablename):
+        """
+            renames an existing not partitioned table to the first partition '<tablename>_000000',
+             the rows are then available in the view.
+        """
+        if tablename in self.__partitioned_tables:
+            return
+        try:
+            strcmd = "SELECT type FROM sqlite_master WHERE name = ?;"
+            result = self.__cursor.execute(strcmd, (tablename,)).fetchone()
+            if result != None and result[0] == 'table':
+                legacyname = tablename + "_" + _PARTITION_LEGACY
+                self.__cursor.execute("ALTER TABLE " + self.__identifier(tablename) + " RENAME TO " + self.__identifier(legacyname) + ";")
+                self.createview(tablename)
+                self._logging.info("cdb_sqlite.__partition_setup();table:<{0}> renamed to:<{1}>".format(tablename, legacyname))
+            self.__partitioned_tables.add(tablename)
+        except (sqlite3.OperationalError) as e:
+            errorstr = 'cdb_sqlite.__partition_setup();Error;<{0}>;Table<{1}>'.format(e.args[0], tablename)
+            self._logging.critical(errorstr)
+            print(errorstr)
+
+    def __columns(self, tablename):
+        """
+            returns the columns [(name, type),...] of table after 'Local_date_time' and 'UTC',
+             taken from configuration or from the newest partition.
+        """
+        columns = []
+        for syspart in self.__root.findall('systempart'):
+            if syspart.attrib["name"] == tablename:
+                for logitem in syspart.findall('logitem'):
+                    columns.append((logitem.attrib["name"], logitem.find('datatype').text.upper()))
+                return columns
+        partitions = self.partitions(tablename)
+        if len(partitions):
+            strcmd = "PRAGMA table_info ({0})".format(self.__identifier(partitions[-1]))
+            for info in self.__cursor.execute(strcmd).fetchall()[2:]:
+                columns.append((info[1], info[2]))
+        return columns
+
+    def createpartition(self, tablename, partitionname):
+        """
+            creating partition of table with indexes and recreate the view, if not exists.
+             mandatory: tablename, partitionname
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.createpartition();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    strcmd = "SELECT name FROM sqlite_master WHERE type='table' AND name = ?;"
+                    if self.__cursor.execute(strcmd, (partitionname,)).fetchone() == None:
+                        columns = ["Local_date_time CURRENT_TIMESTAMP", "UTC INT"]
+                        for (name, columntype) in self.__columns(tablename):
+                            columns.append(self.__identifier(name) + " " + columntype)
+                        self.__cursor.execute("CREATE TABLE IF NOT EXISTS " + self.__identifier(partitionname) +
+                                              " (" + ", ".join(columns) + ");")
+                        self.__cursor.execute("CREATE INDEX IF NOT EXISTS " + self.__identifier("idate_time_" + partitionname) +
+                                              " ON " + self.__identifier(partitionname) + "(Local_date_time);")
+                        self.__cursor.execute("CREATE INDEX IF NOT EXISTS " + self.__identifier("iutc_" + partitionname) +
+                                              " ON " + self.__identifier(partitionname) + "(UTC);")
+                        self.createview(tablename)
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.createpartition();Error;<{0}>;Table<{1}>'.format(e.args[0], partitionname)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def rollupname(self, tablename, seconds):
+        """
+            returns the name of the rollup-table for table and resolution in seconds,
+             like: 'heizgeraet_rollup_15m'.
+        """
+        seconds = int(seconds)
+        if seconds % 3600 == 0:
+            return "{0}_rollup_{1}h".format(tablename, seconds // 3600)
+        elif seconds % 60 == 0:
+            return "{0}_rollup_{1}m".format(tablename, seconds // 60)
+        return "{0}_rollup_{1}s".format(tablename, seconds)
+
+    def rollup_seconds(self):
+        """
+            returns the resolutions of rollup-tables in seconds (configuration: <rollup_seconds>).
+        """
+        return list(self.__rollup_seconds)
+
+    def __rollup_numeric_columns(self, tablename):
+        """
+            returns the numeric GAUGE-columns [(index, name),...] of table from configuration,
+             index is the position in the inserted values.
+        """
+        columns = self.__rollup_columns.get(tablename)
+        if columns == None:
+            columns = []
+            for syspart in self.__root.findall('systempart'):
+                if syspart.attrib["name"] == tablename:
+                    for (index, logitem) in enumerate(syspart.findall('logitem')):
+                        if (logitem.find('datatype').text.upper() in _ROLLUP_DATATYPES and
+                                logitem.find('datause').text.upper() == 'GAUGE'):
+                            columns.append((index, logitem.attrib["name"]))
+            self.__rollup_columns[tablename] = columns
+        return columns
+
+    def __rollup_add(self, tablename, itimestamp, values):
+        """
+            adds the numeric values to the not yet written rollup-buckets of table.
+        """
+        if not len(self.__rollup_seconds):
+            return
+        columns = self.__rollup_numeric_columns(tablename)
+        if not len(columns):
+            return
+        for seconds in self.__rollup_seconds:
+            key = (tablename, seconds, itimestamp - itimestamp % seconds)
+            bucket = self.__rollup_buckets.get(key)
+            if bucket == None:
+                bucket = [0, {}]
+                self.__rollup_buckets[key] = bucket
+            bucket[0] += 1
+            aggregates = bucket[1]
+            for (index, name) in columns:
+                if index >= len(values):
+                    break
+                value = values[index]
+                if not isinstance(value, (int, float)):
+                    continue
+                aggregate = aggregates.get(index)
+                if aggregate == None:
+                    aggregates[index] = [value, value, value, 1]
+                else:
+                    if value < aggregate[0]:
+                        aggregate[0] = value
+                    if value > aggregate[1]:
+                        aggregate[1] = value
+                    aggregate[2] += value
+                    aggregate[3] += 1
+
+    def __rollup_write(self):
+        """
+            writes the collected rollup-buckets, buckets already available in the
+             rollup-table are merged (min/max and weighted avg).
+        """
+        if not len(self.__rollup_buckets):
+            return
+        buckets = self.__rollup_buckets
+        self.__rollup_buckets = {}
+        rows = {}
+        for ((tablename, seconds, bucket), (samples, aggregates)) in buckets.items():
+            row = [bucket, self.__localtime_str(bucket), samples]
+            for (index, name) in self.__rollup_numeric_columns(tablename):
+                aggregate = aggregates.get(index)
+                if aggregate == None:
+                    row.extend([None, None, None])
+                else:
+                    row.extend([aggregate[0], aggregate[1], aggregate[2] / aggregate[3]])
+            rows.setdefault((tablename, seconds), []).append(row)
+        for ((tablename, seconds), tablerows) in rows.items():
+            self.__cursor.executemany(self.__rollup_statement(tablename, seconds), tablerows)
+
+    def __rollup_statement(self, tablename, seconds):
+        """
+            returns the upsert-statement for rollup-table, the table is created if not yet available.
+        """
+        key = (tablename, seconds)
+        statement = self.__rollup_statements.get(key)
+        if statement == None:
+            rollupname = self.rollupname(tablename, seconds)
+            self.createrollup(tablename, seconds)
+            columns = ["UTC", "Local_date_time", "samples"]
+            updates = ["Local_date_time = excluded.Local_date_time", "samples = samples + excluded.samples"]
+            for (index, name) in self.__rollup_numeric_columns(tablename):
+                (cmin, cmax, cavg) = [self.__identifier(name + suffix) for suffix in ("_min", "_max", "_avg")]
+                columns.extend([cmin, cmax, cavg])
+                updates.append("{0} = COALESCE(MIN({0}, excluded.{0}), {0}, excluded.{0})".format(cmin))
+                updates.append("{0} = COALESCE(MAX({0}, excluded.{0}), {0}, excluded.{0})".format(cmax))
+                updates.append("{0} = COALESCE(({0} * samples + excluded.{0} * excluded.samples) / "
+                               "(samples + excluded.samples), {0}, excluded.{0})".format(cavg))
+            statement = "INSERT INTO " + self.__identifier(rollupname) + " (" + ", ".join(columns) + ") VALUES(" + \
+                        ",".join(["?"] * len(columns)) + ") ON CONFLICT(UTC) DO UPDATE SET " + ", ".join(updates) + ";"
+            self.__rollup_statements[key] = statement
+        return statement
+
+    def createrollup(self, tablename, seconds):
+        """
+            creating rollup-table of table for resolution in seconds if not exists, missing
+             columns are added. Columns: 'UTC' (begin of interval), 'Local_date_time',
+             'samples' and '<logitem>_min', '<logitem>_max', '<logitem>_avg'.
+             mandatory: tablename, seconds
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.createrollup();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                rollupname = self.rollupname(tablename, seconds)
+                if rollupname in self.__rollup_tables:
+                    return
+                try:
+                    self.__cursor.execute("CREATE TABLE IF NOT EXISTS " + self.__identifier(rollupname) +
+                                          " (UTC INT PRIMARY KEY, Local_date_time CURRENT_TIMESTAMP, samples INT);")
+                    strcmd = "PRAGMA table_info ({0})".format(self.__identifier(rollupname))
+                    available = set(info[1] for info in self.__cursor.execute(strcmd).fetchall())
+                    for (index, name) in self.__rollup_numeric_columns(tablename):
+                        for suffix in ("_min", "_max", "_avg"):
+                            if not (name + suffix) in available:
+                                self.__cursor.execute("ALTER TABLE " + self.__identifier(rollupname) + " ADD COLUMN " +
+                                                      self.__identifier(name + suffix) + " REAL;")
+                    self.__rollup_tables.add(rollupname)
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.createrollup();Error;<{0}>;Table<{1}>'.format(e.args[0], rollupname)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def createview(self, tablename):
+        """
+            (re)creating the view 'tablename' over all partitions, so queries to 'tablename'
+             are working as with not partitioned tables.
+             Columns not available in older partitions are set to NULL.
+             mandatory: tablename
+                        to be connected to database
+        """
+        if self.__sql_enable == True:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.createview();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    partitions = self.partitions(tablename)
+                    columns = []
+                    partition_columns = {}
+                    for partitionname in partitions:
+                        strcmd = "PRAGMA table_info ({0})".format(self.__identifier(partitionname))
+                        partition_columns[partitionname] = set()
+                        for info in self.__cursor.execute(strcmd).fetchall():
+                            partition_columns[partitionname].add(info[1])
+                            if not info[1] in columns:
+                                columns.append(info[1])
+                    selects = []
+                    for partitionname in partitions:
+                        selectcolumns = []
+                        for column in columns:
+                            if column in partition_columns[partitionname]:
+                                selectcolumns.append(self.__identifier(column))
+                            else:
+                                selectcolumns.append("NULL AS " + self.__identifier(column))
+                        selects.append("SELECT " + ", ".join(selectcolumns) + " FROM " + self.__identifier(partitionname))
+                    self.__cursor.execute("DROP VIEW IF EXISTS " + self.__identifier(tablename) + ";")
+                    if len(selects):
+                        self.__cursor.execute("CREATE VIEW " + self.__identifier(tablename) + " AS " +
+                                              " UNION ALL ".join(selects) + ";")
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.createview();Error;<{0}>;View<{1}>'.format(e.args[0], tablename)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+
+    def drop_partitions(self, tablename, time_limit):
+        """
+            drops the partitions of table with all rows older then 'time_limit' (UTC)
+             and recreates the view. Returns the amount of dropped partitions.
+             mandatory: tablename, time_limit
+                        to be connected to database
+        """
+        dropped = 0
+        if self.__sql_enable == True and self.__partitioned:
+            if self.__connection == None:
+                self._logging.critical("cdb_sqlite.drop_partitions();Error;database not connected")
+                raise dbNotConnectedError
+            else:
+                try:
+                    for partitionname in self.partitions(tablename):
+                        (start, end) = self.__partition_range(partitionname)
+                        if end != None and end <= int(time_limit):
+                            self.__cursor.execute("DROP TABLE IF EXISTS " + self.__identifier(partitionname) + ";")
+                            self.__partition_tables.discard(partitionname)
+                            dropped += 1
+                    if dropped > 0:
+                        self.createview(tablename)
+                except (sqlite3.OperationalError) as e:
+                    errorstr = 'cdb_sqlite.drop_partitions();Error;<{0}>;Table<{1}>'.format(e.args[0], tablename)
+                    self._logging.critical(errorstr)
+                    print(errorstr)
+        return dropped
+
     #---------------------
     def createdb_sqlite(self):
         """
@@ -383,14 +1134,22 @@ class cdb_sqlite(ht_utils.clog):
             else:
                 try:
                     #first of all (before table-creation) set pragma auto_vacuum
-                    self.setpragma("auto_vacuum", "= full")
+                    # free pages are released with 'incremental_vacuum()'
+                    self.setpragma("auto_vacuum", "= incremental")
 
                     for syspart in self.__root.findall('systempart'):
                         syspartname = syspart.attrib["name"]
-                        # create table
-                        self.createtable(syspartname)
-                        # set index for first column 'data_time'
-                        self.createindex(syspartname, "idate_time", "Local_date_time")
+                        if self.__partitioned:
+                            # create partition of current month (with indexes) and view 'syspartname'
+                            tablename = self.__partition_table(syspartname, time.time())
+                        else:
+                            tablename = syspartname
+                            # create table
+                            self.createtable(syspartname)
+                            # set index for first column 'data_time'
+                            self.createindex(syspartname, "idate_time", "Local_date_time")
+                            # set index for column 'UTC' used for retention
+                            self.createindex(syspartname, "iutc_" + syspartname, "UTC")
 
                         for logitem in syspart.findall('logitem'):
                             name = logitem.attrib["name"]
@@ -400,7 +1159,12 @@ class cdb_sqlite(ht_utils.clog):
                             default = logitem.find('default').text
                             unit = logitem.find('unit').text
                     #        print(name,datatype,datause,maxvalue,default,unit)
-                            self.addcolumn(syspartname, name, datatype.upper())
+                            self.addcolumn(tablename, name, datatype.upper())
+                        if self.__partitioned:
+                            self.createview(syspartname)
+                        if len(self.__rollup_numeric_columns(syspartname)):
+                            for seconds in self.__rollup_seconds:
+                                self.createrollup(syspartname, seconds)
                     self.commit()
                 except (sqlite3.OperationalError, EnvironmentError) as e:
                     errorstr = 'create_db.sqlite();Error;<{0}>'.format(e.args[0])
@@ -438,6 +1202,127 @@ class cdb_sqlite(ht_utils.clog):
 
 #--- class cdb_sqlite end ---#
 
+
+class cdb_sqlite_retention(threading.Thread):
+    """
+    Class 'cdb_sqlite_retention' deletes rows older then 'erase_seconds' from tables.
+     The thread uses its own connection and deletes in chunks of 'autoerase_chunk_rows',
+     each chunk in its own transaction, so inserts of other threads are not blocked
+     for long. Free pages are released with incremental vacuum.
+     With monthly partitions the old partitions are dropped, only the rows of the
+     oldest remaining partition are deleted in chunks.
+    """
+    def __init__(self, configurationfilename, tablenames, erase_seconds, logger=None, interval=120, dbfilename=None):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.__cfgfilename = configurationfilename
+        self.__tablenames = list(tablenames)
+        self.__erase_seconds = int(erase_seconds)
+        self.__interval = interval
+        self.__dbfilename = dbfilename
+        self.__stop_event = threading.Event()
+        self._logging = logger
+
+    def stop(self):
+        """
+            stops the thread after the current chunk.
+        """
+        self.__stop_event.set()
+
+    def erase(self, database, time_limit=None):
+        """
+            deletes rows with UTC less then 'time_limit' (default: current time - erase_seconds)
+             from all tables and releases the free pages. Returns the amount of deleted rows.
+        """
+        if time_limit == None:
+            time_limit = int(time.time()) - self.__erase_seconds
+        deleted = 0
+        dropped = 0
+        for tablename in self.__tablenames:
+            # partitions with only old rows are dropped at once
+            dropped += database.drop_partitions(tablename, time_limit)
+            database.commit()
+            oldest_UTC = database.selectoldest(tablename, "UTC")
+            if oldest_UTC == None or int(oldest_UTC) >= time_limit:
+                continue
+            while not self.__stop_event.is_set():
+                count = database.delete_chunk(tablename, "UTC", time_limit, database.autoerase_chunk_rows())
+                database.commit()
+                deleted += count
+                if count < database.autoerase_chunk_rows():
+                    break
+                # give other threads the chance to write
+                time.sleep(0.01)
+            if self._logging != None:
+                self._logging.info("cdb_sqlite_retention();table:<{0}> deleted where UTC is less then:<{1}>".format(tablename, time_limit))
+        if deleted > 0 or dropped > 0:
+            database.incremental_vacuum()
+            database.commit()
+        return deleted
+
+    def __createindex(self, database):
+        """
+            creates the index on UTC for existing not partitioned tables (partitions are
+             created with index). Creating needs some time for large tables and locks
+             the database, so it is done only if the index isn't yet available.
+        """
+        if database.is_partitioned():
+            return
+        for tablename in self.__tablenames:
+            if self.__stop_event.is_set():
+                break
+            indexname = "iutc_" + tablename
+            if not database.hasindex(indexname):
+                if self._logging != None:
+                    self._logging.info("cdb_sqlite_retention();creating index:<{0}>".format(indexname))
+                database.createindex(tablename, indexname, "UTC")
+                database.commit()
+
+    def __migrate_auto_vacuum(self, database):
+        """
+            one-time migration of existing database without auto_vacuum to
+             auto_vacuum:=incremental, required for releasing free pages in 'erase()'.
+        """
+        if database.auto_vacuum() == 0 and not self.__stop_event.is_set():
+            if self._logging != None:
+                self._logging.info("cdb_sqlite_retention();one-time migration to auto_vacuum:=incremental with 'VACUUM'")
+            starttime = time.time()
+            database.enable_incremental_vacuum()
+            if self._logging != None:
+                self._logging.info("cdb_sqlite_retention();migration done, auto_vacuum:{0};duration:{1:.1f}s".format(
+                    database.auto_vacuum(), time.time() - starttime))
+
+    def run(self):
+        """
+            worker thread: checks every 'interval' seconds for old rows and deletes them.
+             Index-creation and auto_vacuum-migration of existing databases are done
+             after the first interval and not at startup, writing rows is retried
+             by 'cdb_sqlite.flush()' while the database is locked.
+        """
+        database = cdb_sqlite(self.__cfgfilename, logger=self._logging)
+        if self.__dbfilename != None:
+            database.db_sqlite_filename(self.__dbfilename)
+        database.connect()
+        maintenance_done = False
+        try:
+            while not self.__stop_event.wait(self.__interval):
+                try:
+                    if not maintenance_done:
+                        self.__createindex(database)
+                    deleted = self.erase(database)
+                    if deleted > 0 and self._logging != None:
+                        self._logging.info("cdb_sqlite_retention();rows deleted:{0}".format(deleted))
+                    if not maintenance_done:
+                        # after first erase, so the deleted rows aren't copied by 'VACUUM'
+                        self.__migrate_auto_vacuum(database)
+                        maintenance_done = True
+                except (sqlite3.OperationalError, ValueError) as e:
+                    if self._logging != None:
+                        self._logging.critical("cdb_sqlite_retention();Error; {0}".format(e))
+        finally:
+            database.close()
+#--- class cdb_sqlite_retention end ---#
+
 ### Runs only for test ###########
 if __name__ == "__main__":
     configurationfilename = './../etc/config/4test/create_db_test.xml'
@@ -70,6 +70,7 @@
 #                           from 8088 to 48088
 #                           see Issue: #13
 # Ver:0.4.1  / 2021-03-12  Release-File imported
+# Ver:0.4.2  / 2026-10-17  logitem 'hexdump' rendered with str().
 #################################################################
 #
 
@@ -86,8 +87,8 @@ import ht_release
 
 __author__ = "junky-zs"
 __status__ = "draft"
-__version__ = "0.4.1"
-__date__ = "2021-03-12"
+__version__ = "0.4.2"
+__date__ = "2026-10-17"
 
 
 class gui_cworker(ht_utils.clog):
@@ -379,7 +380,7 @@ class gui_cworker(ht_utils.clog):
         str_controller = " Regler-Typ  : {0:11.11}| Bus-Typ        : {1}\n".format(self.__gdata.controller_type(), self.__gdata.bus_type())
         self.__text.insert("end", str_controller)
         if (self.__gdata.IsSyspartUpdate(nickname) and self.__hexdump_window):
-            temptext = self.__gdata.values(nickname, "hexdump")
+            temptext = str(self.__gdata.values(nickname, "hexdump"))
             temptext += "\n"
             self.__hextext.insert("end", temptext, "b_gray")
 
@@ -585,12 +586,12 @@ class gui_cworker(ht_utils.clog):
 
 
         if (self.__gdata.IsSyspartUpdate(nickname_HG) and self.__hexdump_window):
-            temptext = self.__gdata.values(nickname_HG, "hexdump")
+            temptext = str(self.__gdata.values(nickname_HG, "hexdump"))
             temptext += "\n"
             self.__hextext.insert("end", temptext, "b_or")
 
         if (self.__gdata.IsSyspartUpdate(nickname_WW) and self.__hexdump_window):
-            temptext = self.__gdata.values(nickname_WW, "hexdump")
+            temptext = str(self.__gdata.values(nickname_WW, "hexdump"))
             temptext += "\n"
             self.__hextext.insert("end", temptext, "b_bl")
 
@@ -698,7 +699,7 @@ class gui_cworker(ht_utils.clog):
                 if len(temptext) > 0: self.__text.insert("end", temptext)
 
         if (self.__gdata.IsSyspartUpdate(nickname) and self.__hexdump_window):
-            temptext = self.__gdata.values(nickname, "hexdump")
+            temptext = str(self.__gdata.values(nickname, "hexdump"))
             temptext += "\n"
             self.__hextext.insert("end", temptext, "b_or")
 
@@ -793,7 +794,7 @@ class gui_cworker(ht_utils.clog):
                 if len(temptext) > 0: self.__text.insert("end", temptext)
 
             if (self.__gdata.IsSyspartUpdate(nickname) and self.__hexdump_window):
-                temptext = self.__gdata.values(nickname, "hexdump")
+                temptext = str(self.__gdata.values(nickname, "hexdump"))
                 temptext += "\n"
                 self.__hextext.insert("end", temptext, "b_mocca")
 
@@ -908,7 +909,7 @@ class gui_cworker(ht_utils.clog):
             ##
 
         if (self.__gdata.IsSyspartUpdate(nickname) and self.__hexdump_window):
-            temptext = self.__gdata.values(nickname, "hexdump")
+            temptext = str(self.__gdata.values(nickname, "hexdump"))
             temptext += "\n"
             self.__hextext.insert("end", temptext, "b_bl")
 
@@ -1016,7 +1017,7 @@ class gui_cworker(ht_utils.clog):
                 if len(temptext) > 0: self.__text.insert("end", temptext)
 
             if (self.__gdata.IsSyspartUpdate(nickname) and self.__hexdump_window):
-                temptext=self.__gdata.values(nickname, "hexdump")
+                temptext=str(self.__gdata.values(nickname, "hexdump"))
                 temptext += "\n"
                 self.__hextext.insert("end", temptext, "b_gr")
 
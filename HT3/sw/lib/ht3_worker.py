@@ -37,6 +37,10 @@
 # Ver:0.3.1  / Datum 08.01.2019 __Autocreate_draw() removed, db_rrdtool.create_draw() replacement
 # Ver:0.3.2  / Datum 03.12.2019 Issue:'Deprecated property InterCharTimeout #7'
 #                                port.setInterCharTimeout() removed
+# Ver:0.3.3  / Datum 17.10.2026 sqlite-rows are written batched with 'insert_batched()'.
+#                               autoerasing and '__GetOldestEntry()' replaced with thread 'cdb_sqlite_retention'.
+#                               rrdtool-updates of all systemparts with 'step_update()'.
+#                               draw-parameters saved for drawing on demand (<draw_on_demand>).
 #################################################################
 
 import sys
@@ -123,7 +127,6 @@ class ht3_cworker(object):
         self.__inputfile = ht3_cworker._gdata.inputtestfilepath()
         if len(self.__inputfile) < 5:
             self.__inputfile = ""
-        self.__autoerasechecktime = int(time.time()) + 120
 
     def __del__(self):
         """
@@ -214,63 +217,6 @@ class ht3_cworker(object):
             self._logging.info("ht3_cworker.run(); End   ----------------------")
             quit()
 
-    def __Autoerasing_sqlitedb(self, h_database):
-        """
-        check sqlite database for the oldest entries and delete them if time_limit is reached.
-        """
-        if int(time.time()) >= int(self.__autoerasechecktime):
-            time_limit = int(time.time()) - int(ht3_cworker._gdata.Sqlite_autoerase_seconds())
-            # get oldest UTC in database
-            firstentry_UTC = self.__GetOldestEntry(h_database)
-            if firstentry_UTC == None:
-                firstentry_UTC = int(time.time())
-
-            if firstentry_UTC < time_limit:
-                debugstr = "Autoerasing_sqlitedb(); UTCs current:{0}; oldest in db:{1}; limit:{2}".format(int(time.time()), firstentry_UTC, time_limit)
-                self._logging.info(debugstr)
-
-                try:
-                    debugstr = "sqlite-db autoerasing started;  time:{0}".format(int(time.time()))
-                    self._logging.info(debugstr)
-                    # erase old datacontend in sqlite-db
-                    for systempartname in ht3_cworker._gdata.syspartnames():
-                        h_database.delete(systempartname, "UTC", str(time_limit), "<")
-                        debugstr = "table-content:<{0}> deleted where UTC is less then:<{1}>".format(systempartname, time_limit)
-                        self._logging.info(debugstr)
-                    # cleanup db
-                    h_database.vacuum()
-                    debugstr = "sqlite-db autoerasing finished; time:{0}".format(int(time.time()))
-                    self._logging.info(debugstr)
-                except (sqlite3.OperationalError, ValueError) as e:
-                    errorstr = "ht3_cworker.__Autoerasing_sqlitedb();Error; {0}".format(e)
-                    self._logging.critical(errorstr)
-
-            # setup next check-time
-            self.__autoerasechecktime = int(time.time()) + 120
-
-    def __GetOldestEntry(self, h_database):
-        """
-           try to find the first timestamp-entry in column 'UTC' and table
-            'heizgeraet' and return the value. If not found then return 'None'
-             search - excample:
-              SELECT UTC FROM heizgeraet WHERE UTC NOT NULL ORDER UTC ASC
-        """
-        sqlsearchstring = "NOT NULL"
-        sqlorderbystring = "ORDER BY UTC ASC"
-        rtnvalue = None
-        try:
-            selectrtn = h_database.selectwhere('heizgeraet', 'UTC', sqlorderbystring, sqlsearchstring, 'UTC')
-            if not selectrtn == []:
-                for valuetmp in list(selectrtn):
-                    # get first UTC-timestamp
-                    rtnvalue = int(valuetmp[0:1][0])
-                    break
-        except (sqlite3.OperationalError, ValueError) as e:
-            errorstr = "ht3_cworker.__GetOldestEntry();Error; {0}".format(e)
-            self._logging.critical(errorstr)
-            rtnvalue = None
-        return rtnvalue
-
     def __DispatchThread(self, parameter):
         """
             Dispatch-Thread: open databases if required and storing the results in db.
@@ -281,20 +227,25 @@ class ht3_cworker(object):
         rrdtooldb = None
         nextTimeStep = time.time()
         nextTimeautocreate = time.time()
-        sqlite_autoerase = False
+        retention = None
 
         # get db-instance
         database = db_sqlite.cdb_sqlite(self.__cfgfilename, logger=self._logging)
         database.connect()
 
-        # set flag for erasing sqlite-db if enabled
+        # start thread for erasing sqlite-db if enabled
         if database.is_sql_db_enabled() and ht3_cworker._gdata.Sqlite_autoerase_seconds() > 0:
-            sqlite_autoerase = True
+            retention = db_sqlite.cdb_sqlite_retention(self.__cfgfilename,
+                                                       ht3_cworker._gdata.syspartnames(),
+                                                       ht3_cworker._gdata.Sqlite_autoerase_seconds(),
+                                                       logger=self._logging)
+            retention.start()
 
         if ht3_cworker._gdata.is_db_rrdtool_enabled():
             try:
                 rrdtooldb = db_rrdtool.cdb_rrdtool(self.__cfgfilename, logger=self._logging)
                 rrdtooldb.createdb_rrdtool()
+                rrdtooldb.step_layout(ht3_cworker._gdata)
                 # setup the first 'nextTimeStep' to 3 times stepseconds waiting for valid data
                 nextTimeStep = time.time() + int(ht3_cworker._gdata.db_rrdtool_stepseconds()) * 3
             except:
@@ -313,23 +264,17 @@ class ht3_cworker(object):
             (nickname, value) = rawdata.discoder()
             if value != None:
                 if database.is_sql_db_enabled():
-                    database.insert(str(ht3_cworker._gdata.getlongname(nickname)), value)
-                    database.commit()
+                    database.insert_batched(str(ht3_cworker._gdata.getlongname(nickname)), value)
 
                 if ht3_cworker._gdata.is_db_rrdtool_enabled() and rrdtooldb != None:
                     # write data to rrdtool-db after 'stepseconds' seconds
                     if time.time() >= nextTimeStep:
                         # setup next timestep
                         nextTimeStep = time.time() + int(ht3_cworker._gdata.db_rrdtool_stepseconds())
-                        # update rrdtool database
-                        for syspartshortname in rrdtooldb.syspartnames():
-                            if syspartshortname.upper() == 'DT':
-                                continue
-                            syspartname = rrdtooldb.syspartnames()[syspartshortname]
-                            itemvalue_array = ht3_cworker._gdata.getall_sorted_items_with_values(syspartshortname)
-                            error = rrdtooldb.update(syspartname, itemvalue_array, time.time())
-                            if error:
-                                self._logging.critical("rrdtooldb.update();Error;syspartname:{0}".format(syspartname))
+                        # update rrdtool database, all systemparts with one call
+                        error = rrdtooldb.step_update(ht3_cworker._gdata, time.time())
+                        if error:
+                            self._logging.critical("rrdtooldb.step_update();Error")
 
                 if ht3_cworker._gdata.is_db_rrdtool_enabled() and ht3_cworker._gdata.IsAutocreate_draw() > 0:
                     if time.time() >= nextTimeautocreate:
@@ -338,17 +283,29 @@ class ht3_cworker(object):
                         # create draw calling script
                         (db_path, dbfilename) = ht3_cworker._gdata.db_rrdtool_filepathname()
                         (html_path, filename) = ht3_cworker._gdata.db_rrdtool_filepathname('.')
-                        rrdtooldb.create_draw(db_path, html_path,
-                                              ht3_cworker._gdata.heatercircuits_amount(),
-                                              ht3_cworker._gdata.controller_type_nr(),
-                                              ht3_cworker._gdata.GetAllMixerFlags(),
-                                              int(ht3_cworker._gdata.IsTempSensor_Hydrlic_Switch()),
-                                              int(ht3_cworker._gdata.IsSolarAvailable()),
-                                              int(ht3_cworker._gdata.IsSecondCollectorValue_SO()))
-                if sqlite_autoerase:
-                    self.__Autoerasing_sqlitedb(database)
+                        if rrdtooldb.is_draw_on_demand():
+                            # draws are created from web-server, save only the parameters
+                            rrdtooldb.save_draw_parameters(db_path, html_path,
+                                                           ht3_cworker._gdata.heatercircuits_amount(),
+                                                           ht3_cworker._gdata.controller_type_nr(),
+                                                           ht3_cworker._gdata.GetAllMixerFlags(),
+                                                           int(ht3_cworker._gdata.IsTempSensor_Hydrlic_Switch()),
+                                                           int(ht3_cworker._gdata.IsSolarAvailable()),
+                                                           int(ht3_cworker._gdata.IsSecondCollectorValue_SO()))
+                        else:
+                            rrdtooldb.create_draw(db_path, html_path,
+                                                  ht3_cworker._gdata.heatercircuits_amount(),
+                                                  ht3_cworker._gdata.controller_type_nr(),
+                                                  ht3_cworker._gdata.GetAllMixerFlags(),
+                                                  int(ht3_cworker._gdata.IsTempSensor_Hydrlic_Switch()),
+                                                  int(ht3_cworker._gdata.IsSolarAvailable()),
+                                                  int(ht3_cworker._gdata.IsSecondCollectorValue_SO()))
 
         #close db at the end of thread
+        if retention != None:
+            retention.stop()
+        if rrdtooldb != None:
+            rrdtooldb.close()
         database.close()
 
 #--- class ht3_cworker end ---#
@@ -0,0 +1,201 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 Norbert S. <junky-zs@gmx.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / Datum 17.10.2026 first release
+#                               offline replay of binary bus-logfiles
+#                               (written from ht_binlogclient.py) to
+#                               records, sqlite-db or csv-files.
+#                               records before first date/time-message get the time of
+#                                that message if no 'starttime' is given (not the file-time).
+#################################################################
+
+import os
+import csv
+import time
+import data
+import db_sqlite
+import ht_discode
+import ht_utils
+
+__author__ = "junky-zs"
+__status__ = "draft"
+__version__ = "0.1"
+__date__ = "17.10.2026"
+
+
+class cht_replay(ht_utils.clog):
+    """
+        class cht_replay decoding a binary bus-logfile as fast as possible.
+         There is no GUI and no realtime-handling, the decoded messages
+         are returned as records: (timestamp, nickname, values).
+         The timestamp is taken from the last decoded bus date/time-message,
+         before that message is found the 'starttime' is used. Without
+         'starttime' these first records get the time of the first
+         date/time-message.
+    """
+    def __init__(self, configurationfilename, logger=None):
+        """
+            constructor of class 'cht_replay'
+             mandatory: parameter 'configurationfilename' (Path and name)
+        """
+        try:
+            # init/setup logging-file
+            if logger == None:
+                ht_utils.clog.__init__(self)
+                self._logging = ht_utils.clog.create_logfile(self, "./cht_replay.log", loggertag="cht_replay")
+            else:
+                self._logging = logger
+        except:
+            errorstr = "cht_replay();Error;could not create logfile"
+            print(errorstr)
+            raise EnvironmentError(errorstr)
+
+        if not isinstance(configurationfilename, str):
+            errorstr = "cht_replay();TypeError;Parameter: configurationfilename"
+            self._logging.critical(errorstr)
+            raise TypeError(errorstr)
+
+        self.__cfgfilename = configurationfilename
+        self.__gdata = data.cdata()
+        try:
+            self.__gdata.read_db_config(self.__cfgfilename, self._logging)
+        except:
+            errorstr = "cht_replay();Error;could not get configuration-values"
+            self._logging.critical(errorstr)
+            print(errorstr)
+            raise
+
+    def __bustime_2_utc(self, default_utc):
+        """
+            returns the UTC-timestamp from decoded bus date/time-values.
+             returns 'default_utc' if date/time is not yet available.
+        """
+        try:
+            timestring = "{0} {1}".format(self.__gdata.values("DT", "Date"), self.__gdata.values("DT", "Time"))
+            return int(time.mktime(time.strptime(timestring, "%d.%m.%Y %H:%M:%S")))
+        except (ValueError, TypeError, OverflowError):
+            return default_utc
+
+    def records(self, binlogfilename, starttime=None):
+        """
+            generator returning decoded records from binary bus-logfile
+             as tuple: (timestamp, nickname, values)
+             mandatory: binlogfilename
+             optional : starttime (UTC used until first bus date/time-message,
+                                   default is the time of that first message,
+                                   without date/time-message the modification-time of file)
+        """
+        # records decoded before the first date/time-message, if no 'starttime' is given
+        pending = None
+        if starttime == None:
+            pending = []
+            timestamp = None
+        else:
+            timestamp = int(starttime)
+        with open(binlogfilename, "rb") as filehandle:
+            decoder = ht_discode.cht_discode(None, self.__gdata, filehandle=filehandle, logger=self._logging)
+            while not decoder.IsEndOfFile():
+                (nickname, values) = decoder.discoder()
+                if values != None:
+                    if nickname == "DT":
+                        timestamp = self.__bustime_2_utc(timestamp)
+                    if timestamp == None:
+                        pending.append((nickname, list(values)))
+                        continue
+                    if pending:
+                        for (pending_nickname, pending_values) in pending:
+                            yield (timestamp, pending_nickname, pending_values)
+                        pending = None
+                    yield (timestamp, nickname, list(values))
+        if pending:
+            # no date/time-message in file, the file-time is the end of capture
+            timestamp = int(os.path.getmtime(binlogfilename))
+            for (pending_nickname, pending_values) in pending:
+                yield (timestamp, pending_nickname, pending_values)
+
+    def replay_2_sqlite(self, binlogfilename, dbfilename=None, commit_rows=5000, starttime=None):
+        """
+            decoding binary bus-logfile and writing the records to sqlite-db.
+             The db is created if not available, commit is done every 'commit_rows'.
+             mandatory: binlogfilename
+             optional : dbfilename  (default is 'dbname_sqlite' from configuration)
+                        commit_rows (default is 5000)
+                        starttime   (see: records())
+             returns the number of written records.
+        """
+        database = db_sqlite.cdb_sqlite(self.__cfgfilename, logger=self._logging)
+        database.is_sql_db_enabled(True)
+        if dbfilename != None:
+            database.db_sqlite_filename(dbfilename)
+        create_db = not database.is_sqlite_db_available()
+        database.connect()
+        if create_db:
+            database.createdb_sqlite()
+
+        count = 0
+        try:
+            for (timestamp, nickname, values) in self.records(binlogfilename, starttime):
+                database.insert(str(self.__gdata.getlongname(nickname)), values, timestamp)
+                count += 1
+                if count % commit_rows == 0:
+                    database.commit()
+            database.commit()
+        finally:
+            database.close()
+        self._logging.info("cht_replay.replay_2_sqlite(); records:{0}; db:{1}".format(count, database.db_sqlite_filename()))
+        return count
+
+    def replay_2_csv(self, binlogfilename, csvpathname, starttime=None):
+        """
+            decoding binary bus-logfile and writing the records to csv-files,
+             one file for each nickname: '<csvpathname>/<nickname>.csv'.
+             The first line is the header with 'UTC' and the logitem-names.
+             mandatory: binlogfilename, csvpathname
+             optional : starttime (see: records())
+             returns the number of written records.
+        """
+        if not os.path.isdir(csvpathname):
+            os.makedirs(csvpathname)
+        filehandles = {}
+        writers = {}
+        count = 0
+        try:
+            for (timestamp, nickname, values) in self.records(binlogfilename, starttime):
+                if not nickname in writers:
+                    filehandles[nickname] = open(os.path.join(csvpathname, nickname + ".csv"), "w", newline="")
+                    writers[nickname] = csv.writer(filehandles[nickname])
+                    writers[nickname].writerow(["UTC"] + self.__gdata.getall_sorted_logitem_names(nickname))
+                writers[nickname].writerow([timestamp] + values)
+                count += 1
+        finally:
+            for filehandle in filehandles.values():
+                filehandle.close()
+        self._logging.info("cht_replay.replay_2_csv(); records:{0}; path:{1}".format(count, csvpathname))
+        return count
+
+#--- class cht_replay end ---#
+
+### Runs only for test ###########
+if __name__ == "__main__":
+    import sys
+    configurationfilename = './../etc/config/4test/HT3_4dispatcher_test.xml'
+    binlogfilename = sys.argv[1] if len(sys.argv) > 1 else './../var/log/ht_binlog.log'
+    replay = cht_replay(configurationfilename)
+    for (timestamp, nickname, values) in replay.records(binlogfilename):
+        print("{0};{1};{2}".format(timestamp, nickname, values))
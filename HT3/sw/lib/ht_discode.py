@@ -85,9 +85,32 @@
 # Ver:0.3.2  / Datum 08.09.2020 modified 'msgID_51_DomesticHotWater' for storing 'T-Soll max'
 #                               no decoding if length is <= 8 for EMS2 heating-circuit messages.
 #                               'msgID_52_DomesticHotWater()' modified handling for not available sensor-values.
+# Ver:0.3.3  / Datum 17.10.2026 cht_discode: bulk-read of interface-data into input-buffer,
+#                                 '_read_rawdata()' fills rawbuffer blockwise.
+#                               IsEndOfFile() added for file-input (used by replay).
+#                               cht_decode: table-driven field-extraction 'msgid_fieldspecs{}'
+#                                used for msgID:24, 25, 27, 53, 162, 188, 467, 468, 677...680,
+#                                737...740, 747...750 and 868.
+#                               'chexdump' added, hexdump is rendered only if requested
+#                                and can be disabled in configuration: <decoder><hexdump>
+#                               RAW-mode: CRC-search with single pass 'crc_search()'.
+#                               'crawbuffer' used for read bus-data, payloads are
+#                                handed to the msgID-decoders as memoryview.
+#                               device-address and messageID lookup-tables compiled at start,
+#                                table-entries configurable with: <decoder>.
+#                               'cdecode_statistics' added for frame-, error- and decode-time counters.
+#                               cht_decode: compiled fields are using the value-slots of cdata.
+#                               decoded values are published as snapshot after each message.
+#                               'chexdump' compared by value (msgid, offset, tag, raw-bytes),
+#                                repr() is the hexdump-text.
+#                               exceptions in decode-functions are logged and counted as 'decoder_decode_errors'.
+#                               'last_message()' added, key and raw-bytes hash of last dispatched message.
 #################################################################
 
 import serial
+import logging
+import time
+import threading
 import data
 import db_sqlite
 import ht_utils
@@ -96,8 +119,240 @@ import ht_proxy_if
 
 __author__ = "junky-zs"
 __status__ = "draft"
-__version__ = "0.3.2"
-__date__ = "08.09.2020"
+__version__ = "0.3.3"
+__date__ = "17.10.2026"
+
+
+class chexdump(object):
+    """
+        class chexdump holding the raw message-bytes for the logitem 'hexdump'.
+         The hexdump-text is rendered only if requested with: str().
+    """
+    __slots__ = ("msgid", "offset", "tag", "rawbytes")
+
+    def __init__(self, msgtuple, tag, buffer, length):
+        (self.msgid, self.offset) = msgtuple
+        self.tag = tag
+        self.rawbytes = bytes(buffer[0:length])
+
+    def __key(self):
+        return (self.msgid, self.offset, self.tag, self.rawbytes)
+
+    def __eq__(self, other):
+        if not isinstance(other, chexdump):
+            return NotImplemented
+        return self.__key() == other.__key()
+
+    def __ne__(self, other):
+        rtnvalue = self.__eq__(other)
+        return rtnvalue if rtnvalue is NotImplemented else not rtnvalue
+
+    def __hash__(self):
+        return hash(self.__key())
+
+    def __str__(self):
+        return "{0:4}_{1:<2}:{2:3}:".format(self.msgid, self.offset, self.tag) + \
+               "".join(format(value, "02x") + " " for value in self.rawbytes)
+
+    # printed value-lists are showing the hexdump-text
+    __repr__ = __str__
+
+
+class crawbuffer(object):
+    """
+        class crawbuffer holding the read bus-bytes for 'cht_discode'.
+         Consumed bytes are only skipped by moving the head-index, the
+         storage is compacted if the skipped part gets large.
+         Payloads are handed out as memoryview-windows without copying.
+         Remark: windows must be released (use: 'with') before the
+                 buffer is changed with 'extend()' or 'consume()'.
+    """
+    # storage is compacted if at least this number of bytes are consumed
+    _COMPACT_SIZE = 4096
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._head = 0
+
+    def __len__(self):
+        return len(self._buffer) - self._head
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("crawbuffer;index out of range")
+        return self._buffer[self._head + index]
+
+    def extend(self, data):
+        """
+            appends 'data' to the end of buffer.
+        """
+        self._buffer += data
+
+    def consume(self, size):
+        """
+            removes 'size' bytes from the start of buffer.
+        """
+        self._head = min(self._head + size, len(self._buffer))
+        if self._head == len(self._buffer):
+            del self._buffer[:]
+            self._head = 0
+        elif self._head >= crawbuffer._COMPACT_SIZE:
+            del self._buffer[:self._head]
+            self._head = 0
+
+    def find(self, sequence, start=0):
+        """
+            returns the index of the first found 'sequence', else -1.
+        """
+        index = self._buffer.find(bytes(sequence), self._head + start)
+        return index - self._head if index >= 0 else -1
+
+    def window(self, start=0, size=None):
+        """
+            returns a memoryview-window to the buffer-content beginning at 'start'
+             with max. 'size' bytes (default: up to end of buffer).
+        """
+        start += self._head
+        end = len(self._buffer) if size == None else min(start + size, len(self._buffer))
+        return memoryview(self._buffer)[start:end]
+
+
+class cdecode_statistics(object):
+    """
+        class cdecode_statistics holding the counters of 'cht_discode':
+         frames, CRC-failures, discarded resync-bytes, unknown/rejected messages,
+         decode-errors,
+         and for each messageID the count and a histogram of decode-times.
+         The values are read from other threads (SPS_if, mqtt, signal-dump).
+    """
+    # upper limits of decode-time histogram-buckets in microseconds, last bucket is open
+    HISTOGRAM_LIMITS_US = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    # nickname and item-names used for publishing the summary-values
+    NICKNAME = "STAT"
+    SUMMARY_NAMES = ("decoder_uptime", "decoder_frames", "decoder_frames_per_second",
+                     "decoder_crc_failures", "decoder_resync_bytes",
+                     "decoder_unknown", "decoder_rejected", "decoder_decode_errors",
+                     "decoder_decodetime_avg_us")
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+            sets all counters to zero.
+        """
+        with self.__lock:
+            self.__starttime = time.time()
+            self.__frames = 0
+            self.__crc_failures = 0
+            self.__resync_bytes = 0
+            self.__unknown = 0
+            self.__rejected = 0
+            self.__decode_errors = 0
+            self.__decodetime = 0.0
+            # msgid:[count, decodetime, [histogram-buckets]]
+            self.__msgid_stats = {}
+
+    def frame(self, msgid, decodetime):
+        """
+            counts one decoded frame for 'msgid' with decodetime in seconds.
+        """
+        decodetime_us = decodetime * 1000000
+        bucket = 0
+        for limit in cdecode_statistics.HISTOGRAM_LIMITS_US:
+            if decodetime_us <= limit:
+                break
+            bucket += 1
+        with self.__lock:
+            self.__frames += 1
+            self.__decodetime += decodetime
+            msgid_stat = self.__msgid_stats.get(msgid)
+            if msgid_stat == None:
+                msgid_stat = [0, 0.0, [0] * (len(cdecode_statistics.HISTOGRAM_LIMITS_US) + 1)]
+                self.__msgid_stats[msgid] = msgid_stat
+            msgid_stat[0] += 1
+            msgid_stat[1] += decodetime
+            msgid_stat[2][bucket] += 1
+
+    def crc_failure(self):
+        """
+            counts one message-candidate with wrong CRC.
+        """
+        self.__crc_failures += 1
+
+    def resync_bytes(self, count=1):
+        """
+            counts bytes discarded while searching for the next message.
+        """
+        self.__resync_bytes += count
+
+    def unknown(self):
+        """
+            counts one message handled by 'msgID_NN_unknown()'.
+        """
+        self.__unknown += 1
+
+    def rejected(self):
+        """
+            counts one message with valid CRC, but not valid or blacklisted messageID.
+        """
+        self.__rejected += 1
+
+    def decode_error(self):
+        """
+            counts one message with exception in the decode-function.
+        """
+        self.__decode_errors += 1
+
+    def summary(self):
+        """
+            returns the summary-values as dict using the names: 'SUMMARY_NAMES'.
+        """
+        with self.__lock:
+            uptime = max(time.time() - self.__starttime, 0.001)
+            frames = self.__frames
+            decodetime = self.__decodetime
+        return {"decoder_uptime": int(uptime),
+                "decoder_frames": frames,
+                "decoder_frames_per_second": round(frames / uptime, 2),
+                "decoder_crc_failures": self.__crc_failures,
+                "decoder_resync_bytes": self.__resync_bytes,
+                "decoder_unknown": self.__unknown,
+                "decoder_rejected": self.__rejected,
+                "decoder_decode_errors": self.__decode_errors,
+                "decoder_decodetime_avg_us": round(decodetime * 1000000 / frames, 1) if frames > 0 else 0.0}
+
+    def summary_values(self):
+        """
+            returns the summary-values as list sorted like: 'SUMMARY_NAMES'.
+        """
+        summary = self.summary()
+        return [summary[name] for name in cdecode_statistics.SUMMARY_NAMES]
+
+    def msgid_statistics(self):
+        """
+            returns a copy of the messageID-statistics as dict:
+             {msgid:(count, decodetime in seconds, (histogram-buckets))}
+        """
+        with self.__lock:
+            return dict((msgid, (count, decodetime, tuple(histogram)))
+                        for (msgid, (count, decodetime, histogram)) in self.__msgid_stats.items())
+
+    def dump(self):
+        """
+            returns all statistic-values as multiline text.
+        """
+        lines = ["{0:26}: {1}".format(name, value) for (name, value) in self.summary().items()]
+        limits = ["<={0}us".format(limit) for limit in cdecode_statistics.HISTOGRAM_LIMITS_US]
+        limits.append(">{0}us".format(cdecode_statistics.HISTOGRAM_LIMITS_US[-1]))
+        lines.append("msgid;count;avg_us;" + ";".join(limits))
+        for (msgid, (count, decodetime, histogram)) in sorted(self.msgid_statistics().items()):
+            lines.append("{0};{1};{2:.1f};".format(msgid, count, decodetime * 1000000 / count) +
+                         ";".join(str(value) for value in histogram))
+        return "\n".join(lines)
 
 
 class cht_decode(ht_utils.cht_utils):
@@ -105,6 +360,167 @@ class cht_decode(ht_utils.cht_utils):
         class cht_decode for decoding heatronic heater-messages.
     """
     oldcrc_8800bc = 0
+
+    ####################################
+    # flags for field-specification
+    _FS_MAXCHECK = 0x01  # value is checked with maxvalue from configuration
+    _FS_BIT      = 0x02  # value is 1 if any masked bit is set, else 0
+    _FS_NONZERO  = 0x04  # value is only stored if > 0
+    _FS_DEBUG    = 0x08  # value is only written to debug-output, logitem is the debug-name
+
+    ####################################
+    # fields of heating-circuit messages, used for all circuits
+    _FIELDS_677_680 = (
+        (6, 2, "Tist_HK", 10, 0, _FS_MAXCHECK),
+        (12, 1, "Tsoll_HK", 2, 0, 0),
+        (17, 1, "Vtempera_niveau", 1, 0, 0),
+        (27, 1, "Voperation_status", 1, 0, 0),
+    )
+    _FIELDS_737_740 = (
+        (6, 1, "season", 1, 0, _FS_DEBUG),
+        (7, 1, "supply_T", 1, 0, _FS_DEBUG),
+        (8, 1, "power", 1, 0, _FS_DEBUG),
+        (9, 1, "fast_mode", 1, 0, _FS_DEBUG),
+        (10, 1, "Prio", 1, 0, _FS_DEBUG),
+    )
+
+    ####################################
+    # field-specifications for table-driven message decoding
+    #  msgid: (nickname, first_payload_index, (fields))
+    #   field := (raw_index, width, logitem, divisor, mask, flags)
+    #    raw_index: byte-index in message (including the message-offset)
+    #    width    : number of bytes (big endian)
+    #    divisor  : value is divided (float) if not 1
+    #    mask     : bitmask for value, 0 := unused
+    #   Not in this table are messages with values depending on other bytes or
+    #   the source-device (nickname, validity-flags, 0x7000/0x89/255 markers,
+    #   temperature-range checks), with non big-endian values (msgID:873, 910, 913)
+    #   and hexdump-only messages, these are still decoded in 'msgID_NN_...()'.
+    msgid_fieldspecs = {
+        24: ("HG", 4, (
+            (4, 1, "Tvorlauf_soll", 1, 0, _FS_MAXCHECK),
+            (5, 2, "Tvorlauf_ist", 10, 0, _FS_MAXCHECK),
+            (8, 1, "Vleistung", 1, 0, 0),
+            (9, 1, "Vmodus", 1, 0x03, 0),
+            #   Bitfeld Byte 9: (Bits von rechts LSB gezaehlt - beginnt mit 1)
+            #   Bit8: Status Wartungsanforderung    := 0/1
+            #   Bit7: Status blockierender Fehler   := 0/1
+            #   Bit6: Status verriegelnder Fehler   := 0/1
+            #   Bit5: Status Aufheizphase d. HG     := 0/1
+            #   Bit4: Brennerflamme an              := 0/1
+            #   Bit3: Status Servicebetrieb         := 0/1
+            #   Bit2: Warmwasser-Mode deaktiv/aktiv := 0/1
+            #   Bit1: Heizungs  -Mode deaktiv/aktiv := 0/1
+            (9, 1, "Vbrenner_flamme", 1, 0x08, _FS_BIT),
+            #   Bitfeld Byte 10:
+            #   Bit8: Status Waermeanforderung im Test-modus
+            #   Bit7: Status Waermeanforderung
+            #   Bit6: Status WWErkennung
+            #   Bit5: Status interne Waermeanforderung bei WW
+            #   Bit4: Status Waermeanforderung fuer WW bei BArt:=Frost
+            #   Bit3: Status Waermeanforderung bei BArt:=Frost
+            #   Bit2: Status Waermeanforderung am Schalter
+            #   Bit1: Status Waermeanforderung im Heizbetrieb
+            (10, 1, "Byte10", 1, 0, _FS_DEBUG),
+            #   Bitfeld Byte 11:
+            #   Bit8: Status Zirkulationspumpe Warmwasser
+            #   Bit7: Status des 3-Wege Ventils 1 := Warmwasser
+            #   Bit6: Status Heizungspumpe
+            #   Bit5: Status des Oelvorwaermer (Gas := 0)
+            #   Bit4: Zuendung des Brenners
+            #   Bit3: Status des Luefter;
+            #   Bit2: 2. Brennstufe
+            #   Bit1: 1. Brennstufe; waehrend Verbrennung 1 mit kurzem Vor- und Nachlauf
+            (11, 1, "Vbrenner_motor", 1, 0x01, _FS_BIT),
+            (11, 1, "Vheizungs_pumpe", 1, 0x20, _FS_BIT),
+            (11, 1, "Vspeicher_pumpe", 1, 0x40, _FS_BIT),
+            (11, 1, "Vzirkula_pumpe", 1, 0x80, _FS_BIT),
+            # current temperatur on storage-cell temp-sensor1
+            (13, 2, "Tmischer", 10, 0, _FS_MAXCHECK),
+            # current temperatur on storage-cell temp-sensor2
+            (15, 2, "T2-buffer", 10, 0, _FS_DEBUG),
+            (17, 2, "Truecklauf", 10, 0, _FS_MAXCHECK),
+            (19, 2, "I-current", 10, 0, _FS_DEBUG),
+            (21, 1, "pressure", 1, 0, _FS_DEBUG),
+            # displaycode: byte22 * 65536 + byte23 * 256
+            (22, 3, "V_displaycode", 1, 0xffff00, _FS_NONZERO),
+            (24, 2, "V_causecode", 1, 0, _FS_NONZERO),
+            (26, 1, "WW-flow", 1, 0, _FS_DEBUG),
+            #   Bitfeld Byte 27:
+            #   Bit6: Status Brenner Relais
+            #   Bit5: Status Zirkulationspumpe
+            #   Bit4: Status Relais im UM
+            #   Bit3: Status Waermepumpe
+            #   Bit2: Status Magnetventil
+            #   Bit1: Status Speicherladepumpe
+            (27, 1, "Byte27", 1, 0, _FS_DEBUG),
+            #   Bitfeld Byte 28:
+            #   Bit8: Status Tastensprerre
+            #   Bit7: test active
+            #   Bit6: Status heater blocked
+            #   Bit5: Status burner start
+            #   Bit4: Status burner enable
+            #   Bit3: Status burner blocking
+            #   Bit2: Status Schaltmodul UM
+            #   Bit1: Status Fuellfunktion
+            (28, 1, "Byte28", 1, 0, _FS_DEBUG),
+            (29, 2, "TAbgass", 10, 0, _FS_DEBUG),
+        )),
+        25: ("HG", 4, (
+            # Rev.: 0.1.7 https://www.mikrocontroller.net/topic/324673#3970615
+            (13, 1, "V_spare1", 1, 0, 0),
+            (14, 3, "Cbrenner_gesamt", 1, 0, 0),
+            # operating-time: minutes -> hours
+            (17, 3, "Cbetrieb_gesamt", 60, 0, 0),
+            # not yet written to database, only for debug-purposes
+            (20, 3, "betriebszeit_2.Stufe", 1, 0, _FS_DEBUG),
+            (23, 3, "Cbetrieb_heizung", 60, 0, 0),
+            (26, 3, "Cbrenner_heizung", 1, 0, 0),
+        )),
+        27: ("WW", 4, (
+            (4, 1, "Tsoll", 1, 0, _FS_MAXCHECK),
+        )),
+        # 'Tsoll' on raw_index:7 is not decoded here, the controller sends
+        #  this message to the heater and the heater responds with msgID:52.
+        53: ("WW", 4, ()),
+        162: ("HG", 4, (
+            (4, 3, "V_displaycode", 1, 0, 0),
+            (7, 2, "V_causecode", 1, 0, 0),
+        )),
+        188: ("HG", 4, (
+            (4, 2, "Toben_puffer", 10, 0, _FS_DEBUG),
+            (6, 2, "Tunten_puffer", 10, 0, _FS_DEBUG),
+            (8, 2, "Tvorlauf_verfluessiger", 10, 0, _FS_DEBUG),
+            (10, 2, "Truecklauf_verfluessiger", 10, 0, _FS_DEBUG),
+            (12, 1, "Betriebsstatus Waermepumpe", 1, 0x01, _FS_DEBUG),
+            (13, 1, "Betriebsstatus Verdichter", 1, 0x02, _FS_DEBUG),
+        )),
+        467: ("WW", 6, (
+            (6, 1, "WW1-Sofort;Anforderung", 1, 0x08, _FS_BIT | _FS_DEBUG),
+        )),
+        468: ("WW", 6, (
+            (6, 1, "WW1-Sofort;Anforderung", 1, 0x08, _FS_BIT | _FS_DEBUG),
+        )),
+        677: ("HK1", 6, _FIELDS_677_680),
+        678: ("HK2", 6, _FIELDS_677_680),
+        679: ("HK3", 6, _FIELDS_677_680),
+        680: ("HK4", 6, _FIELDS_677_680),
+        737: ("HK1", 6, _FIELDS_737_740),
+        738: ("HK2", 6, _FIELDS_737_740),
+        739: ("HK3", 6, _FIELDS_737_740),
+        740: ("HK4", 6, _FIELDS_737_740),
+        # Frostdanger message, hexdump only
+        747: ("HK1", 6, ()),
+        748: ("HK2", 6, ()),
+        749: ("HK3", 6, ()),
+        750: ("HK4", 6, ()),
+        868: ("SO", 6, (
+            (9, 1, "Vspeicher_voll", 1, 0x01, _FS_BIT),
+            (9, 1, "Vkollektor_aus", 1, 0x02, _FS_BIT),
+            (15, 1, "solarpump power", 1, 0, _FS_DEBUG),
+        )),
+    }
+
     def __init__(self, gdata, logger=None):
         ht_utils.cht_utils.__init__(self)
         try:
@@ -129,8 +545,11 @@ class cht_decode(ht_utils.cht_utils):
         self.__info_zeit = "--:--:--"
         # save data-object
         self.__gdata = gdata
+        self.__hexdump_enabled = gdata.IsHexdump_enabled()
         # setup data to already available logging-object
         self.__gdata.setlogger(self._logging)
+        # values are published after each decoded message, see: '_publish()'
+        self.__gdata.deferred_publish(True)
         # set default-values HG
         self.__gdata.update("HG", "Tvorlauf_soll", 0)
         self.__gdata.update("HG", "Tvorlauf_ist", 0.0)
@@ -171,6 +590,125 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.update("SO", "Vsolar_pumpe", 0)
 
         self.__currentHK_nickname = "HK1"
+        # compile field-specifications once
+        self._compiled_fieldspecs = self.__compile_fieldspecs(cht_decode.msgid_fieldspecs)
+        self.__gdata.publish()
+
+    def _publish(self, nickname):
+        """
+            publishes the modified values of all systemparts as snapshots,
+             returns the published values for 'nickname'.
+        """
+        self.__gdata.publish()
+        return self.__gdata.values(nickname) if len(nickname) else None
+
+    def __compile_fieldspecs(self, fieldspecs):
+        """
+            returns the compiled field-specifications.
+             The maxvalue- and default-values from configuration are resolved
+             for each field, the fields are sorted by 'raw_index'.
+             compiled field := (raw_index, width, logitem, divisor, mask, flags, maxvalue, default, slot)
+             'slot' is None if the logitem isn't available in configuration.
+        """
+        compiled = {}
+        for (msgid, (nickname, first_payload_index, fields)) in fieldspecs.items():
+            compiled_fields = []
+            for (raw_index, width, logitem, divisor, mask, flags) in sorted(fields, key=lambda field: field[0]):
+                if width < 1 or width > 4:
+                    errorstr = "cht_decode.__compile_fieldspecs();Error;msgid:{0};logitem:{1};width:{2}".format(msgid, logitem, width)
+                    self._logging.critical(errorstr)
+                    raise ValueError(errorstr)
+                maxvalue = None
+                default = None
+                if flags & cht_decode._FS_MAXCHECK:
+                    maxvalue = self.__gdata.maxvalue(nickname, logitem)
+                    default = self.__gdata.defaultvalue(nickname, logitem)
+                slot = self.__gdata.slot(nickname, logitem)
+                compiled_fields.append((raw_index, width, logitem, divisor, mask, flags, maxvalue, default, slot))
+            compiled[msgid] = (nickname, first_payload_index, tuple(compiled_fields))
+        return compiled
+
+    def _decode_fieldspec(self, msgtuple, buffer, length):
+        """
+            decoding of message using the compiled field-specification for msgid.
+             returns (nickname, values) or ("", None) if no payload available.
+        """
+        (msgid, offset) = msgtuple
+        (nickname, first_payload_index, fields) = self._compiled_fieldspecs[msgid]
+        # length > first index + crc-byte + break-byte
+        if length <= first_payload_index + 2:
+            return ("", None)
+
+        msg_bytecount = length - first_payload_index - 2
+        debug = self._logging.isEnabledFor(logging.DEBUG)
+        debugstr = "{0:4}_{1:<2}".format(msgid, offset)
+        for (raw_index, width, logitem, divisor, mask, flags, maxvalue, default, slot) in fields:
+            buffer_index = raw_index - offset
+            if buffer_index < first_payload_index or buffer_index >= length - 2 or msg_bytecount < width:
+                continue
+            value = buffer[buffer_index]
+            for x in range(buffer_index + 1, buffer_index + width):
+                value = value * 256 + buffer[x]
+            if mask:
+                value &= mask
+            if flags & cht_decode._FS_BIT:
+                value = 1 if value else 0
+            if divisor != 1:
+                value = float(value) / divisor
+            if flags & cht_decode._FS_DEBUG:
+                if debug:
+                    debugstr += ";{0}:{1}".format(logitem, value)
+                continue
+            if flags & cht_decode._FS_NONZERO and not value > 0:
+                continue
+            if maxvalue != None and value > maxvalue:
+                value = default
+            if slot != None:
+                self.__gdata.update_slot(slot, value)
+            else:
+                self.__gdata.update(nickname, logitem, value)
+
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
+        if debug:
+            self._logging.debug(debugstr)
+        return (nickname, self.__gdata.values(nickname))
+
+    def _decode_hc_fieldspec(self, msgtuple, buffer, length, hc1_msgid):
+        """
+            decoding of heating-circuit message with one msgid for each circuit,
+             'hc1_msgid' is the msgid of heating-circuit 1.
+             see field-specification: 'msgid_fieldspecs[msgid]'
+        """
+        (msgid, offset) = msgtuple
+        #check buffer-length, if to short return with no data
+        if length <= 8:
+            return ("", None)
+        if not self.__DeviceIsModem(buffer[0]):
+            self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
+        hc_number = msgid - hc1_msgid + 1
+        if hc_number > 1:
+            self.__gdata.heatercircuits_amount(hc_number)
+        self.__currentHK_nickname = self._compiled_fieldspecs[msgid][0]
+        return self._decode_fieldspec(msgtuple, buffer, length)
+
+    def _payloadindex(self, msgtuple, length, raw_index, width=1, first_payload_index=4):
+        """
+            returns the buffer-index for 'raw_index' if that field is available
+             in message-payload, else -1.
+        """
+        (msgid, offset) = msgtuple
+        buffer_index = raw_index - offset
+        if buffer_index < first_payload_index or buffer_index >= length - 2 or length - first_payload_index - 2 < width:
+            return -1
+        return buffer_index
+
+    def __update_hexdump(self, nickname, hexdump):
+        """
+            stores the 'hexdump' to logitem 'hexdump', if enabled in configuration.
+        """
+        if self.__hexdump_enabled:
+            self.__gdata.update(nickname, "hexdump", hexdump)
 
     def __IsTempInRange(self, tempvalue, maxvalue=300.0, minvalue=-50.0):
         """
@@ -252,10 +790,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         (msgid, offset) = msgtuple
         nickname = "DT"
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, "req")
-        for buffer_index in range(0, length):
-            temptext += format(buffer[buffer_index], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, "req", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -265,12 +801,10 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "DT"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:bus:".format(msgid, offset)
+        temptext = chexdump(msgtuple, "bus", buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 4
         request = True if (buffer[1] & 0x80) else False
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -283,7 +817,6 @@ class cht_decode(ht_utils.cht_utils):
                 debugstr += ";Bus-Request  Source:{0}(h) to Target:{1}(h)".format(sourcedevicehex, targetdevicehex)
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 if request == False:
                     # read values from buffer and assign them
                     if raw_index == 4 and msg_bytecount >= 1:
@@ -392,9 +925,7 @@ class cht_decode(ht_utils.cht_utils):
                         debugstr += " ;Markenzeichen:{0}".format(strmarke)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -408,10 +939,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "DT"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:sys:".format(msgid, offset)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, "sys", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -422,10 +951,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "DT"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -433,7 +960,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 4 and msg_bytecount >= 7:
                     iyear = int(buffer[buffer_index] + 2000)
@@ -455,9 +981,7 @@ class cht_decode(ht_utils.cht_utils):
                     self.__gdata.update(nickname, "Time", self.__info_zeit)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             return (nickname, self.__gdata.values(nickname))
         else:
@@ -472,17 +996,14 @@ class cht_decode(ht_utils.cht_utils):
         if self._IsRequestCall(buffer):
             return self._RequestCall(msgtuple, buffer, length)
 
-        temptext = "{0:4}_{1:<2}:".format(msgid, offset)
         # check if source-device-adr | 0x80 := buffer[0]
         if (buffer[0] == 0x88):
             nickname = "HG"
-            temptext += nickname + " :"
+            temptext = chexdump(msgtuple, nickname, buffer, length)
         else:
             nickname = "DT"
-            temptext += "sys:"
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+            temptext = chexdump(msgtuple, "sys", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -504,18 +1025,15 @@ class cht_decode(ht_utils.cht_utils):
         nickname = "HG"
         self.__currentHK_nickname = nickname
 
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}:{2}".format(msgid, offset, nickname)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
             raw_index = offset + first_payload_index
             msg_bytecount = length - first_payload_index - 2
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 4 and msg_bytecount >= 1:
                     heater_enable = buffer[buffer_index]
@@ -566,9 +1084,7 @@ class cht_decode(ht_utils.cht_utils):
 
                 raw_index += 1
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -578,252 +1094,34 @@ class cht_decode(ht_utils.cht_utils):
     def msgID_24_Heaterdevice(self, msgtuple, buffer, length):
         """
             decoding of msgID:24 -> Heaterdevice message.
+             see field-specification: 'msgid_fieldspecs[24]'
         """
-        nickname = "HG"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        debugstr = "{0:4}_{1:<2}".format(msgid, offset)
-        first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            i_tvorlauf_soll = 0
-            f_tvorlauf_ist = 0.0
-            i_leistung = 0
-            i_betriebsmodus = 0
-            f_ionisationstrom = 0
-            f_tverbrennungsluft = 0
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 4 and msg_bytecount >= 1:
-                    i_tvorlauf_soll = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Tvorlauf_soll", self.__Check4MaxValue(nickname, "Tvorlauf_soll", i_tvorlauf_soll))
-
-                if raw_index == 5 and msg_bytecount >= 2:
-                    f_tvorlauf_ist = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tvorlauf_ist", self.__Check4MaxValue(nickname, "Tvorlauf_ist", f_tvorlauf_ist))
-
-                if raw_index == 8 and msg_bytecount >= 1:
-                    i_leistung = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Vleistung", i_leistung)
-
-                if raw_index == 9 and msg_bytecount >= 1:
-                    i_betriebsmodus = int(buffer[buffer_index] & 0x03)
-                    self.__gdata.update(nickname, "Vmodus", i_betriebsmodus)
-
-                    # Extract Bitfeld von RAW-Byte 9
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #
-                    #   Bit8: Status Wartungsanforderung    := 0/1
-                    #   Bit7: Status blockierender Fehler   := 0/1
-                    #   Bit6: Status verriegelnder Fehler   := 0/1
-                    #   Bit5: Status Aufheizphase d. HG     := 0/1
-                    #   Bit4: Brennerflamme an              := 0/1
-                    #   Bit3: Status Servicebetrieb         := 0/1
-                    #   Bit2: Warmwasser-Mode deaktiv/aktiv := 0/1
-                    #   Bit1: Heizungs  -Mode deaktiv/aktiv := 0/1
-                    b_brennerflamme = 1 if bool((buffer[buffer_index] & 0x08)) else 0
-                    self.__gdata.update(nickname, "Vbrenner_flamme", b_brennerflamme)
-
-                if raw_index == 10 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Waermeanforderung im Test-modus
-                    #   Bit7: Status Waermeanforderung
-                    #   Bit6: Status WWErkennung
-                    #   Bit5: Status interne Waermeanforderung bei WW
-                    #   Bit4: Status Waermeanforderung fuer WW bei BArt:=Frost
-                    #   Bit3: Status Waermeanforderung bei BArt:=Frost
-                    #   Bit2: Status Waermeanforderung am Schalter
-                    #   Bit1: Status Waermeanforderung im Heizbetrieb
-                    i_statusByte10 = int(buffer[buffer_index])
-                    debugstr += ";Byte10:{0}".format(i_statusByte10)
-
-                if raw_index == 11 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 11
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Zirkulationspumpe Warmwasser
-                    #   Bit7: Status des 3-Wege Ventils 1 := Warmwasser
-                    #   Bit6: Status Heizungspumpe
-                    #   Bit5: Status des Oelvorwaermer (Gas := 0)
-                    #   Bit4: Zuendung des Brenners
-                    #   Bit3: Status des Luefter;
-                    #   Bit2: 2. Brennstufe
-                    #   Bit1: 1. Brennstufe; waehrend Verbrennung 1 mit kurzem Vor- und Nachlauf
-                    b_brenner = 1 if(buffer[buffer_index] & 0x01) else 0
-                    b_heizungspumpe = 1 if(buffer[buffer_index] & 0x20) else 0
-                    b_3WegeVentil = 1 if(buffer[buffer_index] & 0x40) else 0
-                    b_zirkulationspumpe = 1 if(buffer[buffer_index] & 0x80) else 0
-                    self.__gdata.update(nickname, "Vbrenner_motor", b_brenner)
-                    self.__gdata.update(nickname, "Vheizungs_pumpe", b_heizungspumpe)
-                    self.__gdata.update(nickname, "Vspeicher_pumpe", b_3WegeVentil)
-                    self.__gdata.update(nickname, "Vzirkula_pumpe", b_zirkulationspumpe)
-
-                if raw_index == 13 and msg_bytecount >= 2:
-                    # current temperatur on storage-cell temp-sensor1
-                    f_tmischer = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tmischer", self.__Check4MaxValue(nickname, "Tmischer", f_tmischer))
-
-                if raw_index == 15 and msg_bytecount >= 2:
-                    # current temperatur on storage-cell temp-sensor2
-                    f_t2_storagecell = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";T2-buffer:{0}".format(f_t2_storagecell)
-
-                if raw_index == 17 and msg_bytecount >= 2:
-                    f_truecklauf = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Truecklauf", self.__Check4MaxValue(nickname, "Truecklauf", f_truecklauf))
-
-                if raw_index == 19 and msg_bytecount >= 2:
-                    f_ionisationstrom = float(buffer[19] * 256 + buffer[20]) / 10
-                    debugstr += ";I-current:{0}".format(f_ionisationstrom)
-
-                if raw_index == 21 and msg_bytecount >= 1:
-                    i_systempressure = int(buffer[buffer_index])
-                    debugstr += ";pressure:{0}".format(i_systempressure)
-
-                if raw_index == 22 and msg_bytecount >= 2:
-                    displaycode = buffer[buffer_index]*65536 + buffer[buffer_index+1]*256
-                    if displaycode > 0:
-                        self.__gdata.update(nickname, "V_displaycode", displaycode)
-
-                if raw_index == 24 and msg_bytecount >= 2:
-                    causecode = int((buffer[buffer_index] * 256) + buffer[buffer_index + 1])
-                    if causecode > 0:
-                        self.__gdata.update(nickname, "V_causecode", causecode)
-
-                if raw_index == 26 and msg_bytecount >= 1:
-                    i_WWflow = int(buffer[buffer_index])
-                    debugstr += ";WW-flow:{0}".format(i_WWflow)
-
-                if raw_index == 27 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status --
-                    #   Bit7: Status --
-                    #   Bit6: Status Brenner Relais
-                    #   Bit5: Status Zirkulationspumpe
-                    #   Bit4: Status Relais im UM
-                    #   Bit3: Status Waermepumpe
-                    #   Bit2: Status Magnetventil
-                    #   Bit1: Status Speicherladepumpe
-                    i_statusByte27 = int(buffer[buffer_index])
-                    debugstr += ";Byte27:{0}".format(i_statusByte27)
-
-                if raw_index == 28 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Tastensprerre
-                    #   Bit7: test active
-                    #   Bit6: Status heater blocked
-                    #   Bit5: Status burner start
-                    #   Bit4: Status burner enable
-                    #   Bit3: Status burner blocking
-                    #   Bit2: Status Schaltmodul UM
-                    #   Bit1: Status Fuellfunktion
-                    i_statusByte28 = int(buffer[buffer_index])
-                    debugstr += ";Byte28:{0}".format(i_statusByte28)
-
-                if raw_index == 29 and msg_bytecount >= 2:
-                    f_tverbrennungsluft = float(buffer[29] * 256 + buffer[30]) / 10
-                    debugstr += ";TAbgass:{0}".format(f_tverbrennungsluft)
-
-                raw_index += 1
-
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-            self._logging.debug(debugstr)
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
     def msgID_25_Heaterdevice(self, msgtuple, buffer, length):
         """
             decoding of msgID:25 -> Heaterdevice message.
+             see field-specification: 'msgid_fieldspecs[25]'
         """
         nickname = "HG"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            i_betriebtotal_minuten = 0
-            i_betriebheizung_minuten = 0
-            i_brenner_gesamt_ein = 0
-            i_brenner_heizung_ein = 0
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 4 and msg_bytecount >= 2:
-                    if buffer[buffer_index] != 255:
-                        f_tAussen = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    else:
-                        f_tAussen = float(255-buffer[buffer_index + 1]) / (-10)
-                    self.__gdata.update(nickname, "Taussen", self.__Check4MaxValue(nickname, "Taussen", f_tAussen))
-
-                # Rev.: 0.1.7 https://www.mikrocontroller.net/topic/324673#3970615
-                if raw_index == 13 and msg_bytecount >= 1:
-                    i_pumpenleistung = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "V_spare1", i_pumpenleistung)
-
-                if raw_index == 14 and msg_bytecount >= 3:
-                    i_brenner_gesamt_ein = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    self.__gdata.update(nickname, "Cbrenner_gesamt", i_brenner_gesamt_ein)
-
-                if raw_index == 17 and msg_bytecount >= 3:
-                    i_betriebtotal_minuten = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    f_betriebtotal_stunden = float(i_betriebtotal_minuten / 60)
-                    self.__gdata.update(nickname, "Cbetrieb_gesamt", f_betriebtotal_stunden)
-
-                if raw_index == 20 and msg_bytecount >= 3:
-                    i_betriebszeit_2stufe = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    # not yet written to database, only for debug-purposes
-                    debugstr = "{0:4}_{1:<2};betriebszeit_2.Stufe:{2}".format(msgid, offset, i_betriebszeit_2stufe)
-                    self._logging.debug(debugstr)
-
-                if raw_index == 23 and msg_bytecount >= 3:
-                    i_betriebheizung_minuten = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    f_betriebheizung_stunden = float(i_betriebheizung_minuten / 60)
-                    self.__gdata.update(nickname, "Cbetrieb_heizung", f_betriebheizung_stunden)
-
-                if raw_index == 26 and msg_bytecount >= 3:
-                    i_brenner_heizung_ein = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    self.__gdata.update(nickname, "Cbrenner_heizung", i_brenner_heizung_ein)
-
-                if raw_index == 29 and msg_bytecount >= 2:
-                    # TIst an der hydraulischen Weiche
-                    f_THydrWeiche = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    if self.__IsTempInRange(f_THydrWeiche):
-                        self.__gdata.update(nickname, "V_spare2", self.__Check4MaxValue(nickname, "V_spare2", f_THydrWeiche))
-                        # setup flag for Hydraulic Switch available, used in GUI
-                        self.__gdata.IsTempSensor_Hydrlic_Switch(True)
+        buffer_index = self._payloadindex(msgtuple, length, 4, 2)
+        if buffer_index >= 0:
+            if buffer[buffer_index] != 255:
+                f_tAussen = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
+            else:
+                f_tAussen = float(255-buffer[buffer_index + 1]) / (-10)
+            self.__gdata.update(nickname, "Taussen", self.__Check4MaxValue(nickname, "Taussen", f_tAussen))
 
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+        buffer_index = self._payloadindex(msgtuple, length, 29, 2)
+        if buffer_index >= 0:
+            # TIst an der hydraulischen Weiche
+            f_THydrWeiche = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
+            if self.__IsTempInRange(f_THydrWeiche):
+                self.__gdata.update(nickname, "V_spare2", self.__Check4MaxValue(nickname, "V_spare2", f_THydrWeiche))
+                # setup flag for Hydraulic Switch available, used in GUI
+                self.__gdata.IsTempSensor_Hydrlic_Switch(True)
 
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
     def msgID_28_Service(self, msgtuple, buffer, length):
         """
@@ -831,10 +1129,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "DT"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:sys:".format(msgid, offset)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, "sys", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -848,18 +1144,15 @@ class cht_decode(ht_utils.cht_utils):
         (msgid, offset) = msgtuple
         self.__currentHK_nickname = nickname
 
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}:{2}".format(msgid, offset, nickname)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
             raw_index = offset + first_payload_index
             msg_bytecount = length - first_payload_index - 2
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 4 and msg_bytecount >= 2:
                     # TIst an der hydraulischen Weiche
@@ -871,9 +1164,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";T_HydraulicDevice:{0}".format(f_THydrWeiche)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             # not yet written to database, only for debug-purposes
             self._logging.debug(debugstr)
             values = self.__gdata.values(nickname)
@@ -888,11 +1179,9 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HK1"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -901,7 +1190,6 @@ class cht_decode(ht_utils.cht_utils):
 
             pump_running_flag = 0
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 4 and msg_bytecount >= 1:
                     # TSoll hinter der hydraulischen Weiche
@@ -932,9 +1220,7 @@ class cht_decode(ht_utils.cht_utils):
             else:
                 self.__gdata.update(nickname, "V_spare2", 0)
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             # not yet written to database, only for debug-purposes
             self._logging.debug(debugstr)
             values = self.__gdata.values(nickname)
@@ -948,10 +1234,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HG"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -961,52 +1245,18 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HG"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
     def msgID_162_DisplayCause(self, msgtuple, buffer, length):
         """
             decoding of msgID:162 -> Display-code message.
+             see field-specification: 'msgid_fieldspecs[162]'
         """
-        nickname = "HG"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext = temptext + format(buffer[x], "02x") + " "
-        first_payload_index = 4
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            displaycode = 0
-            causecode = 0
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[x], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 4 and msg_bytecount >= 3:
-                    # Auswertung display-code
-                    displaycode = buffer[buffer_index]*65536 + buffer[buffer_index+1]*256 + buffer[buffer_index+2]
-                    self.__gdata.update(nickname, "V_displaycode", displaycode)
-                if raw_index == 7 and msg_bytecount >= 2:
-                    causecode = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
-                    self.__gdata.update(nickname, "V_causecode", causecode)
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-
-            values = self.__gdata.values(nickname)
-            debugstr = "{0:4}_{1:<2};display:{2};cause:{3}".format(msgid, offset, displaycode, causecode)
-            self._logging.debug(debugstr)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_190_DisplayAndCauseCode(self, msgtuple, buffer, length):
         """
@@ -1014,42 +1264,33 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HG"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:".format(msgid, offset)
 
         if(buffer[4] == 0x18 or buffer[4] == 0x20):
             # remote controller FBxy/RC | IPM1/2
             nickname = "HK1"
-            temptext += nickname + ":"
         elif(buffer[4] == 0x21):
             # IPM1/2
             nickname = "HK2"
-            temptext += nickname + ":"
             self.__gdata.heatercircuits_amount(2)
         elif(buffer[4] == 0x22):
             # IPM1/2
             nickname = "HK3"
-            temptext += nickname + ":"
             self.__gdata.heatercircuits_amount(3)
         elif(buffer[4] == 0x23):
             # IPM1/2
             nickname = "HK4"
-            temptext += nickname + ":"
             self.__gdata.heatercircuits_amount(4)
         elif(buffer[4] == 0x10):
             # main controller Fxyz | Cxyz
             nickname = "HK1"
-            temptext += nickname + ":"
         elif(buffer[4] == 0x30):
             # solar controller ISM1/2 | MSxyz ...
             nickname = "SO"
-            temptext += nickname + " :"
         else:
             nickname = "DT"
-            temptext += "???:"
 
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        tag = nickname if nickname != "DT" else "???"
+        self.__update_hexdump(nickname, chexdump(msgtuple, tag, buffer, length))
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -1059,10 +1300,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HG"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:sys:".format(msgid, offset)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, "sys", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -1093,10 +1332,8 @@ class cht_decode(ht_utils.cht_utils):
         if buffer[0] == 0xa0 or buffer[0] == 0xa1 or buffer[0] == 0xa2 or buffer[0] == 0xa3:
             IPM_MM_Modul_Flag = True
 
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1106,7 +1343,6 @@ class cht_decode(ht_utils.cht_utils):
             pump_running_flag = 0
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 if raw_index == 4 and msg_bytecount >= 1:
                     i_tvorlauf_soll = int(buffer[buffer_index])
                     if (IPM_MM_Modul_Flag == False):
@@ -1127,9 +1363,7 @@ class cht_decode(ht_utils.cht_utils):
                 else:
                     self.__gdata.update(nickname, "V_spare2", 0)
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             values = self.__gdata.values(nickname)
             return (nickname, values)
         else:
@@ -1160,11 +1394,9 @@ class cht_decode(ht_utils.cht_utils):
         else:
             nickname = "HK1"
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1172,7 +1404,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 ### Handling for IPM-moduls following:
                 if buffer[0] >= 0xa0 and buffer[0] <= 0xa3:
                     if raw_index == 6 and msg_bytecount >= 1:
@@ -1204,9 +1435,7 @@ class cht_decode(ht_utils.cht_utils):
                         debugstr += ";IPM Soll:{0}%".format(i_IPM_SollVorlaufTemp)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -1236,10 +1465,8 @@ class cht_decode(ht_utils.cht_utils):
             nickname = "HK4"
             self.__gdata.heatercircuits_amount(4)
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1247,7 +1474,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 if raw_index == 20 and msg_bytecount >= 1:
                     i_tempniveau = int(buffer[buffer_index])
                     # values above 3 like 4:='Auto' will be suppressed cause:
@@ -1257,9 +1483,7 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "Vtempera_niveau", i_tempniveau)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -1289,11 +1513,9 @@ class cht_decode(ht_utils.cht_utils):
             nickname = "HK4"
             self.__gdata.heatercircuits_amount(4)
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1301,7 +1523,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
 
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_tempniveau = int(buffer[buffer_index])
@@ -1336,9 +1557,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";TSolarSupport:{0}".format(i_TsolarSupport)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -1352,10 +1571,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "DT"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, "???")
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, "???", buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -1366,12 +1583,10 @@ class cht_decode(ht_utils.cht_utils):
         nickname = "HK1"
         (msgid, offset) = msgtuple
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}:{2}".format(msgid, offset, nickname)
 
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
 
         # length > first index + payload-bytes + crc-byte + break-byte
         #  at least there must be 5 payload-bytes for decoding
@@ -1381,7 +1596,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 #  596_0_0 Measured Temp (2 Bytes)
                 #  596_2_0 Measured Temp high resolution (2 Bytes)
                 #  596_4_0 Valid Flag for temp's
@@ -1395,9 +1609,7 @@ class cht_decode(ht_utils.cht_utils):
 
                         debugstr += ";Tist:{0}".format(f_Ist_HK)
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             if bool(buffer[first_payload_index + 4]) == True:
                 self._logging.debug(debugstr)
             else:
@@ -1424,12 +1636,10 @@ class cht_decode(ht_utils.cht_utils):
         if Sourcedevice == 0xa3:
             nickname = "HK4"
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}:{2}".format(msgid, offset, nickname)
 
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
 
         # length > first index + crc-byte + break-byte and send to 'all' targetdevices
         if (length > first_payload_index + 2):
@@ -1438,16 +1648,13 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_value = int(buffer[buffer_index])
                     debugstr += ";value:{0}".format(i_value)
                 raw_index += 1
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -1462,80 +1669,20 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HG"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
     def msgID_677_680_HeatingCircuit(self, msgtuple, buffer, length):
         """
             decoding of msgID:677 until 680 -> heating circuit (1...4) message.
+             see field-specification: 'msgid_fieldspecs[677...680]'
         """
-        nickname = "HK1"
-        (msgid, offset) = msgtuple
-
-        #check buffer-length, if to short return with no data
-        if length <= 8:
-            return ("", None)
-
-        if not self.__DeviceIsModem(buffer[0]):
-          self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 677:
-          nickname = "HK1"
-        if msgid == 678:
-          nickname = "HK2"
-          self.__gdata.heatercircuits_amount(2)
-        if msgid == 679:
-          nickname = "HK3"
-          self.__gdata.heatercircuits_amount(3)
-        if msgid == 680:
-          nickname = "HK4"
-          self.__gdata.heatercircuits_amount(4)
-
-        self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-
-        first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 2:
-                    f_Ist_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tist_HK", self.__Check4MaxValue(nickname, "Tist_HK", f_Ist_HK))
-
-                if raw_index == 12 and msg_bytecount >= 1:
-                    f_Soll_HK = float(buffer[buffer_index] / 2)
-                    self.__gdata.update(nickname, "Tsoll_HK", f_Soll_HK)
-
-                if raw_index == 17 and msg_bytecount >= 1:
-                    i_tempniveau = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Vtempera_niveau", i_tempniveau)
-
-                if raw_index == 27 and msg_bytecount >= 1:
-                    i_operationstatus = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Voperation_status", i_operationstatus)
-
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+        return self._decode_hc_fieldspec(msgtuple, buffer, length, 677)
 
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_697_704_HeatingCircuit(self, msgtuple, buffer, length):
         """
@@ -1563,11 +1710,9 @@ class cht_decode(ht_utils.cht_utils):
             nickname = "HK4"
             self.__gdata.heatercircuits_amount(4)
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
 
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
 
         # length > first index + crc-byte + break-byte and send to 'all' targetdevices
         if (length > first_payload_index + 2) and Targetdevice == 0:
@@ -1576,7 +1721,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1 and offset in range(1,4):
                     # offset        Temperatur-type
@@ -1589,9 +1733,7 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "Tsoll_HK", f_Soll)
                 raw_index += 1
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             values = self.__gdata.values(nickname)
             return (nickname, values)
         else:
@@ -1623,10 +1765,8 @@ class cht_decode(ht_utils.cht_utils):
             nickname = "HK4"
             self.__gdata.heatercircuits_amount(4)
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1634,7 +1774,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_HK_FlowPump = int(buffer[buffer_index])
@@ -1655,9 +1794,7 @@ class cht_decode(ht_utils.cht_utils):
                     i_tvorlauf_soll = int(buffer[buffer_index])
                     self.__gdata.update(nickname, "V_spare1", self.__Check4MaxValue(nickname, "V_spare1", i_tvorlauf_soll))
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             values = self.__gdata.values(nickname)
             return (nickname, values)
         else:
@@ -1667,112 +1804,20 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:737 until 740 -> heating circuit (1...4) message.
               Message used with Cxyz-controller types.
+             see field-specification: 'msgid_fieldspecs[737...740]'
         """
-        nickname = "HK1"
-        (msgid, offset) = msgtuple
+        return self._decode_hc_fieldspec(msgtuple, buffer, length, 737)
 
-        #check buffer-length, if to short return with no data
-        if length <= 8:
-            return ("", None)
-
-        if not self.__DeviceIsModem(buffer[0]):
-            self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 737:
-            nickname = "HK1"
-        if msgid == 738:
-            nickname = "HK2"
-            self.__gdata.heatercircuits_amount(2)
-        if msgid == 739:
-            nickname = "HK3"
-            self.__gdata.heatercircuits_amount(3)
-        if msgid == 740:
-            nickname = "HK4"
-            self.__gdata.heatercircuits_amount(4)
-        self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        debugstr = "{0:4}_{1:<2}:{2}".format(msgid, offset, nickname)
-        first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 1:
-                    i_req_season = int(buffer[buffer_index])
-                    debugstr += ";season:{0}".format(i_req_season)
-                if raw_index == 7 and msg_bytecount >= 1:
-                    i_supply_temp = int(buffer[buffer_index])
-                    debugstr += ";supply_T:{0}".format(i_supply_temp)
-                if raw_index == 8 and msg_bytecount >= 1:
-                    i_req_power = int(buffer[buffer_index])
-                    debugstr += ";power:{0}".format(i_req_power)
-                if raw_index == 9 and msg_bytecount >= 1:
-                    i_fast_mode = int(buffer[buffer_index])
-                    debugstr += ";fast_mode:{0}".format(i_fast_mode)
-                if raw_index == 10 and msg_bytecount >= 1:
-                    i_prio = int(buffer[buffer_index])
-                    debugstr += ";Prio:{0}".format(i_prio)
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-            self._logging.debug(debugstr)
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_747_754_HeatingCircuit(self, msgtuple, buffer, length):
         """
             decoding of msgID:747 until 750 -> heating circuit (1...4) message.
               Message used with Cxyz-controller types.
               (Frostdanger message)
+             see field-specification: 'msgid_fieldspecs[747...750]'
         """
-        nickname = "HK1"
-        (msgid, offset) = msgtuple
+        return self._decode_hc_fieldspec(msgtuple, buffer, length, 747)
 
-        #check buffer-length, if to short return with no data
-        if length <= 8:
-            return ("", None)
-
-        if not self.__DeviceIsModem(buffer[0]):
-            self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 747:
-            nickname = "HK1"
-        if msgid == 748:
-            nickname = "HK2"
-            self.__gdata.heatercircuits_amount(2)
-        if msgid == 749:
-            nickname = "HK3"
-            self.__gdata.heatercircuits_amount(3)
-        if msgid == 750:
-            nickname = "HK4"
-            self.__gdata.heatercircuits_amount(4)
-        self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length):
-                temptext += format(buffer[buffer_index], "02x")+" "
-
-            self.__gdata.update(nickname, "hexdump", temptext)
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_290_RemoteController_FB10(self, msgtuple, buffer, length):
         """
@@ -1785,7 +1830,7 @@ class cht_decode(ht_utils.cht_utils):
         if length <= 8:
             return ("", None)
 
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         if buffer[0] == 0x98:
             nickname = "HK1"
         elif buffer[0] == 0x99:
@@ -1800,9 +1845,7 @@ class cht_decode(ht_utils.cht_utils):
         else:
             nickname = "HK1"
 
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -1831,10 +1874,8 @@ class cht_decode(ht_utils.cht_utils):
         else:
             nickname = "HK1"
         self.__currentHK_nickname = nickname
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1842,16 +1883,13 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 2:
                     f_Steuer_FB = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     self.__gdata.update(nickname, "Tsteuer_FB", self.__Check4MaxValue(nickname, "Tsteuer_FB", f_Steuer_FB))
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -1885,11 +1923,9 @@ class cht_decode(ht_utils.cht_utils):
         device_address = buffer[0] & 0x7f
         if self.__DeviceIsModem(device_address):
             systempart_tag = "mod"
-        temptext = "{0:4}_{1:<2}:{2:<3}:".format(msgid, offset, systempart_tag)
+        temptext = chexdump(msgtuple, systempart_tag, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -1897,7 +1933,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_bauart_HK = buffer[buffer_index]
@@ -1928,9 +1963,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";Statusoptimier:{0}".format(i_status_optimierung)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -1944,10 +1977,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "HK1"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:<3}:".format(msgid, offset, systempart_tag)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, systempart_tag, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         self._logging.debug(temptext)
 
         values = self.__gdata.values(nickname)
@@ -1957,57 +1988,9 @@ class cht_decode(ht_utils.cht_utils):
     def msgID_188_Hybrid(self, msgtuple, buffer, length):
         """
             decoding of msgID:188 -> hybrid message for mixed heater-systems.
+             see field-specification: 'msgid_fieldspecs[188]'
         """
-        nickname = "HG"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        debugstr = "{0:4}_{1:<2}".format(msgid, offset)
-        first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
-
-                if raw_index == 4 and msg_bytecount >= 2:
-                    Toben_pufferspeicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Toben_puffer:{0}".format(Toben_pufferspeicher)
-
-                if raw_index == 6 and msg_bytecount >= 2:
-                    Tunten_pufferspeicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Tunten_puffer:{0}".format(Tunten_pufferspeicher)
-
-                if raw_index == 8 and msg_bytecount >= 2:
-                    Tvorlauf_verfluessiger = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Tvorlauf_verfluessiger:{0}".format(Tvorlauf_verfluessiger)
-
-                if raw_index == 10 and msg_bytecount >= 2:
-                    Truecklauf_verfluessiger = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Truecklauf_verfluessiger:{0}".format(Truecklauf_verfluessiger)
-
-                if raw_index == 12 and msg_bytecount >= 1:
-                    i_betriebsstatus_wpumpe = int(buffer[buffer_index] & 0x01)
-                    debugstr += ";Betriebsstatus Waermepumpe:{0}".format(i_betriebsstatus_wpumpe)
-
-                if raw_index == 13 and msg_bytecount >= 1:
-                    i_betriebsstatus_verdichter = int(buffer[buffer_index] & 0x02)
-                    debugstr += ";Betriebsstatus Verdichter:{0}".format(i_betriebsstatus_verdichter)
-
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-            self._logging.debug(debugstr)
-
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
 ############################
 #   ### Domestic Hotwater ##
@@ -2016,34 +1999,9 @@ class cht_decode(ht_utils.cht_utils):
     def msgID_27_DomesticHotWater(self, msgtuple, buffer, length):
         """
             decoding of msgID:27 -> Domestic Hot Water(DHW) message.
+             see field-specification: 'msgid_fieldspecs[27]'
         """
-        nickname = "WW"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 4 and msg_bytecount >= 1:
-                    i_Soll = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Tsoll", self.__Check4MaxValue(nickname, "Tsoll", i_Soll))
-                raw_index += 1
-
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
     def msgID_51_DomesticHotWater(self, msgtuple, buffer, length):
         """
@@ -2052,18 +2010,15 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "WW"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         Targetadress = buffer[1]
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
             raw_index = offset + first_payload_index
             msg_bytecount = length - first_payload_index - 2
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 #saving data only if target-adresse is := 0, service-key or modem device-ID
                 if(Targetadress in [0, 0x0a, 0x0b, 0x0d, 0x48]):
                     # read values from buffer and assign them
@@ -2077,9 +2032,7 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "V_spare_1", self.__Check4MaxValue(nickname, "V_spare_1", i_Soll))
                 raw_index += 1
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -2092,10 +2045,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "WW"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2109,7 +2060,6 @@ class cht_decode(ht_utils.cht_utils):
 
             # at least decode the stuff
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 if b_decoding == True:
                     # read values from buffer and assign them
                     if raw_index == 4 and msg_bytecount >= 1:
@@ -2162,9 +2112,7 @@ class cht_decode(ht_utils.cht_utils):
                             self.__gdata.update(nickname, "Cbrenner_ww", i_brennerww_ein)
                     raw_index += 1
 
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             if b_decoding == True:
                 values = self.__gdata.values(nickname)
@@ -2177,40 +2125,9 @@ class cht_decode(ht_utils.cht_utils):
     def msgID_53_DomesticHotWater(self, msgtuple, buffer, length):
         """
             decoding of msgID:53 -> Domestic Hot Water(DHW) message.
+             see field-specification: 'msgid_fieldspecs[53]'
         """
-        nickname = "WW"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        first_payload_index = 4
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 7 and msg_bytecount >= 1:
-                    ############################  this is disabled ######
-                    # cause this message is send by the controller to the heater
-                    # and the heater will respond with message:52.
-                    #  so the value will be set there.
-                    # i_Soll = int(buffer[buffer_index])
-                    # self.__gdata.update(nickname, "Tsoll", self.__Check4MaxValue(nickname, "Tsoll", i_Soll))
-                    ####################################################
-                    pass
-                raw_index += 1
-
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
     def msgID_269_DomesticHotWater_fromIPM(self, msgtuple, buffer, length):
         """
@@ -2220,46 +2137,18 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "WW"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext = temptext + format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
     def msgID_467_468_DomesticHotWater_System1_2(self, msgtuple, buffer, length):
         """
             decoding of msgID:467 until 468 -> Domestic Hot Water(DHW) system 1 and 2 message.
+             see field-specification: 'msgid_fieldspecs[467...468]'
         """
-        nickname = "WW"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            b_WWanfoderung = 0
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 1:
-                    b_WWanfoderung = 1 if(buffer[buffer_index] & 0x08) else 0
-                    debugstr = "{0:4}_{1:<2};WW1-Sofort;Anforderung:{2}".format(msgid, offset, b_WWanfoderung)
-                    self._logging.debug(debugstr)
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_797_DomesticHotWoter(self, msgtuple, buffer, length):
         """
@@ -2267,10 +2156,8 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "WW"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
 
@@ -2283,11 +2170,9 @@ class cht_decode(ht_utils.cht_utils):
         """
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2297,7 +2182,6 @@ class cht_decode(ht_utils.cht_utils):
             f_speicherunten = 0.0
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 2:
                     if buffer[buffer_index] != 255:
@@ -2318,9 +2202,7 @@ class cht_decode(ht_utils.cht_utils):
                         debugstr += " -> not available"
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(temptext) if offset > 10 else self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2335,10 +2217,8 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 6
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2346,14 +2226,11 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                     ## cause: no values decoded yet this loop is disabled currently
                     #for buffer_index in range(first_payload_index, length - 2):
                     #    # read values from buffer and assign them
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(temptext)
 
             values = self.__gdata.values(nickname)
@@ -2364,47 +2241,11 @@ class cht_decode(ht_utils.cht_utils):
     def msgID_868_Solar(self, msgtuple, buffer, length):
         """
             decoding of msgID:868 -> solar message.
+             see field-specification: 'msgid_fieldspecs[868]'
         """
         self.__gdata.IsSolarAvailable(True)
-        nickname = "SO"
-        (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        debugstr = "{0:4}_{1:<2}".format(msgid, offset)
-        first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
-        # length > first index + crc-byte + break-byte
-        if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
-                # read values from buffer and assign them
-                if raw_index == 9:
-                    solar_status = buffer[buffer_index]
-                    i_kollektor_aus = (1 if (solar_status & 0x02) else 0)
-                    i_speicher_voll = (1 if (solar_status & 0x01) else 0)
-                    self.__gdata.update(nickname, "Vkollektor_aus", i_kollektor_aus)
-                    self.__gdata.update(nickname, "Vspeicher_voll", i_speicher_voll)
-                    debugstr += ";collector_deactive:{0}%;storage_full:{1}".format(i_kollektor_aus, i_speicher_voll)
+        return self._decode_fieldspec(msgtuple, buffer, length)
 
-                if raw_index == 15:
-                    pump_power = buffer[buffer_index]
-                    debugstr += ";solarpump power:{0}%".format(pump_power)
-
-                raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
-            self._logging.debug(temptext)
-            self._logging.debug(debugstr)
-
-            values = self.__gdata.values(nickname)
-            return (nickname, values)
-        else:
-            return ("", None)
 
     def msgID_872_Solar(self, msgtuple, buffer, length):
         """
@@ -2420,10 +2261,8 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2431,7 +2270,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 f_ertrag_letztestunde = 0.0
                 if raw_index == 6 and msg_bytecount >= 4:
@@ -2456,9 +2294,7 @@ class cht_decode(ht_utils.cht_utils):
                     self.__gdata.update(nickname, "V_ertrag_sum_calc", f_ertrag_gesamt)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
 
             values = self.__gdata.values(nickname)
             return (nickname, values)
@@ -2472,11 +2308,9 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2484,7 +2318,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 16:
                     statusbyte = buffer[buffer_index]
@@ -2495,9 +2328,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";solarpump status:{0}".format(b_pumpe)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2512,13 +2343,11 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2529,7 +2358,6 @@ class cht_decode(ht_utils.cht_utils):
             f_ertrag_total = 0.0
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 4:
                     # Auswertung der Solarertrag letzte Stunde Bytes: 8-9
@@ -2555,9 +2383,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";gesamt:{0}kWh".format(f_ertrag_total)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2572,11 +2398,9 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2586,7 +2410,6 @@ class cht_decode(ht_utils.cht_utils):
             i_laufzeit_stunden = 0
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 4:
                     # Auswertung der Solarlaufzeiten
@@ -2599,9 +2422,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";Laufzeit minuten:{0}".format(i_laufzeit_minuten)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2616,11 +2437,9 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2636,7 +2455,6 @@ class cht_decode(ht_utils.cht_utils):
             i_kollektor_aus = 0
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x")+" "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     # Optimierungsfaktor f. WW und solarer Unterstuetzung  Byte: 6
@@ -2689,9 +2507,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += ";laufzeit Min.:{0}".format(i_laufzeit_minuten)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2706,11 +2522,9 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
         debugstr = "{0:4}_{1:<2}".format(msgid, offset)
         first_payload_index = 6
-        for x in range(0, first_payload_index):
-            temptext += format(buffer[x], "02x") + " "
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
             # init values
@@ -2718,7 +2532,6 @@ class cht_decode(ht_utils.cht_utils):
             msg_bytecount = length - first_payload_index - 2
 
             for buffer_index in range(first_payload_index, length - 2):
-                temptext += format(buffer[buffer_index], "02x") + " "
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 2:
                     f_t41 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
@@ -2748,9 +2561,7 @@ class cht_decode(ht_utils.cht_utils):
                     debugstr += "; 2.Coll_feld PumpStatus:{0}".format(so_pump_2collector)
 
                 raw_index += 1
-            for buffer_index in range(length - 2, length):
-                temptext += format(buffer[buffer_index], "02x") + " "
-            self.__gdata.update(nickname, "hexdump", temptext)
+            self.__update_hexdump(nickname, temptext)
             self._logging.debug(debugstr)
 
             values = self.__gdata.values(nickname)
@@ -2765,10 +2576,8 @@ class cht_decode(ht_utils.cht_utils):
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
-        temptext = "{0:4}_{1:<2}:{2:3}:".format(msgid, offset, nickname)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, nickname, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         self._logging.debug(temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
@@ -2786,10 +2595,8 @@ class cht_decode(ht_utils.cht_utils):
         else:
             systempart_tag = "???"
 
-        temptext = "{0:4}_{1:<2}:{2:<3}:".format(msgid, offset, systempart_tag)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, systempart_tag, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         self._logging.debug(temptext)
 
         values = self.__gdata.values(nickname)
@@ -2810,10 +2617,8 @@ class cht_decode(ht_utils.cht_utils):
         device_address = buffer[0] & 0x7f
         if self.__DeviceIsModem(device_address):
             systempart_tag = "mod"
-        temptext = "{0:4}_{1:<2}:{2:<3}:".format(msgid, offset, systempart_tag)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, systempart_tag, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         self._logging.debug(temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
@@ -2829,10 +2634,8 @@ class cht_decode(ht_utils.cht_utils):
         device_address = buffer[0] & 0x7f
         if self.__DeviceIsModem(device_address):
             systempart_tag = "mod"
-        temptext = "{0:4}_{1:<2}:{2:<3}:".format(msgid, offset, systempart_tag)
-        for x in range(0, length):
-            temptext += format(buffer[x], "02x") + " "
-        self.__gdata.update(nickname, "hexdump", temptext)
+        temptext = chexdump(msgtuple, systempart_tag, buffer, length)
+        self.__update_hexdump(nickname, temptext)
         self._logging.debug(temptext)
         values = self.__gdata.values(nickname)
         return (nickname, values)
@@ -2866,9 +2669,16 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
     _STATE_TRANSMITTER_MSG_HANDLING = 4  # transmitter-msg handling
     _STATE_PUR_RAWDATA_HANDLING     = 5  # None transmitter-msg handling
 
-    def __init__(self, port, commondata, debug=0, filehandle=None, logger=None):
+    # max. number of bytes read from interface with one read-call
+    _BULKREAD_SIZE = 4096
+    # fill-bytes returned on end of input-file, at least the max. messagesize
+    _EOF_FILLBYTES = b'0' * 40
+
+    def __init__(self, port, commondata, debug=0, filehandle=None, logger=None, bulkread=True):
         """
             initialisation of class
+             'bulkread' := True  -> all available interface-bytes are read with one call.
+                           False -> interface is read byte by byte.
         """
         cht_decode.__init__(self, commondata, logger)
         ht_utils.cht_utils.__init__(self)
@@ -2909,27 +2719,93 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         ## protected variables
         self._run_state = cht_discode._STATE_INIT
         # buffer for read bus-data
-        self._rawdata = []
+        self._rawdata = crawbuffer()
         self._max_messagesize = 40
         self._ht_transceiver_header_found = False
-
-    def __read(self):
-        """
-            reading bytes from interface.
+        # input-buffer for bulk-read interface-data
+        self._inbuffer = b''
+        self._inbuffer_index = 0
+        self._bulkread_size = cht_discode._BULKREAD_SIZE if bulkread else 1
+        # number of fill-byte blocks loaded after end of input-file
+        self._eof_fillblocks = 0
+        # lookup-tables for device-addresses and messageIDs
+        self.__compile_address_tables(commondata)
+        # key (source, msgid, offset) and hash of raw-bytes of the last dispatched message
+        self._last_message = (None, None)
+        # decoder-statistics, also available with: commondata.decode_statistics()
+        self._statistics = cdecode_statistics()
+        commondata.decode_statistics(self._statistics)
+
+    def __compile_address_tables(self, commondata):
+        """
+            compiles the device-address whitelist and the messageID mapping-
+             and blacklist-tables to lookup-tables indexed by device-address (0...127).
+             Configured entries (<decoder> in configuration) replace the defaults.
+        """
+        whitelist = commondata.Decoder_address_whitelist()
+        if whitelist == None:
+            whitelist = self.deviceaddress_white_list
+        msgid_mapping = dict(self.deviceadr_2msgid_mapping)
+        msgid_mapping.update(commondata.Decoder_msgid_mapping())
+        msgid_blacklist = dict(self.deviceadr_2msgid_blacklist)
+        msgid_blacklist.update(commondata.Decoder_msgid_blacklist())
+
+        # address-bitmap: 1 := valid device-address
+        self._address_valid = bytearray(128)
+        for address in whitelist:
+            self._address_valid[address & 0x7f] = 1
+        # None := all messageIDs are valid for that device-address
+        self._msgid_valid = tuple(frozenset(msgid_mapping[address]) if address in msgid_mapping else None
+                                  for address in range(128))
+        self._msgid_blacklisted = tuple(frozenset(msgid_blacklist.get(address, ()))
+                                        for address in range(128))
+
+    def __fill_inbuffer(self):
+        """
+            reading all currently available bytes from interface with one call
+             (at least one byte, blocking until available).
              That interface can be:
              1. File if 'filehandle' is set,
              2. socket- or port-read else.
         """
         if self.filehandle == None:
-            return ord(self.port.read())
+            if isinstance(self.port, ht_proxy_if.cht_socket_client):
+                chunk = self.port.read_available(self._bulkread_size)
+            else:
+                size = min(self.port.in_waiting, self._bulkread_size)
+                chunk = self.port.read(size if size > 0 else 1)
         else:
-            rtn = self.filehandle.read(1)
-# ###########################
-#zs#only 4 test ############
-# #            import time
-# #            time.sleep(0.005)
-# ###########################
-            return ord(rtn) if len(rtn) > 0 else ord('0')
+            chunk = self.filehandle.read(self._bulkread_size)
+            if len(chunk) == 0:
+                self._eof_fillblocks += 1
+                chunk = cht_discode._EOF_FILLBYTES
+        self._inbuffer = chunk
+        self._inbuffer_index = 0
+
+    def IsEndOfFile(self):
+        """
+            returns True if the input-file is read completely and all
+             bytes from file are handled by 'discoder()', else False.
+             The first fill-byte block must have passed the rawbuffer completely.
+        """
+        if self._eof_fillblocks == 1:
+            return self._inbuffer_index >= len(self._inbuffer)
+        return self._eof_fillblocks > 1
+
+    def __readblock(self, size):
+        """
+            returns 'size' bytes from input-buffer, the buffer is
+             refilled from interface as long as required.
+        """
+        block = bytearray()
+        while size > 0:
+            if self._inbuffer_index >= len(self._inbuffer):
+                self.__fill_inbuffer()
+            end_index = min(self._inbuffer_index + size, len(self._inbuffer))
+            block += self._inbuffer[self._inbuffer_index:end_index]
+            size -= end_index - self._inbuffer_index
+            self._inbuffer_index = end_index
+        return block
 
     def __dump_rawbuffer(self, size, offset=0):
         """
@@ -2954,11 +2830,9 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         # source- and target-bytes with valid addresses
         #  remark: target without request (MSB) set
         if (sourcebyte > 0x80 and targetbyte < 0x80):
-            # get the deviceaddress from sourcebyte
-            source_deviceaddress = (0x7f & sourcebyte)
-            # compare this bytes to the whitelist
-            if source_deviceaddress in self.deviceaddress_white_list and \
-                (targetbyte == 0 or targetbyte in self.deviceaddress_white_list):
+            # compare the deviceaddress from sourcebyte and the targetbyte to the whitelist
+            if self._address_valid[0x7f & sourcebyte] and \
+                (targetbyte == 0 or self._address_valid[targetbyte]):
                 rtn = True
         return rtn
 
@@ -2967,18 +2841,9 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
             removing bytes from buffer using predefined unusable sequences.
         """
         for value in self.black_sequence.values():
-            if value[0] in self._rawdata:
-                found_index = self._rawdata.index(value[0])
-                if len(self._rawdata) > found_index + len(value):
-                    search_index = 1
-                    compare_counter = 1
-                    while search_index < len(value):
-                        if value[search_index] == self._rawdata[found_index + search_index]:
-                            compare_counter += 1
-                        search_index += 1
-
-                    if compare_counter == len(value):
-                        del self._rawdata[0:(found_index + compare_counter)]
+            found_index = self._rawdata.find(value)
+            if found_index >= 0:
+                self._rawdata.consume(found_index + len(value))
 
     def _IsValidMessageID(self, deviceaddress, msgid):
         """
@@ -2986,17 +2851,9 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         """
         isvalid = False
         if msgid > 0:
-            adr_found = False
-            deviceaddress = deviceaddress & 0x7f
-            for address in self.deviceadr_2msgid_mapping:
-                if deviceaddress == address:
-                    adr_found = True
-                    if msgid in self.deviceadr_2msgid_mapping[address]:
-                        isvalid = True
-                    break
-            # force this to True for all other unmapped device-addresses
-            if adr_found == False:
-                isvalid = True
+            valid_msgids = self._msgid_valid[deviceaddress & 0x7f]
+            # force this to True for all unmapped device-addresses
+            isvalid = True if (valid_msgids == None or msgid in valid_msgids) else False
         return isvalid
 
     def _IsInBlacklist(self, deviceaddress, msgid):
@@ -3007,47 +2864,73 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         """
         isinlist = False
         if msgid > 0:
-            adr_found = False
-            deviceaddress = deviceaddress & 0x7f
-            for address in self.deviceadr_2msgid_blacklist:
-                if deviceaddress == address:
-                    adr_found = True
-                    if msgid in self.deviceadr_2msgid_blacklist[address]:
-                        isinlist = True
-                    break
-            # force this to False for all other unmapped device-addresses
-            if adr_found == False:
-                isinlist = False
+            # unmapped device-addresses have an empty blacklist
+            isinlist = msgid in self._msgid_blacklisted[deviceaddress & 0x7f]
         return isinlist
 
+    def statistics(self):
+        """
+            returns the decoder-statistics object: 'cdecode_statistics'.
+        """
+        return self._statistics
+
+    def last_message(self):
+        """
+            returns the last dispatched message as tuple: (key, digest)
+             with key := (source-address, msgid, offset) and
+             digest := hash of the raw message-bytes.
+        """
+        return self._last_message
+
+    def _dispatch_message(self, msgtuple, buffer, length):
+        """
+            calls the decode-function for that msgid and counts the decode-time.
+             unknown messages are handled with 'msgID_NN_unknown()',
+             exceptions of the decode-function are logged and counted as decode-error.
+             returns the decoded tuple: (nickname, value).
+        """
+        (msgid, offset) = msgtuple
+        starttime = time.perf_counter()
+        self._last_message = ((buffer[0] & 0x7f, msgid, offset), hash(bytes(buffer[0:length])))
+        decodefunction = self.dispatch.get(msgid)
+        if decodefunction == None:
+            self.msgID_NN_unknown(msgtuple, buffer, length)
+            self._publish("")
+            self._statistics.unknown()
+            return ("", None)
+        try:
+            (nickname, value) = decodefunction(self, msgtuple, buffer, length)
+        except Exception as e:
+            errorstr = "cht_discode._dispatch_message();Error;msgid:{0}_{1};{2}".format(msgid, offset, repr(e))
+            self._logging.error(errorstr)
+            self._publish("")
+            self._statistics.decode_error()
+            return ("", None)
+        if value != None:
+            value = self._publish(nickname)
+        else:
+            self._publish("")
+        self._statistics.frame(msgid, time.perf_counter() - starttime)
+        return (nickname, value)
+
     def _read_rawdata(self):
         """
             reading raw-data to buffer for at least 'max_messagesize'.
         """
-        rtnvalue = 0
         if len(self._rawdata) < self._max_messagesize:
             #read data to rawbuffer
             readcounter = self._max_messagesize - len(self._rawdata)
-            while readcounter > 0:
-                value = self.__read()
-                if value == None:
-                    rtnvalue = -1
-                    break
-                else:
-                    self._rawdata.append(value)
-                readcounter -= 1
-        if not rtnvalue == -1:
-            rtnvalue = len(self._rawdata)
-        return rtnvalue
+            self._rawdata.extend(self.__readblock(readcounter))
+        return len(self._rawdata)
 
-    def _IsTransceiverMsgHeader(self, buffer):
+    def _IsTransceiverMsgHeader(self, buffer, index=0):
         """
-            returns True if ht_transceiver Msg-header available, else False.
+            returns True if ht_transceiver Msg-header available at 'index', else False.
         """
         rtn_flag = False
         try:
              # search for start-tag '#' and 'H','R'
-            if (buffer[0] == 0x23 and buffer[1] == 0x48 and buffer[2] == 0x52):
+            if (buffer[index] == 0x23 and buffer[index + 1] == 0x48 and buffer[index + 2] == 0x52):
                 rtn_flag = True
         except:
             rtn_flag = False
@@ -3066,9 +2949,10 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
                 size -= 5
                 # searching header from byte 0 to max-buffersize - header-size
                 for check_index in range(0, size):
-                    transceiver_found = self._IsTransceiverMsgHeader(self._rawdata[check_index:])
+                    transceiver_found = self._IsTransceiverMsgHeader(self._rawdata, check_index)
                     if (transceiver_found):
-                        del self._rawdata[0:check_index]
+                        self._rawdata.consume(check_index)
+                        self._statistics.resync_bytes(check_index)
                         break
             else:
                 transceiver_found = False
@@ -3220,6 +3104,9 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         1132: cht_decode.msgID_AnyMessage,
     }
     ####################################
+    # default lookup-tables for message-searching, compiled in: '__compile_address_tables()'
+    #  and replaceable with configuration: <decoder>
+    ####################################
     # devices-addresses marked as valid (to support searching)
     #  valid bytes are then: (80 + deviceaddress)hex
     #  remark: address-whitelist is currently limitted to:
@@ -3329,33 +3216,31 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
                         # check current buffer-size and load the rest, if is less then msg-size
                         if len(self._rawdata) < message_size:
                             readcounter = message_size - len(self._rawdata)
-                            while readcounter > 0:
-                                value = self.__read()
-                                self._rawdata.append(value)
-                                readcounter -= 1
-                        # check CRC
-                        crc_ok = self.crc_testen(self._rawdata[5:], payload_size)
-                        # handle message if CRC is ok and terminating 'break' := 0 is available
-                        if ((crc_ok == True) and self._rawdata[message_size - 2] == 0):
-                            (msgid, offset) = self.GetMessageID(self._rawdata[5:])
-                            if (msgid > 0):
-                                try:
-                                    (nickname, value) = self.dispatch[msgid](self, (msgid, offset), self._rawdata[5:], payload_size)
-                                except:
-                                    self.msgID_NN_unknown((msgid, offset), self._rawdata[5:], payload_size)
-                                    nickname = ""
-                                    value = None
-                        else:
-                            nickname = ""
-                            value = None
+                            self._rawdata.extend(self.__readblock(readcounter))
+                        # payload-window without header
+                        with self._rawdata.window(5) as payload:
+                            # check CRC
+                            crc_ok = self.crc_testen(payload, payload_size)
+                            # handle message if CRC is ok and terminating 'break' := 0 is available
+                            if ((crc_ok == True) and self._rawdata[message_size - 2] == 0):
+                                (msgid, offset) = self.GetMessageID(payload)
+                                if (msgid > 0):
+                                    (nickname, value) = self._dispatch_message((msgid, offset), payload, payload_size)
+                                else:
+                                    self._statistics.rejected()
+                            else:
+                                if crc_ok == False:
+                                    self._statistics.crc_failure()
+                                nickname = ""
+                                value = None
 
                     # delete old message from buffer
-                    del self._rawdata[0:message_size]
+                    self._rawdata.consume(message_size)
                     # read new heaterbus-data
                     self._read_rawdata()
                 else:
-                    if len(self._rawdata) > 0:
-                        del self._rawdata[0]
+                    self._rawdata.consume(1)
+                    self._statistics.resync_bytes()
                     self._run_state = cht_discode._STATE_TRANS_HEADER_SEARCH
 
                 if len(nickname) < 2:
@@ -3378,44 +3263,40 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
                 self._read_rawdata()
                 # searching for message with valid source and target-bytes
                 while len(self._rawdata) > 1:
-                    if self._ValidSourceTargetBytes(self._rawdata[0], self._rawdata[1]):
+                    if self._ValidSourceTargetBytes(self._rawdata[0], self._rawdata[1]) or self.IsEndOfFile():
                         break
                     else:
-                        del self._rawdata[0]
+                        self._rawdata.consume(1)
+                        self._statistics.resync_bytes()
                         self._read_rawdata()
 
-                if self._ValidSourceTargetBytes(self._rawdata[0], self._rawdata[1]):
-                    # search for a valid CRC
-                    crc_ok = False
-                    message_size = 0
-                    for crc_checklength in range(6, (len(self._rawdata) - 2)):
-                        crc_ok = self.crc_testen(self._rawdata, crc_checklength)
-                        if crc_ok == True:
-                            # message_size includes that terminating 0 := break-signal
-                            message_size = crc_checklength
-                            break
-
-                    # check valid crc for that current raw-buffer content and the terminating Break-Sign := 0
-                    #  if valid then process message
-                    if crc_ok == True and message_size > 6:
-                        (msgid, offset) = self.GetMessageID(self._rawdata)
-                        if self._IsValidMessageID(self._rawdata[0], msgid) and not self._IsInBlacklist(self._rawdata[0], msgid):
-                            # dispatch data if terminating 0 := break-signal is available
-                            if self._rawdata[message_size - 1] == 0:
-                                try:
-                                    (nickname, value) = self.dispatch[msgid](self, (msgid, offset), self._rawdata, message_size)
-                                except:
-                                    self.msgID_NN_unknown((msgid, offset), self._rawdata, message_size)
-                                    nickname = ""
-                                    value = None
-                        else:
-                            nickname = ""
-                            value = None
-                        del self._rawdata[0:message_size]
-                    else:
-                        del self._rawdata[0]
-                else:
-                    del self._rawdata[0]
+                # number of bytes removed from buffer after handling
+                consume_size = 1
+                with self._rawdata.window() as rawdata:
+                    if self._ValidSourceTargetBytes(rawdata[0], rawdata[1]):
+                        # search for a valid CRC, all possible CRC-positions are checked in one pass
+                        #  message_size includes that terminating 0 := break-signal
+                        message_size = self.crc_search(rawdata, 6, len(rawdata) - 2)
+                        crc_ok = True if message_size > 0 else False
+
+                        # check valid crc for that current raw-buffer content and the terminating Break-Sign := 0
+                        #  if valid then process message
+                        if crc_ok == True and message_size > 6:
+                            (msgid, offset) = self.GetMessageID(rawdata)
+                            if self._IsValidMessageID(rawdata[0], msgid) and not self._IsInBlacklist(rawdata[0], msgid):
+                                # dispatch data if terminating 0 := break-signal is available
+                                if rawdata[message_size - 1] == 0:
+                                    (nickname, value) = self._dispatch_message((msgid, offset), rawdata, message_size)
+                            else:
+                                self._statistics.rejected()
+                                nickname = ""
+                                value = None
+                            consume_size = message_size
+                        elif crc_ok == False:
+                            self._statistics.crc_failure()
+                if consume_size == 1:
+                    self._statistics.resync_bytes()
+                self._rawdata.consume(consume_size)
 
                 if len(nickname) < 2:
                     value = None
@@ -25,18 +25,29 @@
 # Ver:0.1.7.3/ Datum 03.12.2019 Issue:'Deprecated property InterCharTimeout #7'
 #                                port.setInterCharTimeout() removed
 # Ver:0.1.8    2021-02-19 Portnumber changed to 48088
+# Ver:0.1.9    2026-10-17 cht_socket_client.read_available() added for bulk-reads
+#                          server-mode 'asyncio' added (<server_mode>), serial-port(s) and
+#                           all clients are handled with one event-loop: 'casync_proxy_server'
+#                          server-mode 'threads': serial-data are read in chunks and stored once
+#                           in shared ring-buffer 'cfanout_ring', each client-thread sends
+#                           from its own offset (client-txqueues removed)
+#                          slow clients: bounded client-buffers (<client_buffer_bytes>) with
+#                           policy (<slow_client_policy>) and metrics for each client.
+#                          'cfanout_ring': bytes in-flight are never overwritten while sending.
+#                          server-mode 'asyncio': sent_bytes counts only bytes written to transport.
 #################################################################
 
 import socketserver, socket, serial
 import threading, queue
+import asyncio
 import ht_utils, logging
 import xml.etree.ElementTree as ET
 import time, os
 
 __author__  = "junky-zs"
 __status__  = "draft"
-__version__ = "0.1.8"
-__date__    = "2021-02-19"
+__version__ = "0.1.9"
+__date__    = "2026-10-17"
 
 #---------------------------------------------------------------------------
 #   targettype related stuff
@@ -93,6 +104,166 @@ INT_PRIO_MEDIUM = 20
 INT_PRIO_HIGH   = 10
 INT_PRIO_URGEND =  0
 
+#---------------------------------------------------------------------------
+#   server-mode related stuff
+#---------------------------------------------------------------------------
+#
+# server-modes used in config.xml: <server_mode>
+#   threads := one thread for each client and serial-port (default)
+#   asyncio := serial-port(s) and all clients are handled in one event-loop
+#
+SM_THREADS = 'THREADS'
+SM_ASYNCIO = 'ASYNCIO'
+
+#---------------------------------------------------------------------------
+#   slow-client related stuff
+#---------------------------------------------------------------------------
+#
+# policies used in config.xml: <slow_client_policy>, used if a client
+#  is lagging more then <client_buffer_bytes>
+#   drop_oldest := the oldest data are dropped for that client (default)
+#   drop_client := the client is disconnected
+#   pause       := reading of serial-port is paused until the client is
+#                   writable again (all clients are delayed)
+#
+SCP_DROP_OLDEST = 'DROP_OLDEST'
+SCP_DROP_CLIENT = 'DROP_CLIENT'
+SCP_PAUSE       = 'PAUSE'
+
+# default and minimum of <client_buffer_bytes>
+CLIENT_BUFFER_BYTES     = 65536
+CLIENT_BUFFER_BYTES_MIN = 8192
+
+
+class cfanout_ring(object):
+    """class 'cfanout_ring' is a shared ring-buffer for serial-data, written
+       once from 'cportread' and read from all 'csocketsendThread's.
+       Each reader (client) has its own offset (count of bytes written since
+       start), 'read()' returns memoryviews to the ring-buffer without copying.
+       A reader lagging more then the ring-size is handled with 'policy':
+         SCP_DROP_OLDEST := the reader loses the oldest bytes
+         SCP_DROP_CLIENT := 'append()' returns the reader to be disconnected
+         SCP_PAUSE       := 'append()' waits until the reader is ready
+       Bytes returned by 'read()' are in-flight until 'consumed()', if they
+       would be overwritten the ring-buffer is replaced with a copy, so the
+       sending reader keeps the unchanged old buffer.
+    """
+    def __init__(self, size=CLIENT_BUFFER_BYTES, policy=SCP_DROP_OLDEST):
+        self.__size=max(size, CLIENT_BUFFER_BYTES_MIN)
+        self.__policy=policy
+        self.__buffer=bytearray(self.__size)
+        self.__head=0
+        self.__readers={}
+        # start-offset of bytes in-flight (read but not yet consumed) for each reader
+        self.__inflight={}
+        self.__condition=threading.Condition()
+
+    def size(self):
+        return self.__size
+
+    def policy(self):
+        return self.__policy
+
+    def head(self):
+        """returns the offset of the next written byte."""
+        with self.__condition:
+            return self.__head
+
+    def add_reader(self, clientID):
+        """adds reader, starting at the current head."""
+        with self.__condition:
+            self.__readers.update({clientID:self.__head})
+
+    def remove_reader(self, clientID):
+        with self.__condition:
+            self.__readers.pop(clientID, None)
+            self.__inflight.pop(clientID, None)
+            self.__condition.notify_all()
+
+    def lag(self, clientID):
+        """returns the not yet sent bytes of reader or None if reader is removed."""
+        with self.__condition:
+            if not clientID in self.__readers:
+                return None
+            return self.__head - self.__readers[clientID]
+
+    def append(self, data):
+        """writes data to ring-buffer and wakes up all readers.
+            returns the list of readers to be disconnected (SCP_DROP_CLIENT).
+        """
+        length=len(data)
+        dropped=[]
+        if not length:
+            return dropped
+        with self.__condition:
+            if length > self.__size:
+                # only the newest bytes fit into ring-buffer
+                self.__head += length - self.__size
+                data=memoryview(data)[-self.__size:]
+                length=self.__size
+            if self.__policy == SCP_PAUSE:
+                # wait for the slowest reader
+                while len(self.__readers) and self.__head + length - min(self.__readers.values()) > self.__size:
+                    self.__condition.wait(1.0)
+            if len(self.__inflight) and min(self.__inflight.values()) < self.__head + length - self.__size:
+                # in-flight bytes would be overwritten while sending, the senders keep the old buffer
+                #  and are detached from the new one, so it is copied only once for them
+                self.__buffer=bytearray(self.__buffer)
+                self.__inflight.clear()
+            start=self.__head % self.__size
+            first=min(length, self.__size - start)
+            self.__buffer[start:start+first]=data[:first]
+            self.__buffer[:length-first]=data[first:]
+            self.__head += length
+            if self.__policy == SCP_DROP_CLIENT:
+                for (clientID, offset) in list(self.__readers.items()):
+                    if self.__head - offset > self.__size:
+                        self.__readers.pop(clientID)
+                        dropped.append(clientID)
+            self.__condition.notify_all()
+        return dropped
+
+    def read(self, clientID, timeout=None):
+        """waits for data after the readers offset (max. 'timeout' seconds),
+            returns (spans, new_offset, lost_bytes) or None if reader is removed
+              spans     := list of memoryviews (max. 2 at wrap-around)
+              lost_bytes:= bytes overwritten before they are read
+            The new offset has to be set with 'consumed()' after sending the spans,
+            the spans are not changed until then.
+        """
+        with self.__condition:
+            if not clientID in self.__readers:
+                return None
+            offset=self.__readers[clientID]
+            if self.__head == offset:
+                self.__condition.wait(timeout)
+                if not clientID in self.__readers:
+                    return None
+            head=self.__head
+            lost=0
+            if head - offset > self.__size:
+                lost=head - self.__size - offset
+                offset=head - self.__size
+            length=head - offset
+            if not length:
+                return ([], offset, lost)
+            start=offset % self.__size
+            first=min(length, self.__size - start)
+            view=memoryview(self.__buffer)
+            spans=[view[start:start+first]]
+            if length > first:
+                spans.append(view[:length-first])
+            self.__inflight[clientID]=offset
+            return (spans, head, lost)
+
+    def consumed(self, clientID, offset):
+        """sets the new offset of reader after sending the spans of 'read()'."""
+        with self.__condition:
+            self.__inflight.pop(clientID, None)
+            if clientID in self.__readers:
+                self.__readers[clientID]=offset
+                self.__condition.notify_all()
+
 
 class cportread(threading.Thread):
     """class 'cportread' for reading serial asynchronous data from already
@@ -100,6 +271,9 @@ class cportread(threading.Thread):
     """
     global _ClientHandler
 
+    # max. bytes read at once from serial-port
+    _READ_BYTES = 4096
+
     def __init__(self, port, devicetype):
         threading.Thread.__init__(self)
         self.__threadrun=True
@@ -115,18 +289,15 @@ class cportread(threading.Thread):
         while self.__threadrun:
             if _ClientHandler.get_clientcounter() > 0:
                 try:
-                    value=self.__port.read(5)
+                    # wait for one byte, then read all available bytes
+                    value=self.__port.read(max(1, min(self.__port.in_waiting, cportread._READ_BYTES)))
                 except:
                     _ClientHandler.log_critical("cportread();Error;couldn't use/read required port")
                     self.__threadrun=False
-                try:
-                    for clientQueue in _ClientHandler._txqueue.items():
-                        #put comport readvalue in any connected client-queue
-                        #  clientQueue[0]:=Client-ID; clientQueue[1]:=queue
-                        #    put value into queue
-                        clientQueue[1].put(value)
-                except:
-                    _ClientHandler.log_info("Client-ID:{0};cportread();couldn't write to queue".format(clientQueue[0]))
+                    break
+                #put comport readvalue once into ring-buffer used from all clients
+                for clientID in _ClientHandler._ring.append(value):
+                    _ClientHandler.drop_client(clientID)
             else:
                 time.sleep(0.5)
 
@@ -301,52 +472,106 @@ class cht_transceiver_if(threading.Thread):
 
 
 class csocketsendThread(threading.Thread):
-    """class 'csocketsendThread' used for sending data from queue to
-       already connected socket
+    """class 'csocketsendThread' used for sending data from ring-buffer to
+       already connected socket, starting at the current ring-buffer offset.
+       All available data are sent with one 'sendmsg()' (writev).
     """
-    def __init__(self, request, queue):
+    def __init__(self, request, ring, clientID=0, metrics=None):
         threading.Thread.__init__(self)
-        self._queue  =queue
+        self._ring   =ring
         self._request=request
+        self._clientID=clientID
+        self._metrics=metrics if metrics != None else cclient_metrics()
         self.__threadrun=True
         self.__queueprio=INT_PRIO_MEDIUM
+        self._ring.add_reader(clientID)
 
     def __del__(self):
         self.__threadrun=False
-        #clear queue
-        while self._queue.qsize() > 0:
-            self._queue.get_nowait()
 
     def run(self):
-        _ClientHandler.log_info("csocketsendThread(); socket.send thread start")
-        self._tx=None
+        _ClientHandler.log_info("Client-ID:{0}; csocketsendThread(); socket.send thread start".format(self._clientID))
         while self.__threadrun==True:
+            # wait with timeout, so the thread can be stopped
+            read=self._ring.read(self._clientID, timeout=1.0)
+            if read == None:
+                # reader removed from ring-buffer
+                break
+            (spans, offset, lost)=read
+            if lost:
+                self._metrics.drop(lost)
+                _ClientHandler.log_warning("Client-ID:{0}; csocketsendThread(); client too slow, {1} bytes lost".format(self._clientID, lost))
+            if not self.__threadrun or not len(spans):
+                self._ring.consumed(self._clientID, offset)
+                continue
+            length=sum(len(span) for span in spans)
+            self._metrics.lag(length)
             try:
-                # get queue-value in blocking mode
-                self._tx=self._queue.get(True)
-                self._queue.task_done()
-            except:
-                self.__threadrun=False
-                _ClientHandler.log_critical("csocketsendThread();Error on queue.get()")
-                raise
-
-            try:
-                self._request.sendall(bytes(self._tx))
+                self.__send(spans, length)
             except:
+                if not self.__threadrun or self._ring.lag(self._clientID) == None:
+                    # client already removed or disconnected (SCP_DROP_CLIENT)
+                    break
                 self.__threadrun=False
-                _ClientHandler.log_critical("csocketsendThread();Error on socket.send")
+                _ClientHandler.log_critical("Client-ID:{0}; csocketsendThread();Error on socket.send".format(self._clientID))
                 raise
-
-        _ClientHandler.log_info("csocketsendThread(); socket.send thread terminated")
+            finally:
+                for span in spans:
+                    span.release()
+            self._metrics.sent(length)
+            self._ring.consumed(self._clientID, offset)
+
+        _ClientHandler.log_info("Client-ID:{0}; csocketsendThread(); socket.send thread terminated".format(self._clientID))
+
+    def __send(self, spans, length):
+        if hasattr(self._request, 'sendmsg'):
+            sent=self._request.sendmsg(spans)
+            if sent < length:
+                # rest of partial send
+                self._request.sendall(b''.join(spans)[sent:])
+        else:
+            self._request.sendall(b''.join(spans))
 
     def stop(self):
         self.__threadrun=False
+        self._ring.remove_reader(self._clientID)
+
+class cclient_metrics(object):
+    """class 'cclient_metrics' holds the metrics of one client:
+        sent_bytes    := bytes sent to client
+        lag_bytes     := bytes not yet sent to client (last value),
+                          in server-mode 'threads' including overwritten bytes (SCP_DROP_OLDEST)
+        max_lag_bytes := max. of lag_bytes
+        dropped_bytes := bytes dropped for client
+    """
+    def __init__(self):
+        self.sent_bytes=0
+        self.lag_bytes=0
+        self.max_lag_bytes=0
+        self.dropped_bytes=0
+
+    def sent(self, length):
+        self.sent_bytes += length
+
+    def lag(self, length):
+        self.lag_bytes=length
+        self.max_lag_bytes=max(self.max_lag_bytes, length)
+
+    def drop(self, length):
+        self.dropped_bytes += length
+
+    def as_dict(self):
+        return {"sent_bytes"   : self.sent_bytes,
+                "lag_bytes"    : self.lag_bytes,
+                "max_lag_bytes": self.max_lag_bytes,
+                "dropped_bytes": self.dropped_bytes}
 
 class cClientHandling(threading.Thread, ht_utils.clog):
     """class 'cClientHandling' used for add and remove clients to / from queues and
        threads. logging-methods are available for different logging-levels.
     """
-    def __init__(self, logfilepath="./proxy_if.log", tcp_ip_type=TT_SERVER, loglevel=logging.INFO):
+    def __init__(self, logfilepath="./proxy_if.log", tcp_ip_type=TT_SERVER, loglevel=logging.INFO,
+                 client_buffer_bytes=CLIENT_BUFFER_BYTES, slow_client_policy=SCP_DROP_OLDEST):
         threading.Thread.__init__(self)
         # init/setup logging-file
         ht_utils.clog.__init__(self)
@@ -356,8 +581,10 @@ class cClientHandling(threading.Thread, ht_utils.clog):
         self._clientcounter=0
         self._lock=threading.Lock()
         self._rxqueue={}
-        self._txqueue={}
+        self._ring=cfanout_ring(client_buffer_bytes, slow_client_policy)
         self._thread={}
+        self._request={}
+        self._metrics={}
 
     def log_critical(self, logmessage):
         self._logging.critical(logmessage)
@@ -404,9 +631,10 @@ class cClientHandling(threading.Thread, ht_utils.clog):
 
     def add_client(self, clientID, request):
         self._rxqueue.update({clientID:queue.Queue()})
-        self._txqueue.update({clientID:queue.Queue()})
+        self._request.update({clientID:request})
+        metrics=self.add_metrics(clientID)
 
-        txThread=csocketsendThread(request, self._txqueue.get(clientID))
+        txThread=csocketsendThread(request, self._ring, clientID, metrics)
         self._thread.update({clientID:txThread})
         txThread.start()
         self._logger.info("Client-ID:{0}; added; number of clients:{1}".format(clientID, self._clientcounter))
@@ -417,12 +645,50 @@ class cClientHandling(threading.Thread, ht_utils.clog):
         queue=self._rxqueue.pop(clientID)
         while queue.qsize() > 0:
             queue.get_nowait()
-        queue=self._txqueue.pop(clientID)
-        while queue.qsize() > 0:
-            queue.get_nowait()
+        self._request.pop(clientID, None)
+        self.remove_metrics(clientID)
         self._logger.info("Client-ID:{0}; removed; number of clients:{1}".format(clientID, self._clientcounter))
 
 
+    def drop_client(self, clientID):
+        """disconnects a client lagging more then <client_buffer_bytes> (SCP_DROP_CLIENT)."""
+        self.log_warning("Client-ID:{0}; client too slow, disconnected; metrics:{1}".format(clientID, self.client_metrics().get(clientID)))
+        try:
+            self._request[clientID].shutdown(socket.SHUT_RDWR)
+        except:
+            pass
+
+    def add_metrics(self, clientID):
+        metrics=cclient_metrics()
+        self._lock.acquire()
+        self._metrics.update({clientID:metrics})
+        self._lock.release()
+        return metrics
+
+    def remove_metrics(self, clientID):
+        self._lock.acquire()
+        metrics=self._metrics.pop(clientID, None)
+        self._lock.release()
+        if metrics != None:
+            self.log_info("Client-ID:{0}; metrics:{1}".format(clientID, metrics.as_dict()))
+
+    def client_metrics(self):
+        """returns the metrics of all clients: {clientID:{metric:value,...},...}"""
+        self._lock.acquire()
+        clientIDs=list(self._metrics.keys())
+        self._lock.release()
+        # current lag from ring-buffer (server-mode 'threads'), read without holding '_lock'
+        lags=dict((clientID, self._ring.lag(clientID)) for clientID in clientIDs)
+        self._lock.acquire()
+        for (clientID, lag) in lags.items():
+            if lag != None and clientID in self._metrics:
+                # updates also 'max_lag_bytes'
+                self._metrics[clientID].lag(lag)
+        metrics=dict((clientID, value.as_dict()) for (clientID, value) in self._metrics.items())
+        self._lock.release()
+        return metrics
+
+
 class cht_RequestHandler(socketserver.BaseRequestHandler):
     """
     """
@@ -495,6 +761,260 @@ class cht_RequestHandler(socketserver.BaseRequestHandler):
         _ClientHandler.dec_clientcounter()
         _ClientHandler.remove_client(self._myownID)
 
+class casync_client_protocol(asyncio.Protocol):
+    """class 'casync_client_protocol' is used for one connected client
+       in server-mode 'asyncio'. Data to the client are written to the
+       transport, if the transport-buffer is full (backpressure), data
+       are stored in the client-buffer until the client is writable again.
+    """
+    global _ClientHandler
+
+    def __init__(self, server):
+        self.__server=server
+        self.__transport=None
+        self.__registered=False
+        self.__paused=False
+        self.__timeout=None
+        self._pending=bytearray()
+        self._dropped=0
+        self._metrics=None
+        self._myownID=0
+        self._client_devicetype=None
+
+    def connection_made(self, transport):
+        self.__transport=transport
+        _ClientHandler.inc_indexcounter()
+        _ClientHandler.inc_clientcounter()
+        self._myownID=_ClientHandler.get_indexcounter()
+        _ClientHandler.log_info("Client-ID:{0}; {1} connected".format(self._myownID, transport.get_extra_info('peername')))
+        # wait for client registration
+        self.__timeout=asyncio.get_event_loop().call_later(5, self.__registration_timeout)
+
+    def __registration_timeout(self):
+        _ClientHandler.log_critical("Client-ID:{0}; Timeout occured, no devicetype was send".format(self._myownID))
+        self.__transport.close()
+
+    def data_received(self, data):
+        if not self.__registered:
+            self.__timeout.cancel()
+            self._client_devicetype=data[:20].decode('utf-8', 'replace')
+            _ClientHandler.log_info("Client-ID:{0}; register(); got devicetype:{1}".format(self._myownID, self._client_devicetype))
+            #send client-ID to client
+            self.__transport.write(str(self._myownID).encode("utf-8"))
+            self.__registered=True
+            self._metrics=_ClientHandler.add_metrics(self._myownID)
+            self.__server.add_client(self)
+        else:
+            _ClientHandler.log_debug("Client-ID:{0}; recv:{1}".format(self._myownID, data))
+            self.__server.transceiver_write(self._myownID, data)
+
+    def connection_lost(self, exc):
+        if self.__timeout != None:
+            self.__timeout.cancel()
+        _ClientHandler.dec_clientcounter()
+        if self.__registered:
+            self.__server.remove_client(self)
+            _ClientHandler.remove_metrics(self._myownID)
+        _ClientHandler.log_info("Client-ID:{0}; disconnected".format(self._myownID))
+
+    def pause_writing(self):
+        self.__paused=True
+
+    def resume_writing(self):
+        self.__paused=False
+        if self._dropped:
+            _ClientHandler.log_warning("Client-ID:{0}; client too slow, {1} bytes dropped".format(self._myownID, self._dropped))
+            self._dropped=0
+        if len(self._pending) and not self.__transport.is_closing():
+            self.__transport.write(bytes(self._pending))
+            self._metrics.sent(len(self._pending))
+            self._pending.clear()
+        self.__server.resume_reading(self)
+
+    def send(self, data):
+        """writes data to client, the client-buffer is used while the
+            transport is paused. If that buffer is full, the slow-client policy is used.
+        """
+        if self.__transport.is_closing():
+            return
+        if not self.__paused:
+            self.__transport.write(data)
+            self._metrics.sent(len(data))
+            return
+        self._pending.extend(data)
+        self._metrics.lag(len(self._pending) + self.__transport.get_write_buffer_size())
+        if len(self._pending) > self.__server.client_buffer_bytes():
+            policy=self.__server.slow_client_policy()
+            if policy == SCP_DROP_CLIENT:
+                _ClientHandler.log_warning("Client-ID:{0}; client too slow, disconnected; metrics:{1}".format(self._myownID, self._metrics.as_dict()))
+                self._pending.clear()
+                self.__transport.abort()
+            elif policy == SCP_PAUSE:
+                self.__server.pause_reading(self)
+            else:
+                dropped=len(self._pending) - self.__server.client_buffer_bytes()
+                del self._pending[:dropped]
+                if not self._dropped:
+                    _ClientHandler.log_warning("Client-ID:{0}; client too slow, dropping oldest data".format(self._myownID))
+                self._dropped+=dropped
+                self._metrics.drop(dropped)
+
+
+class casync_proxy_server(ht_utils.cht_utils):
+    """class 'casync_proxy_server' handles the serial-port(s) and all
+       connected clients with one asyncio event-loop (server-mode 'asyncio').
+       Received serial data are written to all registered clients.
+       Messages from clients are written in received order to the
+       serial-port used for transmitting (the first one).
+    """
+    global _ClientHandler
+
+    # max. bytes read at once from serial-port
+    _SERIAL_READ_BYTES = 4096
+
+    def __init__(self, ip_address, port_number, transceivers,
+                 client_buffer_bytes=CLIENT_BUFFER_BYTES, slow_client_policy=SCP_DROP_OLDEST):
+        """transceivers := [(serialdevice, baudrate, devicetype),...]
+        """
+        ht_utils.cht_utils.__init__(self)
+        self.__client_buffer_bytes=max(client_buffer_bytes, CLIENT_BUFFER_BYTES_MIN)
+        self.__slow_client_policy=slow_client_policy
+        # clients pausing the serial-port reading (SCP_PAUSE)
+        self.__pausing_clients=set()
+        self.__reading=threading.Event()
+        self.__reading.set()
+        self.__ip_address=ip_address
+        self.__port_number=port_number
+        self.__transceivers=transceivers
+        self.__ports=[]
+        self.__clients=[]
+        self.__loop=None
+        self.__txqueue=None
+
+    def client_buffer_bytes(self):
+        return self.__client_buffer_bytes
+
+    def slow_client_policy(self):
+        return self.__slow_client_policy
+
+    def pause_reading(self, client):
+        """pauses reading from serial-port until client is writable (SCP_PAUSE)."""
+        if not len(self.__pausing_clients):
+            _ClientHandler.log_warning("Client-ID:{0}; client too slow, serial-port reading paused".format(client._myownID))
+            self.__reading.clear()
+            for port in self.__ports:
+                try:
+                    self.__loop.remove_reader(port.fileno())
+                except (AttributeError, NotImplementedError):
+                    pass
+        self.__pausing_clients.add(client)
+
+    def resume_reading(self, client):
+        if not client in self.__pausing_clients:
+            return
+        self.__pausing_clients.discard(client)
+        if not len(self.__pausing_clients):
+            _ClientHandler.log_info("Client-ID:{0}; serial-port reading resumed".format(client._myownID))
+            self.__reading.set()
+            for port in self.__ports:
+                try:
+                    self.__loop.add_reader(port.fileno(), self.__port_read, port)
+                except (AttributeError, NotImplementedError):
+                    pass
+
+    def add_client(self, client):
+        self.__clients.append(client)
+        _ClientHandler.log_info("Client-ID:{0}; added; number of clients:{1}".format(client._myownID, len(self.__clients)))
+
+    def remove_client(self, client):
+        if client in self.__clients:
+            self.__clients.remove(client)
+        self.resume_reading(client)
+        _ClientHandler.log_info("Client-ID:{0}; removed; number of clients:{1}".format(client._myownID, len(self.__clients)))
+
+    def run(self):
+        """runs the event-loop until an error occurs."""
+        asyncio.run(self.__serve())
+
+    async def __serve(self):
+        self.__loop=asyncio.get_running_loop()
+        self.__txqueue=asyncio.Queue()
+        for (serialdevice, baudrate, devicetype) in self.__transceivers:
+            try:
+                # non-blocking reads, the event-loop is waiting for data
+                port=serial.Serial(serialdevice, baudrate, timeout=0)
+            except:
+                _ClientHandler.log_critical("casync_proxy_server();Error;couldn't open requested device:{0}".format(serialdevice))
+                raise
+            self.__ports.append(port)
+            _ClientHandler.log_info("casync_proxy_server();serial-port:{0} opened; devicetype:{1}".format(serialdevice, devicetype))
+            try:
+                self.__loop.add_reader(port.fileno(), self.__port_read, port)
+            except (AttributeError, NotImplementedError):
+                # no file-descriptor available (not posix), read with one thread for that port
+                threading.Thread(target=self.__port_read_thread, args=(port,), daemon=True).start()
+
+        server=await self.__loop.create_server(lambda: casync_client_protocol(self), self.__ip_address, self.__port_number)
+        async with server:
+            await self.__port_write()
+
+    def __fanout(self, data):
+        for client in list(self.__clients):
+            client.send(data)
+
+    def __port_read(self, port):
+        try:
+            data=port.read(casync_proxy_server._SERIAL_READ_BYTES)
+        except:
+            _ClientHandler.log_critical("casync_proxy_server();Error;couldn't use/read required port")
+            self.__loop.remove_reader(port.fileno())
+            return
+        if len(data):
+            self.__fanout(data)
+
+    def __port_read_thread(self, port):
+        port.timeout=None
+        while True:
+            self.__reading.wait()
+            try:
+                data=port.read(max(1, min(port.in_waiting, casync_proxy_server._SERIAL_READ_BYTES)))
+            except:
+                _ClientHandler.log_critical("casync_proxy_server();Error;couldn't use/read required port")
+                break
+            self.__loop.call_soon_threadsafe(self.__fanout, data)
+
+    def transceiver_write(self, ClientID, readbuffer):
+        """client-data are checked for message-structure and put into the
+            transmit-queue:
+            #   tag  length   class   detail  option  databytes.....
+            #    #   <size>   ! or ?   d       o       bytes.....
+            #      size := amount of databytes including class, detail and option but without starttag
+        """
+        if len(readbuffer) > 4 and readbuffer[0] == 0x23:
+            length=max(0, readbuffer[1] - 3)
+            msgbytes=list(readbuffer[5:length+5])
+            self.__txqueue.put_nowait((ClientID, msgbytes, readbuffer[2], readbuffer[3], readbuffer[4]))
+
+    async def __port_write(self):
+        """messages from transmit-queue are written to serial-port with the
+            same timing as used in 'cportwrite'.
+        """
+        while True:
+            (ClientID, data_in, msg_class, detail, option)=await self.__txqueue.get()
+            # header to be send:  <#  ,  msg_class:=! , detail:=S, option, data-length>
+            data=[0x23,msg_class,detail,option,len(data_in)] + data_in
+            data += [self.make_crc(data, len(data))]
+            try:
+                port=self.__ports[0]
+                for value in data:
+                    port.write(bytearray([value]))
+                    port.flushOutput()
+                    _ClientHandler.log_debug("Client-ID:{0};casync_proxy_server();value:{1:02x}".format(ClientID, value))
+                    await asyncio.sleep(0.005)
+            except:
+                _ClientHandler.log_critical("Client-ID:{0};casync_proxy_server();Error;couldn't write to port".format(ClientID))
+
+
 class cproxyconfig():
     """class 'cproxyconfig', is used for proxy_configuration.
        ip_address, port_number etc. comes from the xml-configuration-file.
@@ -571,6 +1091,21 @@ class cproxyconfig():
                     cproxyconfig._configdata[storetarget][0].update({str(item).upper():proxy_part.find(item).text})
                     item='logfilepath'
                     cproxyconfig._configdata[storetarget][0].update({str(item).upper():proxy_part.find(item).text})
+                    item='server_mode'
+                    try:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():proxy_part.find(item).text.strip().upper()})
+                    except:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():SM_THREADS})
+                    item='client_buffer_bytes'
+                    try:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():int(proxy_part.find(item).text)})
+                    except:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():CLIENT_BUFFER_BYTES})
+                    item='slow_client_policy'
+                    try:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():proxy_part.find(item).text.strip().upper()})
+                    except:
+                        cproxyconfig._configdata[storetarget][0].update({str(item).upper():SCP_DROP_OLDEST})
 
                 if self.__configtarget in (TT_SERVER):
                     for ht_transceiver in proxy_part.findall('ht_transceiver_if'):
@@ -628,6 +1163,31 @@ class cproxyconfig():
             rtn=None
         return os.path.normcase(rtn)
 
+    def server_mode(self):
+        try:
+            rtn=cproxyconfig._configdata[self.__devicetype][0].get('SERVER_MODE')
+        except:
+            rtn=None
+        if not rtn in (SM_THREADS, SM_ASYNCIO):
+            rtn=SM_THREADS
+        return rtn
+
+    def client_buffer_bytes(self):
+        try:
+            rtn=int(cproxyconfig._configdata[self.__devicetype][0].get('CLIENT_BUFFER_BYTES'))
+        except:
+            rtn=CLIENT_BUFFER_BYTES
+        return max(rtn, CLIENT_BUFFER_BYTES_MIN)
+
+    def slow_client_policy(self):
+        try:
+            rtn=cproxyconfig._configdata[self.__devicetype][0].get('SLOW_CLIENT_POLICY')
+        except:
+            rtn=None
+        if not rtn in (SCP_DROP_OLDEST, SCP_DROP_CLIENT, SCP_PAUSE):
+            rtn=SCP_DROP_OLDEST
+        return rtn
+
     def transceiver_serialdevice(self, devicename=None):
         try:
             if devicename==None:
@@ -730,7 +1290,9 @@ class cht_proxy_daemon(threading.Thread, cproxyconfig):
 
 
             global _ClientHandler
-            _ClientHandler=cClientHandling(self._logfile, loglevel=loglevel)
+            _ClientHandler=cClientHandling(self._logfile, loglevel=loglevel,
+                                           client_buffer_bytes=self.client_buffer_bytes(),
+                                           slow_client_policy=self.slow_client_policy())
             _ClientHandler.log_info("----------------------")
             _ClientHandler.log_info("cht_proxy_daemon init")
             if not self.servername() == None:
@@ -753,7 +1315,10 @@ class cht_proxy_daemon(threading.Thread, cproxyconfig):
     def run(self):
         _ClientHandler.log_info("cht_proxy_daemon start as proxy-server:'{0}';port:'{1}'".format(self._ip_address, self._port_number))
         _ClientHandler.log_info("logfile:'{0}'".format(self._logfile))
+        _ClientHandler.log_info("client-buffer:{0} bytes; slow-client policy:'{1}'".format(self.client_buffer_bytes(), self.slow_client_policy()))
         _serialdevice_initialised=[]
+        # transceivers used in server-mode 'asyncio'
+        transceivers=[]
 
         for devicename in self.devicename_keys():
             if self.devicename_initflag(devicename) == 0:
@@ -762,14 +1327,17 @@ class cht_proxy_daemon(threading.Thread, cproxyconfig):
                 if not serialdevice in (_serialdevice_initialised):
                     baudrate       = self.transceiver_baudrate(devicename)
                     devicetype     = self.transceiver_devicetype(devicename)
-                    #start transceiver-if for that serial device
-                    transceiver_if = cht_transceiver_if(serialdevice, baudrate, devicetype)
                     #add used serial-device to list
                     _serialdevice_initialised.append(serialdevice)
-                    #add transceiver to list
-                    self._ht_transceiver_if.append(transceiver_if)
-                    transceiver_if.setDaemon(True)
-                    transceiver_if.start()
+                    if self.server_mode() == SM_ASYNCIO:
+                        transceivers.append((serialdevice, baudrate, devicetype))
+                    else:
+                        #start transceiver-if for that serial device
+                        transceiver_if = cht_transceiver_if(serialdevice, baudrate, devicetype)
+                        #add transceiver to list
+                        self._ht_transceiver_if.append(transceiver_if)
+                        transceiver_if.setDaemon(True)
+                        transceiver_if.start()
 
                 #set initialise-flag for devicename
                 self.devicename_initflag(devicename, 1)
@@ -777,8 +1345,14 @@ class cht_proxy_daemon(threading.Thread, cproxyconfig):
 
 
         try:
-            self._server=socketserver.ThreadingTCPServer((self._ip_address, self._port_number), cht_RequestHandler)
-            self._server.serve_forever()
+            if self.server_mode() == SM_ASYNCIO:
+                _ClientHandler.log_info("cht_proxy_daemon server-mode:'asyncio'")
+                self._server=casync_proxy_server(self._ip_address, self._port_number, transceivers,
+                                                 self.client_buffer_bytes(), self.slow_client_policy())
+                self._server.run()
+            else:
+                self._server=socketserver.ThreadingTCPServer((self._ip_address, self._port_number), cht_RequestHandler)
+                self._server.serve_forever()
             _ClientHandler.log_critical("cht_proxy_daemon terminated")
             _ClientHandler.log_info("---------------------------")
             raise
@@ -795,6 +1369,11 @@ class cht_proxy_daemon(threading.Thread, cproxyconfig):
         global _ClientHandler
         return _ClientHandler.get_clientcounter()
 
+    def get_client_metrics(self):
+        """returns the metrics of all clients: {clientID:{metric:value,...},...}"""
+        global _ClientHandler
+        return _ClientHandler.client_metrics()
+
 
 
 #--- class cht_proxy_if end ---#
@@ -927,6 +1506,25 @@ class cht_socket_client(cproxyconfig, ht_utils.clog):
 
         return bytes(read)
 
+    def read_available(self, maxsize=4096):
+        """Read all currently available bytes (max. 'maxsize') from the
+           connected socket. It will block until at least one byte is read.
+        """
+        if self._socket==None:
+            raise RuntimeError("Client-ID:{0}; cht_socket_client.read_available(); error:socket not initialised".format(self._clientID))
+        try:
+            buffer=self._socket.recv(maxsize)
+        except:
+            self._socket.close()
+            self.log_critical("Client-ID:{0}; cht_socket_client.read_available(); error on socket.recv".format(self._clientID))
+            raise
+
+        if not buffer:
+            self._socket.close()
+            self.log_critical("Client-ID:{0}; cht_socket_client.read_available(); peer closed socket".format(self._clientID))
+            raise ConnectionError("Client-ID:{0}; peer closed socket".format(self._clientID))
+        return buffer
+
     def write(self, data):
         """write data to connected socket. It will block
            until all data is written.
@@ -24,6 +24,8 @@
 #                         mqtt_init() now with client_id parameter.
 # Ver:0.4    / 2021-06-14 LWT handling corrected (see issue: #16).
 #                         device_id added for topic-names.
+# Ver:0.5    / 2026-10-17 set_changeset_source() added, only changed values are
+#                          published using the change-set of the heater-data.
 #################################################################
 
 import xml.etree.ElementTree as ET
@@ -527,6 +529,9 @@ class cmqtt_client(cmqtt_baseclass):
         self.__topic_item_context = {}
         self.__old_values_4_nicknames = {}
         self.__printheader = True
+        self.__changes_since = None
+        self.__changeset_nicknames = ()
+        self.__changeset_sequence = 0
 
     def __del__(self):
         """class destructor."""
@@ -607,6 +612,27 @@ class cmqtt_client(cmqtt_baseclass):
         debugstr = " {0:40.40} | {1}".format(topic, value)
         self.cfg_logging().debug(debugstr)
 
+    def set_changeset_source(self, changes_since_fkt, nicknames):
+        """sets the change-set source for the 'nicknames' (see: 'data.cdata.changes_since()').
+            If 'Publish_OnlyNewValues' is enabled, the received data of that
+            nicknames is used as trigger and only the changed values are published.
+        """
+        self.__changes_since = changes_since_fkt
+        self.__changeset_nicknames = tuple(nicknames)
+
+    def __publish_changeset(self, debug):
+        """publishes all values changed since the last call."""
+        (self.__changeset_sequence, changes) = self.__changes_since(self.__changeset_sequence)
+        for (nickname, index, value) in changes:
+            nickname_topic_names = self.__topic_item_context.get(nickname)
+            if nickname_topic_names == None or index >= len(nickname_topic_names):
+                continue
+            topic = nickname_topic_names[index]
+            if self.__Topicrequired(topic):
+                if debug:
+                    self.__print_header()
+                self.publish_data(topic, value)
+
     def set_dataqueues(self, dataqueues_rx_tx):
         # tuple for rx and tx-queue
         (self.__data_queue_rx, self.__data_queue_tx) = dataqueues_rx_tx
@@ -704,13 +730,19 @@ class cmqtt_client(cmqtt_baseclass):
                     #stop processing if both values are none
                     break
 
-                nickname_topic_names = self.__topic_item_context.get(nickname)
-                self.__InitialValues_onetime(nickname, nickname_topic_names)
-
                 # output only for debug-purposes
                 if debug:
                     self.__enable_header_print()
 
+                if self.__changes_since != None and self.cfg_OnlyNewValues() and \
+                        nickname in self.__changeset_nicknames:
+                    self.__publish_changeset(debug)
+                    self.__data_queue_rx.task_done()
+                    continue
+
+                nickname_topic_names = self.__topic_item_context.get(nickname)
+                self.__InitialValues_onetime(nickname, nickname_topic_names)
+
                 # processing data
                 for x in range(0, len(nickname_topic_names)):
                     topic = nickname_topic_names[x]
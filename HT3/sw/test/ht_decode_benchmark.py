@@ -0,0 +1,268 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 Norbert S. <junky-zs@gmx.de>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / Datum 17.10.2026 first release
+#                               synthetic messages: msgID 27 and 866 corrected,
+#                                checked for decode-functions before benchmarking.
+#################################################################
+######
+# Benchmark for the decode-pipeline: 'ht_discode.cht_discode.discoder()'
+#
+#  The decoder is fed with:
+#   1. synthetic bus-streams, generated with valid HT3/EMS-messages
+#      (CRC from ht_utils) and optional noise (garbage-bytes between
+#      messages and corrupted messages), in RAW- and transceiver-mode.
+#      The generator uses a fixed seed, so the streams are the same
+#      for each run.
+#   2. recorded binary bus-logfiles (written from ht_binlogclient.py).
+#
+#  For each stream the results are:
+#   frames/s        := decoded frames per second (best of 'repeat' runs)
+#   cpu_us/frame    := CPU-time per decoded frame in microseconds
+#   KiB_peak        := peak of traced memory (tracemalloc) while decoding
+#   blocks/kframe   := memory-blocks still allocated after decoding
+#                      per 1000 decoded frames
+#
+#  Results can be saved with '-json' and compared to a saved result
+#   with '-compare'. The exitcode is 1 if frames/s are lower than the
+#   saved ones minus 'tolerance' (in percent).
+#
+#  example (running from directory: HT3/sw):
+#   test/ht_decode_benchmark.py -json ./var/bench_old.json
+#   ... modify sources ...
+#   test/ht_decode_benchmark.py -compare ./var/bench_old.json
+#
+################################
+
+import sys
+import os
+import io
+import gc
+import json
+import time
+import random
+import argparse
+import tracemalloc
+sys.path.append('lib')
+import data
+import ht_discode
+import ht_utils
+
+__author__  = "junky-zs"
+__status__  = "draft"
+__version__ = "0.1"
+__date__    = "17.10.2026"
+
+# messages used for synthetic streams:
+#  (source, target, header-bytes, payload-length)
+#  header-bytes are: messagetype and offset (EMS: 0xff, offset, type_high, type_low)
+#  all messages must have a decode-function, checked with 'check_synthetic_messages()'.
+_SYNTHETIC_MESSAGES = (
+    (0x88, 0x00, [0x18, 0x00], 27),                    # msgID 24  heater
+    (0x88, 0x00, [0x19, 0x00], 27),                    # msgID 25  heater
+    (0x88, 0x00, [0x1b, 0x00], 12),                    # msgID 27  domestic hotwater
+    (0x88, 0x00, [0x34, 0x00], 20),                    # msgID 52  domestic hotwater
+    (0x90, 0x00, [0x06, 0x00], 9),                     # msgID 6   date/time
+    (0x90, 0x00, [0xff, 0x00, 0x00, 0x6f], 10),        # msgID 367 EMS heating-circuit
+    (0x90, 0x00, [0x1a, 0x00], 6),                     # msgID 26  heating-circuit
+    (0xb0, 0x00, [0xff, 0x00, 0x02, 0x62], 16),        # msgID 866 solar
+)
+# bus-polling sequence between messages
+_POLLING_BYTES = bytes([0x08, 0x00, 0x89, 0x00])
+
+
+def synthetic_stream(frames, mode, garbage_rate=0.0, corrupt_rate=0.0, seed=1, messages=_SYNTHETIC_MESSAGES):
+    """returns a bytes-stream with 'frames' messages in RAW- or transceiver-mode.
+        'garbage_rate' := probability of random-bytes between messages.
+        'corrupt_rate' := probability of a corrupted byte in message.
+        'messages'     := messages used in turn (default: _SYNTHETIC_MESSAGES).
+    """
+    utils = ht_utils.cht_utils()
+    generator = random.Random(seed)
+    stream = bytearray()
+    for index in range(frames):
+        (source, target, header, payloadlength) = messages[index % len(messages)]
+        message = [source, target] + header + [generator.randint(0, 120) for _ in range(payloadlength)]
+        message += [utils.make_crc(message, len(message)), 0]
+        if generator.random() < corrupt_rate:
+            message[generator.randint(2, len(message) - 3)] ^= 0x55
+        if generator.random() < garbage_rate:
+            stream += bytes(generator.randint(0, 255) for _ in range(generator.randint(1, 20)))
+        if mode == "trx":
+            # ht_transceiver header: #HR(11)h<size><payload-bytes><break-byte>
+            stream += b'#HR\x11' + bytes([len(message)]) + bytes(message) + b'\x00'
+        else:
+            stream += bytes(message) + _POLLING_BYTES
+    return bytes(stream)
+
+
+def check_synthetic_messages(cfgfile, logger):
+    """returns the list of error-texts for synthetic messages not decoded
+        with their own decode-function (unknown, rejected or decode-error).
+    """
+    cfgdata = data.cdata()
+    cfgdata.read_db_config(cfgfile, logger)
+    errors = []
+    for index in range(len(_SYNTHETIC_MESSAGES)):
+        # stream with that message only
+        stream = synthetic_stream(1, "raw", messages=_SYNTHETIC_MESSAGES[index:index + 1])
+        summary = decode_stream(stream, cfgdata, logger).summary()
+        if summary["decoder_frames"] != 1 or summary["decoder_unknown"] or \
+                summary["decoder_rejected"] or summary["decoder_decode_errors"]:
+            errors.append("synthetic message:{0} not decoded; {1}".format(index, summary))
+    return errors
+
+
+def decode_stream(stream, cfgdata, logger):
+    """decodes the complete stream, returns the decoder-statistics."""
+    decoder = ht_discode.cht_discode(None, cfgdata, filehandle=io.BytesIO(stream), logger=logger)
+    while not decoder.IsEndOfFile():
+        decoder.discoder()
+    return decoder.statistics()
+
+
+def benchmark(name, stream, cfgfile, logger, repeat=3):
+    """returns the benchmark-results for that stream as dict."""
+    cfgdata = data.cdata()
+    cfgdata.read_db_config(cfgfile, logger)
+    best_walltime = None
+    best_cputime = None
+    frames = 0
+    for run in range(repeat):
+        gc.collect()
+        walltime = time.perf_counter()
+        cputime = time.process_time()
+        statistics = decode_stream(stream, cfgdata, logger)
+        walltime = time.perf_counter() - walltime
+        cputime = time.process_time() - cputime
+        frames = statistics.summary()["decoder_frames"]
+        if best_walltime == None or walltime < best_walltime:
+            best_walltime = walltime
+        if best_cputime == None or cputime < best_cputime:
+            best_cputime = cputime
+
+    # separate run for memory-tracing, because tracemalloc slows down decoding
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    statistics = decode_stream(stream, cfgdata, logger)
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks
+
+    frames = max(frames, 1)
+    summary = statistics.summary()
+    return {"name": name,
+            "bytes": len(stream),
+            "frames": frames,
+            "crc_failures": summary["decoder_crc_failures"],
+            "resync_bytes": summary["decoder_resync_bytes"],
+            "frames_per_s": round(frames / best_walltime, 1),
+            "cpu_us_per_frame": round(best_cputime * 1000000 / frames, 2),
+            "kib_peak": round(peak / 1024, 1),
+            "blocks_per_kframe": round(blocks * 1000 / frames, 2)}
+
+
+def print_results(results, baseline=None):
+    """prints the results as table, with change to baseline if available."""
+    print("{0:24} {1:>8} {2:>6} {3:>12} {4:>12} {5:>9} {6:>13} {7:>8}".format(
+          "stream", "frames", "crc", "frames/s", "cpu_us/frame", "KiB_peak", "blocks/kframe", "change"))
+    for result in results:
+        change = ""
+        if baseline != None and result["name"] in baseline:
+            old_value = baseline[result["name"]]["frames_per_s"]
+            change = "{0:+.1f}%".format((result["frames_per_s"] - old_value) * 100 / old_value)
+        print("{0:24.24} {1:>8} {2:>6} {3:>12} {4:>12} {5:>9} {6:>13} {7:>8}".format(
+              result["name"], result["frames"], result["crc_failures"], result["frames_per_s"],
+              result["cpu_us_per_frame"], result["kib_peak"], result["blocks_per_kframe"], change))
+
+
+parser = argparse.ArgumentParser(prog='ht_decode_benchmark.py',
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 description='''----------------------------------------------------------
+Benchmark for the decode-pipeline (run from directory: HT3/sw)
+----------------------------------------------------------
+ example: test/ht_decode_benchmark.py -binlog ./var/log/ht_binlog.log -json ./var/bench.json''')
+parser.add_argument('-cfg', '--config', default='./etc/config/4test/HT3_4dispatcher_test.xml', type=str,
+                    help='configuration-file; default = ./etc/config/4test/HT3_4dispatcher_test.xml')
+parser.add_argument('-frames', '--frames', default=20000, type=int,
+                    help='number of messages in synthetic streams; default = 20000')
+parser.add_argument('-garbage', '--garbage', default=0.05, type=float,
+                    help='probability of garbage-bytes between messages in noisy streams; default = 0.05')
+parser.add_argument('-corrupt', '--corrupt', default=0.02, type=float,
+                    help='probability of corrupted messages in noisy streams; default = 0.02')
+parser.add_argument('-binlog', '--binlog', default=[], type=str, action='append',
+                    help='recorded binary bus-logfile, can be used more than once')
+parser.add_argument('-repeat', '--repeat', default=3, type=int,
+                    help='decode-runs for each stream, the best run is used; default = 3')
+parser.add_argument('-json', '--json', default=None, type=str,
+                    help='save results to this json-file')
+parser.add_argument('-compare', '--compare', default=None, type=str,
+                    help='compare results to this saved json-file')
+parser.add_argument('-tolerance', '--tolerance', default=10.0, type=float,
+                    help='allowed frames/s reduction in percent for: -compare; default = 10')
+
+if __name__ == "__main__":
+    arguments = vars(parser.parse_args())
+    log = ht_utils.clog()
+    logger = log.create_logfile("./var/log/ht_decode_benchmark.log", loggertag="ht_decode_benchmark")
+
+    # synthetic streams are only valid, if all messages are decoded
+    errors = check_synthetic_messages(arguments['config'], logger)
+    if len(errors):
+        for error in errors:
+            print(error)
+        sys.exit(2)
+
+    streams = []
+    for mode in ("raw", "trx"):
+        streams.append(("synthetic_{0}".format(mode),
+                        synthetic_stream(arguments['frames'], mode)))
+        streams.append(("synthetic_{0}_noisy".format(mode),
+                        synthetic_stream(arguments['frames'], mode, arguments['garbage'], arguments['corrupt'])))
+    for binlogfile in arguments['binlog']:
+        with open(binlogfile, "rb") as binlog:
+            streams.append((os.path.basename(binlogfile), binlog.read()))
+
+    results = []
+    for (name, stream) in streams:
+        results.append(benchmark(name, stream, arguments['config'], logger, arguments['repeat']))
+
+    baseline = None
+    if arguments['compare'] != None:
+        with open(arguments['compare'], "r") as compare_file:
+            baseline = dict((result["name"], result) for result in json.load(compare_file)["results"])
+    print_results(results, baseline)
+
+    if arguments['json'] != None:
+        with open(arguments['json'], "w") as json_file:
+            json.dump({"version": __version__,
+                       "python": sys.version.split()[0],
+                       "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "results": results}, json_file, indent=2)
+
+    # exitcode 1 on regression
+    if baseline != None:
+        for result in results:
+            if result["name"] in baseline:
+                old_value = baseline[result["name"]]["frames_per_s"]
+                if result["frames_per_s"] < old_value * (1.0 - arguments['tolerance'] / 100.0):
+                    print("regression on stream:{0}".format(result["name"]))
+                    sys.exit(1)